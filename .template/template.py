@@ -2,29 +2,44 @@ from pathlib import Path
 
 import click
 
+from aoc.profiling import Profiler
 
-def read_input(file_path: Path) -> list[list[str]]:
+
+def read_input(file_path: Path) -> list[str]:
     """Read input."""
     with open(file_path) as f:
         return [line for line in f.read().splitlines()]
 
 
-def solution(puzzle_input: list[list[str]]) -> int:
-    """Solution function."""
+def part_1(puzzle_input: list[str]) -> int:
+    """Solution for part 1."""
     # Implement solution logic here
     print(puzzle_input)
     return 0
 
 
+def part_2(puzzle_input: list[str]) -> int:
+    """Solution for part 2."""
+    # Implement solution logic here
+    return 0
+
+
 @click.command()
 # test flag
 @click.option("--test", is_flag=True, help="Run with test input")
-def cli(test: bool) -> None:
+@click.option("--profile", is_flag=True, help="Run under cProfile and print the hot functions")
+@click.option("--memory", is_flag=True, help="Report peak memory and top allocations per phase")
+def cli(test: bool, profile: bool, memory: bool) -> None:
     """CLI function."""
     file_path = Path(__file__).parent / ("example.txt" if test else "input.txt")
-    puzzle_input = read_input(file_path)
-    result = solution(puzzle_input)
-    print(f"Result: {result}")
+    profiler = Profiler(profile=profile, memory=memory)
+    with profiler.phase("parse"):
+        puzzle_input = read_input(file_path)
+    with profiler.phase("part 1"):
+        print(f"Part 1: {part_1(puzzle_input)}")
+    with profiler.phase("part 2"):
+        print(f"Part 2: {part_2(puzzle_input)}")
+    profiler.report()
 
 
 if __name__ == "__main__":
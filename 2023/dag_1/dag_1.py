@@ -1,17 +1,26 @@
-def read_input() -> list[str]:
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from aoc.reader import read_lines
+
+
+def stream_input(file_path: Path) -> Iterator[str]:
+    """Lazily read the lines of the calibration document."""
+    return (line for line in read_lines(file_path) if line)
+
+
+def read_input(file_path: Path) -> list[str]:
     """Read input."""
-    with open("2023/dag_1/input.txt") as f:
-        lines = f.read().splitlines()
-    return lines
+    return list(stream_input(file_path))
 
 
-def part_1(line: str) -> int:
+def calibration_value(line: str) -> int:
     """Combine the first digit and the last digit."""
     digits = [char for char in line if char.isdigit()]
     return int(digits[0] + digits[-1])
 
 
-def part_2(line: str) -> int:
+def calibration_value_with_words(line: str) -> int:
     """Convert spelled out letters into digits."""
     digits = []
     for i, c in enumerate(line):
@@ -23,12 +32,22 @@ def part_2(line: str) -> int:
     return int(digits[0] + digits[-1])
 
 
+def part_1(lines: Iterable[str]) -> int:
+    """Sum the calibration values."""
+    return sum(calibration_value(line) for line in lines)
+
+
+def part_2(lines: Iterable[str]) -> int:
+    """Sum the calibration values, including the spelled out digits."""
+    return sum(calibration_value_with_words(line) for line in lines)
+
+
 def main() -> None:
     """Main function for day 1."""
-    lines = read_input()
+    lines = read_input(Path(__file__).parent / "input.txt")
 
-    print(f"Answer (1): {sum([part_1(line) for line in lines ])}")
-    print(f"Answer (2): {sum([part_2(line) for line in lines ])}")
+    print(f"Answer (1): {part_1(lines)}")
+    print(f"Answer (2): {part_2(lines)}")
 
 
 if __name__ == "__main__":
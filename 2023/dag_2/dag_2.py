@@ -1,7 +1,11 @@
 from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
 
+from aoc.reader import read_records
 
-@dataclass
+
+@dataclass(slots=True)
 class Game:
     """Represents a game."""
 
@@ -43,30 +47,41 @@ class Game:
         return max(self.red_values) * max(self.blue_values) * max(self.green_values)
 
 
-def read_input() -> list[Game]:
+RED_CUBES_AVAILABLE = 12
+GREEN_CUBES_AVAILABLE = 13
+BLUE_CUBES_AVAILABLE = 14
+
+
+def stream_input(file_path: Path) -> Iterator[Game]:
+    """Lazily read the games, one game per line."""
+    return read_records(file_path, Game.parse)
+
+
+def read_input(file_path: Path) -> list[Game]:
     """Read input."""
-    with open("2023/dag_2/input.txt") as f:
-        return [Game.parse(input_str) for input_str in f.read().splitlines()]
+    return list(stream_input(file_path))
 
 
-def main() -> None:
-    """Main function for day 1."""
-    games = read_input()
-
-    red_cubes_available = 12
-    green_cubes_available = 13
-    blue_cubes_available = 14
-    part_1 = sum(
-        [
-            game.game_id
-            for game in games
-            if game.is_possible(red_cubes_available, green_cubes_available, blue_cubes_available)
-        ]
+def part_1(games: Iterable[Game]) -> int:
+    """Sum the ids of the games that are possible with the available cubes."""
+    return sum(
+        game.game_id
+        for game in games
+        if game.is_possible(RED_CUBES_AVAILABLE, GREEN_CUBES_AVAILABLE, BLUE_CUBES_AVAILABLE)
     )
-    print(f"Answer (1): {part_1}")
 
-    part_2 = sum([game.power() for game in games])
-    print(f"Answer (2): {part_2}")
+
+def part_2(games: Iterable[Game]) -> int:
+    """Sum the power of all games."""
+    return sum(game.power() for game in games)
+
+
+def main() -> None:
+    """Main function for day 2."""
+    games = read_input(Path(__file__).parent / "input.txt")
+
+    print(f"Answer (1): {part_1(games)}")
+    print(f"Answer (2): {part_2(games)}")
 
 
 if __name__ == "__main__":
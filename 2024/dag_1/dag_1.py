@@ -1,7 +1,9 @@
+from collections import Counter
+from pathlib import Path
 from typing import Tuple
 
 
-def read_input() -> Tuple[list, list]:
+def read_input(file_path: Path) -> Tuple[list, list]:
     """Read input from the input file.
 
     1. Open file
@@ -9,7 +11,7 @@ def read_input() -> Tuple[list, list]:
     3. Convert to integers
     4. Sort the lists
     """
-    with open("2024/dag_1/input.txt") as f:
+    with open(file_path) as f:
         lines = f.read().splitlines()
 
     list_1, list_2 = [], []
@@ -24,16 +26,19 @@ def read_input() -> Tuple[list, list]:
     return list_1, list_2
 
 
-def part_1(list_1: list, list_2: list) -> int:
+def part_1(lists: Tuple[list, list]) -> int:
     """Calculate the distance between the values in both lists."""
+    list_1, list_2 = lists
     return sum([abs(val_1 - val_2) for val_1, val_2 in zip(list_1, list_2)])
 
 
-def part_2(list_1: list, list_2: list) -> int:
+def part_2(lists: Tuple[list, list]) -> int:
     """Multiply the value in list 1 with the number of occurrences in list 2."""
+    list_1, list_2 = lists
+    counts = Counter(list_2)
     total_distance = 0
     for val_1 in list_1:
-        occurrences = list_2.count(val_1)
+        occurrences = counts[val_1]
         distance = occurrences * val_1
         total_distance += distance
     return total_distance
@@ -41,10 +46,10 @@ def part_2(list_1: list, list_2: list) -> int:
 
 def main() -> None:
     """Main function for day 1."""
-    list_1, list_2 = read_input()
+    lists = read_input(Path(__file__).parent / "input.txt")
 
-    print(f"Total distance (1): {part_1(list_1, list_2)}")
-    print(f"Total distance (2): {part_2(list_1, list_2)}")
+    print(f"Total distance (1): {part_1(lists)}")
+    print(f"Total distance (2): {part_2(lists)}")
 
 
 if __name__ == "__main__":
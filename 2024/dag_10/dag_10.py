@@ -1,75 +1,83 @@
-DIRECTIONS = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+from pathlib import Path
 
+import numpy as np
 
-def read_input() -> list[list[int]]:
+from aoc.grid import ORTHOGONAL, Grid
+
+TOP = 9
+
+
+def read_input(file_path: Path) -> Grid:
     """Read input.
 
     1. Open file
     2. Return the topographic map
     """
-    with open("dag_10/input.txt") as f:
-        lines = [line for line in f.read().splitlines()]
+    return Grid.read(file_path)
 
-        map = []
-        for line in lines:
-            map.append([int(c) for c in line])
-        return map
 
+def heights(topographic_map: Grid) -> tuple[np.ndarray, list[int]]:
+    """Flattened heights of the map with a border that is not part of any trail.
 
-def trace_routes_part_1(topographic_map: list[list[int]], start_x: int, start_y: int) -> int:
-    """Trace routes from a given starting position and count the number of reachable tops."""
-    rows, cols = len(topographic_map), len(topographic_map[0])
-    coordinates_to_visit = [(start_x, start_y)]
-    no_of_trailheads = 0
+    Returns the heights and the flat offsets to the neighbours of a cell.
+    """
+    padded = topographic_map.padded(fill="X")
+    offsets = [padded.flat_offset(dy, dx) for dy, dx in ORTHOGONAL]
+    return padded.cells.ravel().astype(np.int16) - ord("0"), offsets
 
-    while coordinates_to_visit:
-        current_x, current_y = coordinates_to_visit.pop(0)
 
-        if topographic_map[current_x][current_y] == 9:
-            no_of_trailheads += 1
+def count_reachable_tops(topographic_map: Grid) -> int:
+    """Sum the number of reachable tops of all trailheads.
 
-        for dx, dy in DIRECTIONS:
-            new_x, new_y = current_x + dx, current_y + dy
-            if 0 <= new_x < rows and 0 <= new_y < cols and (new_x, new_y) not in coordinates_to_visit:
-                if topographic_map[new_x][new_y] == topographic_map[current_x][current_y] + 1:
-                    coordinates_to_visit.append((new_x, new_y))
+    Walks down from the tops, keeping track of the unique (position, top) pairs for each height.
+    """
+    height, offsets = heights(topographic_map)
+    tops = np.flatnonzero(height == TOP)
+    positions, reachable_tops = tops, tops
 
-    return no_of_trailheads
+    for h in range(TOP - 1, -1, -1):
+        pairs = []
+        for offset in offsets:
+            neighbours = positions + offset
+            valid = height[neighbours] == h
+            pairs.append(neighbours[valid] * height.size + reachable_tops[valid])
+        pairs = np.unique(np.concatenate(pairs))
+        positions, reachable_tops = np.divmod(pairs, height.size)
 
+    return len(positions)
 
-def trace_routes_part_2(topographic_map: list[list[int]], x: int, y: int) -> int:
-    """Trace routes from a given starting position and count the number of valid paths."""
-    if topographic_map[x][y] == 9:
-        return 1
 
-    rows, cols = len(topographic_map), len(topographic_map[0])
-    trail_count = 0
+def count_trails(topographic_map: Grid) -> int:
+    """Sum the number of distinct trails of all trailheads.
 
-    for dx, dy in DIRECTIONS:
-        new_x, new_y = x + dx, y + dy
-        if 0 <= new_x < rows and 0 <= new_y < cols:
-            if topographic_map[new_x][new_y] == topographic_map[x][y] + 1:
-                trail_count += trace_routes_part_2(topographic_map, new_x, new_y)
+    The number of trails from a position is the sum of the number of trails from its neighbours one step higher.
+    """
+    height, offsets = heights(topographic_map)
+    trails = (height == TOP).astype(np.int64)
 
-    return trail_count
+    for h in range(TOP - 1, -1, -1):
+        from_neighbours = sum(np.roll(trails, -offset) for offset in offsets)
+        trails = np.where(height == h, from_neighbours, 0)
 
+    return int(trails.sum())
+
+
+def part_1(topographic_map: Grid) -> int:
+    """Sum the number of reachable tops of all trailheads."""
+    return count_reachable_tops(topographic_map)
 
-def main() -> None:
-    """Main function for day 10."""
-    topographic_map = read_input()
 
-    rows, cols = len(topographic_map), len(topographic_map[0])
+def part_2(topographic_map: Grid) -> int:
+    """Sum the number of distinct trails of all trailheads."""
+    return count_trails(topographic_map)
 
-    score_part_1 = 0
-    score_part_2 = 0
-    for i in range(rows):
-        for j in range(cols):
-            if topographic_map[i][j] == 0:
-                score_part_1 += trace_routes_part_1(topographic_map, i, j)
-                score_part_2 += trace_routes_part_2(topographic_map, i, j)
 
-    print("Total Score (1):", score_part_1)
-    print("Total Score (2):", score_part_2)
+def main() -> None:
+    """Main function for day 10."""
+    topographic_map = read_input(Path(__file__).parent / "input.txt")
+
+    print("Total Score (1):", part_1(topographic_map))
+    print("Total Score (2):", part_2(topographic_map))
 
 
 if __name__ == "__main__":
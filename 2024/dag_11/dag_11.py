@@ -1,13 +1,14 @@
 import math
+from pathlib import Path
 
 
-def read_input() -> dict[int, int]:
+def read_input(file_path: Path) -> dict[int, int]:
     """Read input.
 
     1. Open file
     2. Return a dict with the stone numbers and number of occurrences.
     """
-    with open("dag_11/input.txt") as f:
+    with open(file_path) as f:
         stones = [int(stone) for stone in f.read().split(" ")]
         # Keep track of unique stone numbers and how many times the number occurs
         return {stone: stones.count(stone) for stone in stones}
@@ -46,12 +47,22 @@ def calculate_number_of_stones(stones: dict[int, int], no_of_blinks: int) -> int
     return sum(n for n in stones.values())
 
 
+def part_1(stones: dict[int, int]) -> int:
+    """Number of stones after blinking 25 times."""
+    return calculate_number_of_stones(stones, no_of_blinks=25)
+
+
+def part_2(stones: dict[int, int]) -> int:
+    """Number of stones after blinking 75 times."""
+    return calculate_number_of_stones(stones, no_of_blinks=75)
+
+
 def main() -> None:
     """Main function for day 11."""
-    stones = read_input()
+    stones = read_input(Path(__file__).parent / "input.txt")
 
-    print(f"Number of stones (25): {calculate_number_of_stones(stones, no_of_blinks=25)}")
-    print(f"Number of stones (75): {calculate_number_of_stones(stones, no_of_blinks=75)}")
+    print(f"Number of stones (25): {part_1(stones)}")
+    print(f"Number of stones (75): {part_2(stones)}")
 
 
 if __name__ == "__main__":
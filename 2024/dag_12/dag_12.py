@@ -1,104 +1,95 @@
-from collections import defaultdict
+from pathlib import Path
 
-DIRECTIONS = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+import numpy as np
 
+from aoc.grid import ORTHOGONAL, Grid, shift
 
-def read_input() -> list[list[str]]:
+OUTSIDE = -1
+# The number of label propagation rounds grows with the size of the regions
+EXPECTED_COMPLEXITY = {"part_1": 1.5, "part_2": 1.5}
+
+
+def read_input(file_path: Path) -> Grid:
     """Read input.
 
     1. Open file
     2. Return the garden map
     """
-    with open("dag_12/input.txt") as f:
-        return [list(line) for line in f.read().splitlines()]
+    return Grid.read(file_path)
 
 
 class GardenCalculator:
     """Calculates the cost of a perimeter."""
 
-    def __init__(self, garden_map: list[list[str]]) -> None:
+    def __init__(self, garden_map: Grid) -> None:
         self.garden_map = garden_map
-        self.rows, self.cols = len(garden_map), len(garden_map[0])
-        self.visited = []
-        self.nodes = defaultdict(set)
+        self.rows, self.cols = garden_map.shape
 
     def execute(self) -> tuple[int, int]:
         """Execute the GardenCalculator to calculate prices for both part 1 and part 2."""
-        visited = set()
-
-        total_price_1 = 0
-        total_price_2 = 0
-        for y in range(self.rows):
-            for x in range(self.cols):
-                if (x, y) not in visited:
-                    plant_type = self.garden_map[x][y]
-                    nodes = self.calculate_nodes_for_plant_type(x, y, plant_type, visited)
-                    area = len(nodes)
-                    perimeter = self.calculate_perimeter(nodes)
-                    sides = self.calculate_sides(perimeter)
-                    total_price_1 += area * len(perimeter)
-                    total_price_2 += area * len(sides)
-
-        return total_price_1, total_price_2
-
-    def calculate_nodes_for_plant_type(self, start_x: int, start_y: int, plant_type: str, visited: set) -> set:
-        """Starting from a given point, find all nodes for the same plant type."""
-        coordinates_to_visit = [(start_x, start_y)]
-        nodes_in_area = set(coordinates_to_visit)
-
-        while coordinates_to_visit:
-            x, y = coordinates_to_visit.pop()
-
-            # Skip coordinate if it is part of another area or in the current area
-            if (x, y) in visited:
-                continue
-
-            visited.add((x, y))
-
-            nodes_in_area.add((x, y))
-
-            # Check for same plant types in all directions
-            for dx, dy in DIRECTIONS:
-                nx, ny = x + dx, y + dy
-
-                if self.coordinate_is_valid(nx, ny) and self.garden_map[nx][ny] == plant_type:
-                    coordinates_to_visit.append((nx, ny))
-
-        return nodes_in_area
-
-    def calculate_perimeter(self, nodes: set) -> set:
-        """Calculate the perimeter for the given nodes."""
-        perimeter = []
-        for x, y in nodes:
-            for dx, dy in DIRECTIONS:
-                nx, ny = x + dx, y + dy
-                if self.coordinate_is_valid(nx, ny) is False or (nx, ny) not in nodes:
-                    perimeter.append(((x, y), (nx, ny)))
-        return set(perimeter)
-
-    def calculate_sides(self, perimeter: set) -> set:
-        """Calculate the number of sides given the perimeter of the nodes."""
-        sides = set()
-        for node_1, node_2 in perimeter:
-            for dx, dy in [(0, 1), (1, 0)]:
-                n1x, n1y = node_1
-                n2x, n2y = node_2
-                # If translated perimeter is in existing perimeter, don't add a side
-                if ((n1x + dx, n1y + dy), (n2x + dx, n2y + dy)) in perimeter:
-                    break
-            else:
-                sides.add((node_1, node_2))
-
-        return sides
-
-    def coordinate_is_valid(self, x: int, y: int) -> bool:
-        """Check if a coordinate is valid."""
-        return x >= 0 and y >= 0 and x < self.rows and y < self.cols
+        labels = self.label_regions()
+        _, regions = np.unique(labels, return_inverse=True)
+        regions = regions.reshape(labels.shape)
+        no_of_regions = int(regions.max()) + 1
+
+        area = np.bincount(regions.ravel(), minlength=no_of_regions)
+        perimeter = np.zeros(no_of_regions, dtype=np.int64)
+        sides = np.zeros(no_of_regions, dtype=np.int64)
+        for dy, dx in ORTHOGONAL:
+            fences = self.calculate_fences(regions, dy, dx)
+            perimeter += np.bincount(regions[fences], minlength=no_of_regions)
+            sides += np.bincount(regions[self.calculate_side_ends(regions, fences, dy, dx)], minlength=no_of_regions)
+
+        return int(area @ perimeter), int(area @ sides)
+
+    def label_regions(self) -> np.ndarray:
+        """Label every plot with the lowest flat index of a plot in its region.
+
+        Labels spread to neighbours of the same plant type until nothing changes. After every spread,
+        each plot jumps to the label of the plot its label points to, which shortcuts long regions.
+        """
+        cells = self.garden_map.cells
+        labels = np.arange(cells.size).reshape(cells.shape)
+        same_plant = [(dy, dx, shift(cells, dy, dx) == cells) for dy, dx in ORTHOGONAL]
+
+        while True:
+            spread = labels.copy()
+            for dy, dx, same in same_plant:
+                np.minimum(spread, np.where(same, shift(labels, dy, dx), labels), out=spread)
+
+            flat = spread.ravel()
+            while not np.array_equal(jumped := flat[flat], flat):
+                flat = jumped
+            spread = flat.reshape(cells.shape)
+
+            if np.array_equal(spread, labels):
+                return labels
+            labels = spread
+
+    def calculate_fences(self, regions: np.ndarray, dy: int, dx: int) -> np.ndarray:
+        """Plots with a fence on the side of (dy, dx), because the neighbour is in another region or outside."""
+        return shift(regions, dy, dx, fill=OUTSIDE) != regions
+
+    def calculate_side_ends(self, regions: np.ndarray, fences: np.ndarray, dy: int, dx: int) -> np.ndarray:
+        """Plots where a side ends, because the next plot along the fence does not continue it."""
+        along_y, along_x = (0, 1) if dy else (1, 0)
+        continued = (shift(regions, along_y, along_x, fill=OUTSIDE) == regions) & shift(fences, along_y, along_x)
+        return fences & ~continued
+
+
+def part_1(garden_map: Grid) -> int:
+    """Total price using the perimeter of each region."""
+    return GardenCalculator(garden_map).execute()[0]
+
+
+def part_2(garden_map: Grid) -> int:
+    """Total price using the number of sides of each region."""
+    return GardenCalculator(garden_map).execute()[1]
 
 
 def main() -> None:
     """Main function for day 12."""
-    garden_map = read_input()
+    garden_map = read_input(Path(__file__).parent / "input.txt")
 
     total_price_1, total_price_2 = GardenCalculator(garden_map).execute()
     print(f"Total price (1): {total_price_1}")
@@ -1,12 +1,18 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from pathlib import Path
 
-from sympy import Eq, solve, symbols
+from aoc.lazy import lazy_import
+from aoc.parallel import map_reduce
+from aoc.tokenizer import read_integers
+
+sympy = lazy_import("sympy")
 
 COST_BUTTON_A = 3
 COST_BUTTON_B = 1
+PRIZE_OFFSET_PART_2 = 10000000000000
 
 
-@dataclass
+@dataclass(slots=True)
 class Machine:
     """Represent a Machine."""
 
@@ -15,21 +21,10 @@ class Machine:
     prize: tuple[int, int]
 
     @classmethod
-    def parse(cls, input_str: str) -> "Machine":
-        """Parse the input string to a Machine object."""
-
-        def parse_button_translation(button_str: str) -> tuple[int, int]:
-            btn = button_str.replace("X+", "").replace("Y+", "").strip().split(",")
-            btn = int(btn[0]), int(btn[1])
-            return btn
-
-        lines = [line.split(":")[-1] for line in input_str.splitlines()]
-        button_a, button_b, prize = lines
-        button_a = parse_button_translation(button_a)
-        button_b = parse_button_translation(button_b)
-        prize = prize.replace("X=", "").replace("Y=", "").strip().split(",")
-        prize = int(prize[0]), int(prize[1])
-        return Machine(button_a, button_b, prize)
+    def from_integers(cls, values: list[int]) -> "Machine":
+        """Create a Machine from the X and Y of button A, button B and the prize, in that order."""
+        button_a_x, button_a_y, button_b_x, button_b_y, prize_x, prize_y = values
+        return Machine((button_a_x, button_a_y), (button_b_x, button_b_y), (prize_x, prize_y))
 
     def cheapest_way_to_win(self) -> int:
         """Calculate the cheapest way to win the machine."""
@@ -62,37 +57,42 @@ class Machine:
         btnBX, btnBY = self.button_b
         prizeX, prizeY = self.prize
 
-        x, y = symbols("x y", integer=True)
-        eq1 = Eq(btnAX * x + btnBX * y, prizeX)
-        eq2 = Eq(btnAY * x + btnBY * y, prizeY)
-        return [(sol[x], sol[y]) for sol in solve((eq1, eq2), (x, y), dict=True)]
+        x, y = sympy.symbols("x y", integer=True)
+        eq1 = sympy.Eq(btnAX * x + btnBX * y, prizeX)
+        eq2 = sympy.Eq(btnAY * x + btnBY * y, prizeY)
+        return [(sol[x], sol[y]) for sol in sympy.solve((eq1, eq2), (x, y), dict=True)]
 
 
-def read_input() -> list[Machine]:
+def read_input(file_path: Path) -> list[Machine]:
     """Read input.
 
-    1. Open file
+    1. Read all integers, six per machine
     2. Return a list with Machine objects
     """
-    with open("dag_13/input.txt") as f:
-        return [Machine.parse(machine_str) for machine_str in f.read().split("\n\n")]
+    return [Machine.from_integers(values) for values in read_integers(file_path).reshape(-1, 6).tolist()]
 
 
-def main() -> None:
-    """Main function for day 13."""
-    machines = read_input()
+def part_1(machines: list[Machine]) -> int:
+    """Fewest tokens needed to win all possible prizes."""
+    return map_reduce(Machine.cheapest_way_to_win, machines)
 
-    total_1 = sum([machine.cheapest_way_to_win() for machine in machines])
 
+def part_2(machines: list[Machine]) -> int:
+    """Fewest tokens needed to win all possible prizes, with the prizes moved far away."""
     # Adapt input for part 2
-    for machine in machines:
-        prize_x, prize_y = machine.prize
-        machine.prize = (prize_x + 10000000000000, prize_y + 10000000000000)
+    moved_machines = [
+        replace(machine, prize=(machine.prize[0] + PRIZE_OFFSET_PART_2, machine.prize[1] + PRIZE_OFFSET_PART_2))
+        for machine in machines
+    ]
+    return map_reduce(Machine.cheapest_way_to_win, moved_machines)
 
-    total_2 = sum([machine.cheapest_way_to_win() for machine in machines])
 
-    print(f"Tokens (1): {total_1}")
-    print(f"Tokens (2): {total_2}")
+def main() -> None:
+    """Main function for day 13."""
+    machines = read_input(Path(__file__).parent / "input.txt")
+
+    print(f"Tokens (1): {part_1(machines)}")
+    print(f"Tokens (2): {part_2(machines)}")
 
 
 if __name__ == "__main__":
@@ -1,83 +1,59 @@
 from dataclasses import dataclass
-from enum import Enum
 from math import prod
-from typing import Counter
+from pathlib import Path
+
+import numpy as np
+
+from aoc.records import Table
+from aoc.tokenizer import read_integers
+
+PRINT = False
 
 ROWS = 103
 COLS = 101
 CENTER_ROW = ROWS // 2
 CENTER_COL = COLS // 2
+# Size of the grid as (x, y), to wrap the positions of the robots
+GRID_SIZE = np.array([COLS, ROWS])
 
 
-class Quadrant(Enum):
-    """Represents a quadrant."""
-
-    TOP_LEFT = 1
-    TOP_RIGHT = 2
-    BOTTOM_LEFT = 3
-    BOTTOM_RIGHT = 4
-
-
-@dataclass
+@dataclass(slots=True)
 class Robot:
-    """Represents a Robot."""
+    """Represents a Robot, the record type of the table of robots."""
 
     position: tuple
     velocity: tuple
 
-    @classmethod
-    def parse(cls, input_str: str) -> "Robot":
-        """Parse a string to a Robot object."""
-        position, velocity = input_str.split()
-        position = tuple([int(pos) for pos in position.lstrip("p=").split(",")])
-        velocity = tuple([int(vel) for vel in velocity.lstrip("v=").split(",")])
-        return Robot(position=position, velocity=velocity)
-
-    def step(self) -> None:
-        """Take a step from the current position to the new position based on the given velocity.
-
-        For example with a grid of (11, 7) starting at (0,0):
-
-        Robot p=2,4 v=2,-3
-        Initial state: 2,4
-        After 1 second: 4, 1
-        After 2 seconds: 6, 5
-        After 3 seconds: 8, 2
-        After 4 seconds: 10, 6
-        After 5 seconds: 1, 3
-        """
-        new_x = (self.position[0] + self.velocity[0]) % COLS
-        new_y = (self.position[1] + self.velocity[1]) % ROWS
-        self.position = (new_x, new_y)
-
-    def get_quadrant(self) -> Quadrant | None:
-        """Get quadrant using the current position."""
-        x, y = self.position
-        if x < CENTER_COL:
-            if y < CENTER_ROW:
-                return Quadrant.TOP_LEFT
-            if y > CENTER_ROW:
-                return Quadrant.BOTTOM_LEFT
-        if x > CENTER_COL:
-            if y < CENTER_ROW:
-                return Quadrant.TOP_RIGHT
-            if y > CENTER_ROW:
-                return Quadrant.BOTTOM_RIGHT
-
-
-def read_input() -> list[Robot]:
+
+def read_input(file_path: Path) -> Table[Robot]:
     """Read input.
 
-    1. Open file
-    2. Return a list with Machine objects
+    1. Read all integers, four per robot
+    2. Return a table with the positions and velocities of the robots as columns
     """
-    with open("dag_14/input.txt") as f:
-        return [Robot.parse(input_str) for input_str in f.readlines()]
+    values = read_integers(file_path).reshape(-1, 4).astype(np.int64)
+    return Table.from_arrays(Robot, {"position": values[:, :2], "velocity": values[:, 2:]})
+
 
+def step(positions: np.ndarray, velocities: np.ndarray, no_of_steps: int = 1) -> np.ndarray:
+    """Take steps from the current positions to the new positions based on the given velocities.
 
-def print_state(robots: list[Robot]) -> None:
+    For example with a grid of (11, 7) starting at (0,0):
+
+    Robot p=2,4 v=2,-3
+    Initial state: 2,4
+    After 1 second: 4, 1
+    After 2 seconds: 6, 5
+    After 3 seconds: 8, 2
+    After 4 seconds: 10, 6
+    After 5 seconds: 1, 3
+    """
+    return (positions + no_of_steps * velocities) % GRID_SIZE
+
+
+def print_state(positions: np.ndarray) -> None:
     """Print the state of the current robots."""
-    robot_positions = [r.position for r in robots]
+    robot_positions = list(map(tuple, positions.tolist()))
     for y in range(ROWS):
         for x in range(COLS):
             no_of_robots = robot_positions.count((x, y))
@@ -85,22 +61,21 @@ def print_state(robots: list[Robot]) -> None:
         print()
 
 
-def calculate_safety_factor(robots: list[Robot], no_of_steps: int) -> int:
-    """Calculate the safety factor."""
-    for _ in range(no_of_steps):
-        for r in robots:
-            r.step()
-
-    quadrants = [r.get_quadrant() for r in robots]
+def calculate_safety_factor(robots: Table[Robot], no_of_steps: int) -> int:
+    """Calculate the safety factor, the product of the number of robots per quadrant.
 
-    counts = Counter(filter(None, quadrants))
-
-    return prod(counts.values())
+    Robots on the middle row or column are not in any quadrant.
+    """
+    x, y = step(robots.column("position"), robots.column("velocity"), no_of_steps).T
+    left, right = x < CENTER_COL, x > CENTER_COL
+    top, bottom = y < CENTER_ROW, y > CENTER_ROW
+    counts = [int((horizontal & vertical).sum()) for horizontal in (left, right) for vertical in (top, bottom)]
+    return prod(filter(None, counts))
 
 
-def count_neighbors(robots: list[Robot]) -> int:
+def count_neighbors(positions: np.ndarray) -> int:
     """Count the number of neighbors for each point."""
-    points = [r.position for r in robots]
+    points = list(map(tuple, positions.tolist()))
     points_set = set(points)
 
     directions = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
@@ -112,32 +87,41 @@ def count_neighbors(robots: list[Robot]) -> int:
     return total
 
 
-def find_easter_egg(robots: list[Robot]) -> int:
+def find_easter_egg(robots: Table[Robot]) -> int:
     """Find easter egg in the outputs."""
     max_loop = 10000
     current_highest = 0
     current_highest_index = 0
+    positions, velocities = robots.column("position"), robots.column("velocity")
     for i in range(max_loop):
-        for r in robots:
-            r.step()
+        positions = step(positions, velocities)
 
-        neighbors = count_neighbors(robots)
+        neighbors = count_neighbors(positions)
         if neighbors > current_highest:
             current_highest = neighbors
             current_highest_index = i + 1
-            if neighbors > 500:
+            if PRINT and neighbors > 500:
                 print(f"Step {i + 1}: {neighbors} ({current_highest=})")
-                print_state(robots)
+                print_state(positions)
 
     return current_highest_index
 
 
+def part_1(robots: Table[Robot]) -> int:
+    """Safety factor after 100 seconds."""
+    return calculate_safety_factor(robots, no_of_steps=100)
+
+
+def part_2(robots: Table[Robot]) -> int:
+    """Number of seconds until the robots display the easter egg."""
+    return find_easter_egg(robots)
+
+
 def main() -> None:
     """Main function for day 14."""
-    robots = read_input()
-    print("Safety factor (1):", calculate_safety_factor(robots, no_of_steps=100))
-    robots = read_input()
-    print("Easter egg (2):", find_easter_egg(robots))
+    robots = read_input(Path(__file__).parent / "input.txt")
+    print("Safety factor (1):", part_1(robots))
+    print("Easter egg (2):", part_2(robots))
 
 
 if __name__ == "__main__":
@@ -1,101 +1,116 @@
+from pathlib import Path
+
+import numpy as np
+
+from aoc.grid import Grid
+
 DIRECTIONS = {"^": (-1, 0), "v": (1, 0), ">": (0, 1), "<": (0, -1)}
+WIDENED_CELLS = {"#": "##", "O": "[]", ".": "..", "@": "@."}
 
+WALL, BOX, BOX_LEFT, BOX_RIGHT, EMPTY = (ord(c) for c in "#O[].")
 
-def read_input(part_2: bool = False) -> tuple[list[list[str]], list[str]]:
+
+def read_input(file_path: Path) -> tuple[Grid, list[str]]:
     """Read input.
 
     1. Open file
     2. Return a tuple with the grid and instructions
     """
-    with open("dag_15/input.txt") as f:
+    with open(file_path) as f:
         grid, instructions = f.read().split("\n\n")
-        if part_2:
-            grid = grid.replace("#", "##").replace("O", "[]").replace(".", "..").replace("@", "@.")
-        grid = [list(s) for s in grid.splitlines()]
         instructions = list(instructions.replace("\n", ""))
-        return grid, instructions
+        return Grid.from_lines(grid.splitlines()), instructions
+
+
+def widen_grid(grid: Grid) -> Grid:
+    """Make everything except the robot twice as wide."""
+    widened = np.zeros((256, 2), dtype=np.uint8)
+    for cell, wide in WIDENED_CELLS.items():
+        widened[ord(cell)] = [ord(c) for c in wide]
+    return Grid(widened[grid.cells].reshape(grid.rows, grid.cols * 2))
 
 
-def locate_robot(grid: list[list[str]]) -> tuple[int, int]:
+def locate_robot(grid: Grid) -> tuple[int, int]:
     """Finds the robot's initial position in the grid."""
-    for row_idx, row in enumerate(grid):
-        for col_idx, cell in enumerate(row):
-            if cell == "@":
-                return row_idx, col_idx
-    raise ValueError("No robot found in grid!")
+    try:
+        return grid.find("@")
+    except ValueError:
+        raise ValueError("No robot found in grid!")
 
 
-def check_move_effect(
-    grid: list[list[str]], start_x: int, start_y: int, dx: int, dy: int
-) -> list[tuple[int, int]] | None:
+def check_move_effect(cells: np.ndarray, start_x: int, start_y: int, dx: int, dy: int) -> list[tuple[int, int]] | None:
     """Collects all cells affected by the robot's move based on the direction."""
     queue = [(start_x, start_y)]
     visited = set(queue)
 
     for x, y in queue:
         next_x, next_y = x + dx, y + dy
-        if grid[next_x][next_y] in "O[]":
+        cell = cells[next_x, next_y]
+        if cell in (BOX, BOX_LEFT, BOX_RIGHT):
             if (next_x, next_y) not in visited:
                 queue.append((next_x, next_y))
                 visited.add((next_x, next_y))
 
-            if grid[next_x][next_y] == "[" and (next_x, next_y + 1) not in visited:
+            if cell == BOX_LEFT and (next_x, next_y + 1) not in visited:
                 queue.append((next_x, next_y + 1))
                 visited.add((next_x, next_y + 1))
 
-            if grid[next_x][next_y] == "]" and (next_x, next_y - 1) not in visited:
+            if cell == BOX_RIGHT and (next_x, next_y - 1) not in visited:
                 queue.append((next_x, next_y - 1))
                 visited.add((next_x, next_y - 1))
-        elif grid[next_x][next_y] == "#":
+        elif cell == WALL:
             return None
 
     return queue
 
 
-def apply_move(grid: list[list[str]], targets: list[tuple[int, int]], dx: int, dy: int) -> list[list[str]]:
-    """Applies the robot's move to the grid and returns the updated grid."""
-    rows, cols = len(grid), len(grid[0])
-    new_grid = [[grid[row][col] for col in range(cols)] for row in range(rows)]
+def apply_move(cells: np.ndarray, targets: list[tuple[int, int]], dx: int, dy: int) -> None:
+    """Applies the robot's move to the grid in place."""
+    x, y = np.array(targets).T
+    moved = cells[x, y]
+    cells[x, y] = EMPTY
+    cells[x + dx, y + dy] = moved
 
-    for x, y in targets:
-        new_grid[x][y] = "."
-    for x, y in targets:
-        new_grid[x + dx][y + dy] = grid[x][y]
 
-    return new_grid
-
-
-def calculate_score(grid: list[list[str]]) -> int:
+def calculate_score(grid: Grid) -> int:
     """Calculates the score based on the final grid state."""
-    score = 0
-    for row_idx, row in enumerate(grid):
-        for col_idx, cell in enumerate(row):
-            if cell in "[O":
-                score += 100 * row_idx + col_idx
-    return score
+    boxes = grid.find_all("[O")
+    return int((100 * boxes[:, 0] + boxes[:, 1]).sum())
 
 
-def solve(grid: list[list[str]], instructions: list[str]) -> int:
-    """Executes all instructions on the given grid.."""
+def solve(grid: Grid, instructions: list[str]) -> int:
+    """Executes all instructions on a copy of the given grid."""
+    grid = grid.copy()
     current_x, current_y = locate_robot(grid)
 
     for instruction in instructions:
         dx, dy = DIRECTIONS[instruction]
 
-        if move := check_move_effect(grid, current_x, current_y, dx, dy):
-            grid = apply_move(grid, move, dx, dy)
+        if move := check_move_effect(grid.cells, current_x, current_y, dx, dy):
+            apply_move(grid.cells, move, dx, dy)
             current_x += dx
             current_y += dy
 
     return calculate_score(grid)
 
 
+def part_1(puzzle_input: tuple[Grid, list[str]]) -> int:
+    """Sum of the GPS coordinates of the boxes."""
+    grid, instructions = puzzle_input
+    return solve(grid, instructions)
+
+
+def part_2(puzzle_input: tuple[Grid, list[str]]) -> int:
+    """Sum of the GPS coordinates of the boxes in the widened warehouse."""
+    grid, instructions = puzzle_input
+    return solve(widen_grid(grid), instructions)
+
+
 def main() -> None:
     """Main function for day 15."""
-    grid, instructions = read_input()
-    print("Answer (1):", solve(grid, instructions))
-    grid, instructions = read_input(part_2=True)
-    print("Answer (2):", solve(grid, instructions))
+    puzzle_input = read_input(Path(__file__).parent / "input.txt")
+    print("Answer (1):", part_1(puzzle_input))
+    print("Answer (2):", part_2(puzzle_input))
 
 
 if __name__ == "__main__":
@@ -1,99 +1,130 @@
-import networkx as nx
+from pathlib import Path
 
-DIRECTIONS = (1, -1, 1j, -1j)
+import numpy as np
 
+from aoc.graph import UNREACHABLE, Graph, dijkstra
+from aoc.grid import Grid
 
-def read_input(filename: str = "dag_16/input.txt") -> list[list[str]]:
+# (dy, dx) offsets in clockwise order, so turning is moving one step through the tuple
+DIRECTIONS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+FORWARD_COST = 1
+TURN_COST = 1000
+
+
+def read_input(file_path: Path) -> Grid:
     """Read the maze input from a file."""
-    with open(filename) as f:
-        return [list(line.strip()) for line in f]
+    return Grid.read(file_path)
 
 
-def build_graph(maze: list[list[str]]) -> tuple[nx.DiGraph, tuple[complex, complex]]:  # noqa: C901
+def build_graph(maze: Grid) -> tuple[Graph, int, int]:
     """Builds a directed graph representation of the maze.
 
+    A node is a cell and a direction, numbered `flat index * 4 + direction`. The last
+    node is a special "end" node that all directions on the end cell lead to.
+
     Args:
-        maze: A 2D list representation of the maze.
+        maze: The maze as a grid.
 
     Returns:
-        The graph and starting node.
+        The graph, the starting node and the end node.
 
     """
-    graph = nx.DiGraph()
-    start, end = None, None
-
-    rows, cols = len(maze), len(maze[0])
-
-    for i in range(rows):
-        for j in range(cols):
-            char = maze[i][j]
-            if char == "#":
-                continue
+    try:
+        start = maze.to_flat(*maze.find("S")) * len(DIRECTIONS)  # Facing east
+    except ValueError:
+        raise ValueError("No start (S) found.")
+    end_cell = maze.to_flat(*maze.find("E"))
+    end = maze.rows * maze.cols * len(DIRECTIONS)
 
-            # Map grid coordinates to complex numbers for easier traversal
-            z = i + 1j * j
-            if char == "S":
-                start = (z, 1j)  # Start node with initial direction
-            elif char == "E":
-                end = z
+    open_cells = maze.cells != ord("#")
+    cells = np.flatnonzero(open_cells)
+    sources, targets, weights = [], [], []
+    for direction, (dy, dx) in enumerate(DIRECTIONS):
+        nodes = cells * len(DIRECTIONS) + direction
 
-            # Add all valid movement nodes
-            for dz in DIRECTIONS:
-                graph.add_node((z, dz))
+        # Forward movement, the neighbour is outside of the maze when it is \0
+        neighbours = maze.shift(dy, dx).ravel()[cells]
+        forward = (neighbours != ord("#")) & (neighbours != 0)
+        sources.append(nodes[forward])
+        targets.append((cells[forward] + maze.flat_offset(dy, dx)) * len(DIRECTIONS) + direction)
+        weights.append(np.full(np.count_nonzero(forward), FORWARD_COST))
 
-    if not start:
-        raise ValueError("No start (S) found.")
+        # Rotation to change direction
+        for turn in (-1, 1):
+            sources.append(nodes)
+            targets.append(cells * len(DIRECTIONS) + (direction + turn) % len(DIRECTIONS))
+            weights.append(np.full(len(cells), TURN_COST))
 
-    # Create edges for movements and rotations
-    for z, dz in graph.nodes:
-        if (z + dz, dz) in graph.nodes:  # Forward movement
-            graph.add_edge((z, dz), (z + dz, dz), weight=1)
-        for rot in (-1j, 1j):  # Rotation to change direction
-            graph.add_edge((z, dz), (z, dz * rot), weight=1000)
+    # Connect the end cell to the special "end" node
+    sources.append(end_cell * len(DIRECTIONS) + np.arange(len(DIRECTIONS)))
+    targets.append(np.full(len(DIRECTIONS), end))
+    weights.append(np.zeros(len(DIRECTIONS), dtype=np.int64))
 
-    # Connect the end node to a special "end" node
-    for dz in DIRECTIONS:
-        graph.add_edge((end, dz), "end", weight=0)
+    graph = Graph.from_edges(end + 1, np.concatenate(sources), np.concatenate(targets), np.concatenate(weights))
+    return graph, start, end
 
-    return graph, start
 
+def find_part_2_result(graph: Graph, start: int, end: int) -> int:
+    """Calculates the number of unique cells visited in all shortest paths to the end.
 
-def find_part_2_result(graph: nx.DiGraph, start: tuple[complex, complex]) -> int:
-    """Calculates the number of unique nodes visited in all shortest paths to the end.
+    A node is on a shortest path when its distance from the start plus its distance to the
+    end equals the length of the shortest path.
 
     Args:
         graph: The directed graph representation of the maze.
         start: The starting node.
+        end: The end node.
 
     Returns:
-        The count of unique nodes in all shortest paths.
+        The count of unique cells in all shortest paths.
 
     """
-    paths = nx.all_shortest_paths(graph, start, "end", weight="weight")
-    unique_nodes = {z for path in paths for z, _ in path[:-1]}  # Exclude the "end" node
-    return len(unique_nodes)
+    from_start = dijkstra(graph, start)
+    if from_start[end] == UNREACHABLE:
+        raise ValueError("The end (E) cannot be reached.")
+    to_end = dijkstra(graph.reverse(), end)
+    on_path = (from_start != UNREACHABLE) & (to_end != UNREACHABLE) & (from_start + to_end == from_start[end])
+    unique_cells = np.unique(np.flatnonzero(on_path[:end]) // len(DIRECTIONS))  # Exclude the "end" node
+    return len(unique_cells)
 
 
-def solve(maze: list[list[str]]) -> None:
-    """Solves the maze and prints the results for both parts.
+def part_1(maze: Grid) -> int:
+    """Calculates the lowest score to reach the end of the maze.
 
     Args:
-        maze: A 2D list representation of the maze.
+        maze: The maze as a grid.
+
+    Returns:
+        The lowest possible score.
 
     """
-    graph, start = build_graph(maze)
+    graph, start, end = build_graph(maze)
+    distance = dijkstra(graph, start)[end]
+    if distance == UNREACHABLE:
+        raise ValueError("The end (E) cannot be reached.")
+    return int(distance)
+
+
+def part_2(maze: Grid) -> int:
+    """Calculates the number of tiles that are part of at least one of the best paths.
+
+    Args:
+        maze: The maze as a grid.
 
-    part_1 = nx.shortest_path_length(graph, start, "end", weight="weight")
-    part_2 = find_part_2_result(graph, start)
+    Returns:
+        The count of unique tiles in all shortest paths.
 
-    print(f"Result (1): {part_1}")
-    print(f"Result (2): {part_2}")
+    """
+    graph, start, end = build_graph(maze)
+    return find_part_2_result(graph, start, end)
 
 
 def main() -> None:
     """Main function for day 16."""
-    maze = read_input()
-    solve(maze)
+    maze = read_input(Path(__file__).parent / "input.txt")
+
+    print(f"Result (1): {part_1(maze)}")
+    print(f"Result (2): {part_2(maze)}")
 
 
 if __name__ == "__main__":
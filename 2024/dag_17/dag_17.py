@@ -1,21 +1,28 @@
+from pathlib import Path
+
+from aoc.tokenizer import parse_integers
+
+
 class Computer:
     """Represents a simple Computer."""
 
-    def __init__(self) -> None:
+    def __init__(self, register_a: int, register_b: int, register_c: int, instructions: list[int]) -> None:
         self.output = []
         self.instruction_pointer = 0
 
-        with open("dag_17/sample.txt") as f:
-            registers, instructions = f.read().split("\n\n")
+        self.register_a = register_a
+        self.register_b = register_b
+        self.register_c = register_c
 
-        registers = registers.splitlines()
-        self.register_a = int(registers[0].lstrip("Register A: "))
-        self.register_b = int(registers[1].lstrip("Register B: "))
-        self.register_c = int(registers[2].lstrip("Register C: "))
+        self.instructions = instructions
 
-        self.instructions = [int(ins) for ins in instructions.lstrip("Program: ").split(",")]
+    @classmethod
+    def parse(cls, input_str: str) -> "Computer":
+        """Parse the registers and the program, which are all the integers in the input."""
+        register_a, register_b, register_c, *instructions = parse_integers(input_str.encode()).tolist()
+        return Computer(register_a, register_b, register_c, instructions)
 
-    def execute(self) -> None:  # noqa: C901
+    def execute(self) -> str:  # noqa: C901
         """Execute the instructions."""
         while self.instruction_pointer < len(self.instructions):
             opcode = self.instructions[self.instruction_pointer]
@@ -67,12 +74,24 @@ class Computer:
 
             self.instruction_pointer += 2
 
-        print(",".join(str(x) for x in self.output))
+        return ",".join(str(x) for x in self.output)
+
+
+def read_input(file_path: Path) -> str:
+    """Read the registers and the program."""
+    with open(file_path) as f:
+        return f.read()
+
+
+def part_1(puzzle_input: str) -> str:
+    """Output of the program."""
+    return Computer.parse(puzzle_input).execute()
 
 
 def main() -> None:
-    """Main function for day 16."""
-    Computer().execute()
+    """Main function for day 17."""
+    puzzle_input = read_input(Path(__file__).parent / "input.txt")
+    print(part_1(puzzle_input))
 
 
 if __name__ == "__main__":
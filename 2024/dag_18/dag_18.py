@@ -1,14 +1,16 @@
-from copy import deepcopy
+from pathlib import Path
 
-import networkx as nx
+import numpy as np
+
+from aoc.graph import UNREACHABLE, Graph, bfs
 
 GRID_SIZE = 71
 NO_OF_BYTES = 1024
 
 
-def read_input() -> list[tuple[int, int]]:
+def read_input(file_path: Path) -> list[tuple[int, int]]:
     """Read the coordinates of incoming byte positions."""
-    with open("dag_18/input.txt") as f:
+    with open(file_path) as f:
         obstacles = [co.split(",") for co in f.readlines()]
         obstacles = [(int(y), int(x)) for x, y in obstacles]
         return obstacles
@@ -19,47 +21,62 @@ class MemorySpaceEscaper:
 
     def __init__(self, obstacles: list[tuple[int, int]]) -> None:
         self.obstacles = obstacles
-        self.start = (0, 0)  # Top Left
-        self.exit = (GRID_SIZE - 1, GRID_SIZE - 1)  # Bottom Right
+        self.start = 0  # Top Left
+        self.exit = GRID_SIZE * GRID_SIZE - 1  # Bottom Right
+
+    def distances(self, no_of_bytes: int) -> np.ndarray:
+        """Distance from the start to every cell, after a specific number of obstacles (the 'bytes') fell."""
+        open_cells = np.ones((GRID_SIZE, GRID_SIZE), dtype=bool)
+        if no_of_bytes:
+            y, x = np.array(self.obstacles[:no_of_bytes]).T
+            open_cells[y, x] = False
+        return bfs(Graph.from_grid(open_cells), self.start)
+
+    def solve_for_no_of_bytes(self, no_of_bytes: int) -> int:
+        """Solve the map with a specific number of obstacles (the 'bytes')."""
+        distance = self.distances(no_of_bytes)[self.exit]
+        if distance == UNREACHABLE:
+            raise ValueError(f"The exit cannot be reached after {no_of_bytes} bytes")
+        return int(distance)
 
-    def initialize_graph(self) -> None:
-        """Initialize the graph based on the grid size."""
-        self.G = nx.grid_2d_graph(GRID_SIZE, GRID_SIZE)
+    def find_max_number_of_obstacles(self) -> tuple[int, int] | None:
+        """Find the first obstacle that blocks off the exit.
 
-    def solve_for_no_of_bytes(self, no_of_bytes: int) -> None:
-        """Solve the map with a specific number of obstacles (the 'bytes')."""
-        self.initialize_graph()
+        Once the exit is blocked it stays blocked, so the number of obstacles is found with
+        a binary search instead of a search after every obstacle.
+        """
+        if self.distances(len(self.obstacles))[self.exit] != UNREACHABLE:
+            return None
 
-        # Remove obstacles from the grid
-        for obstacle in self.obstacles[:no_of_bytes]:
-            if obstacle in self.G:
-                self.G.remove_node(obstacle)
+        low, high = 0, len(self.obstacles)  # The exit is reachable after low and blocked after high bytes
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self.distances(middle)[self.exit] == UNREACHABLE:
+                high = middle
+            else:
+                low = middle
+        return self.obstacles[high - 1]
 
-        shortest_path = nx.shortest_path(self.G, source=self.start, target=self.exit)
-        print(f"Minimum number of steps needed to reach the exit: {len(shortest_path) - 1}")
 
-    def find_max_number_of_obstacles(self) -> None:
-        """Find the max number of obstacles allowed to fall before the exit is blocked off."""
-        print("Finding obstacle which permanently blocks the exit")
+def part_1(obstacles: list[tuple[int, int]]) -> int:
+    """Minimum number of steps needed to reach the exit."""
+    return MemorySpaceEscaper(obstacles).solve_for_no_of_bytes(NO_OF_BYTES)
 
-        # Make sure the graph is clean
-        self.initialize_graph()
 
-        obstacles_to_pop = deepcopy(self.obstacles)
-        while obstacles_to_pop:
-            obstacle = obstacles_to_pop.pop(0)
-            self.G.remove_node(obstacle)
-            if nx.has_path(self.G, self.start, self.exit) is False:
-                print(f"After adding {obstacle} the exit is blocked")
-                break
+def part_2(obstacles: list[tuple[int, int]]) -> str | None:
+    """Coordinates (x,y) of the first byte that blocks the exit."""
+    obstacle = MemorySpaceEscaper(obstacles).find_max_number_of_obstacles()
+    if obstacle is None:
+        return None
+    y, x = obstacle
+    return f"{x},{y}"
 
 
 def main() -> None:
-    """Main function for day 16."""
-    obstacles = read_input()
-    memory_space_escaper = MemorySpaceEscaper(obstacles)
-    memory_space_escaper.solve_for_no_of_bytes(NO_OF_BYTES)
-    memory_space_escaper.find_max_number_of_obstacles()
+    """Main function for day 18."""
+    obstacles = read_input(Path(__file__).parent / "input.txt")
+    print(f"Minimum number of steps needed to reach the exit: {part_1(obstacles)}")
+    print(f"The exit is blocked after adding: {part_2(obstacles)}")
 
 
 if __name__ == "__main__":
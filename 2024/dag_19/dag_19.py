@@ -1,20 +1,29 @@
-import functools
+from pathlib import Path
 
+from aoc import counters
+from aoc.memo import memoize
+from aoc.parallel import map_reduce
 
-def read_input() -> tuple[tuple, list]:
+
+def read_input(file_path: Path) -> tuple[tuple, list]:
     """Read input.
 
     1. Open file
     2. Split into the available towels and desired designs
     """
-    with open("dag_19/input.txt") as f:
+    with open(file_path) as f:
         available_towels, combinations = f.read().split("\n\n")
         available_towels = tuple(available_towels.split(", "))
         combinations = combinations.splitlines()
         return available_towels, combinations
 
 
-@functools.cache
+# Keyed on the combination alone: the towels are the same for every call of a part, so they
+# are only compared by identity instead of being hashed on every call
+@memoize(
+    key=lambda combination, available_towels: combination,
+    scope=lambda combination, available_towels: available_towels,
+)
 def count_possibilities(combination: str, available_towels: tuple[str]) -> int:
     """Count the possibilities in which this combination can be composed."""
     if not combination:
@@ -31,20 +40,42 @@ def count_possibilities(combination: str, available_towels: tuple[str]) -> int:
     return possible_ways
 
 
-def main() -> None:
-    """Main function for pattern validation."""
-    available_towels, combinations = read_input()
+def design_possibilities(combination: str, available_towels: tuple[str]) -> int:
+    """Count the possibilities of a design, counting the memo hits and misses when counting is enabled."""
+    if not counters.enabled():
+        return count_possibilities(combination, available_towels)
+    before = count_possibilities.stats()
+    possibilities = count_possibilities(combination, available_towels)
+    after = count_possibilities.stats()
+    counters.count("memo_hits", after.hits - before.hits)
+    counters.count("memo_misses", after.misses - before.misses)
+    counters.count("memo_evictions", after.evictions - before.evictions)
+    return possibilities
+
+
+def is_possible(combination: str, available_towels: tuple[str]) -> int:
+    """1 if the combination can be composed, otherwise 0."""
+    return int(design_possibilities(combination, available_towels) > 0)
+
 
-    possible_combinations = 0
-    unique_ways_to_create_combinations = 0
+def part_1(puzzle_input: tuple[tuple, list]) -> int:
+    """Count the designs that are possible with the available towels."""
+    available_towels, combinations = puzzle_input
+    return map_reduce(is_possible, combinations, context=available_towels)
 
-    for combination in combinations:
-        if ways := count_possibilities(combination, available_towels):
-            possible_combinations += 1
-            unique_ways_to_create_combinations += ways
 
-    print(f"Possible combinations: {possible_combinations}")
-    print(f"Number of different ways to make each design: {unique_ways_to_create_combinations}")
+def part_2(puzzle_input: tuple[tuple, list]) -> int:
+    """Sum the number of different ways to make each design."""
+    available_towels, combinations = puzzle_input
+    return map_reduce(design_possibilities, combinations, context=available_towels)
+
+
+def main() -> None:
+    """Main function for pattern validation."""
+    puzzle_input = read_input(Path(__file__).parent / "input.txt")
+
+    print(f"Possible combinations: {part_1(puzzle_input)}")
+    print(f"Number of different ways to make each design: {part_2(puzzle_input)}")
 
 
 if __name__ == "__main__":
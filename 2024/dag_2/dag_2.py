@@ -1,19 +1,27 @@
-def read_input() -> list[list[int]]:
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from aoc.reader import read_records
+
+
+def parse_report(line: str) -> list[int]:
+    """Convert a line to the levels of a report."""
+    return [int(c) for c in line.split()]
+
+
+def stream_input(file_path: Path) -> Iterator[list[int]]:
+    """Lazily read the reports, one report per line."""
+    return read_records(file_path, parse_report)
+
+
+def read_input(file_path: Path) -> list[list[int]]:
     """Read input from the input file.
 
     1. Open file
     2. Split the input
     3. Convert to integers
-    4. Sort the lists
     """
-    with open("dag_2/input.txt") as f:
-        lines = f.read().splitlines()
-
-    reports = []
-    for line in lines:
-        reports.append([int(c) for c in line.split()])
-
-    return reports
+    return list(stream_input(file_path))
 
 
 def is_safe_report(current_report: list[int]) -> bool:
@@ -60,15 +68,22 @@ def is_safe_report_with_problem_dampener(report: list[int]) -> bool:
     return False
 
 
+def part_1(reports: Iterable[list[int]]) -> int:
+    """Count the safe reports."""
+    return sum(is_safe_report(report) for report in reports)
+
+
+def part_2(reports: Iterable[list[int]]) -> int:
+    """Count the safe reports when tolerating a single bad level."""
+    return sum(is_safe_report_with_problem_dampener(report) for report in reports)
+
+
 def main() -> None:
     """Main function for day 2."""
-    reports = read_input()
-
-    safe_reports = sum(is_safe_report(report) for report in reports)
-    print(f"Safe reports (1): {safe_reports}")
+    reports = read_input(Path(__file__).parent / "input.txt")
 
-    safe_reports = sum(is_safe_report_with_problem_dampener(report) for report in reports)
-    print(f"Safe reports (2): {safe_reports}")
+    print(f"Safe reports (1): {part_1(reports)}")
+    print(f"Safe reports (2): {part_2(reports)}")
 
 
 if __name__ == "__main__":
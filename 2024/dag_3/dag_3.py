@@ -1,9 +1,10 @@
 import re
+from pathlib import Path
 
 
-def read_input() -> str:
+def read_input(file_path: Path) -> str:
     """Read input."""
-    with open("dag_3/input.txt") as f:
+    with open(file_path) as f:
         return f.read()
 
 
@@ -39,7 +40,7 @@ def part_2(instructions: str) -> int:
 
 def main() -> None:
     """Main function for day 3."""
-    instructions = read_input()
+    instructions = read_input(Path(__file__).parent / "input.txt")
 
     print(f"Result (1): {part_1(instructions)}")
     print(f"Result (2): {part_2(instructions)}")
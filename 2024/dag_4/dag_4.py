@@ -1,87 +1,53 @@
+from pathlib import Path
+
+import numpy as np
+
+from aoc.grid import Grid, shift
+
 SEARCH_PART_1 = ("XMAS", "SAMX")
 SEARCH_PART_2 = ("MAS", "SAM")
 
+# Horizontal, vertical and both diagonals. Words are searched in both directions, so the
+# opposite directions would only find the same words again.
+LINES = ((0, 1), (1, 0), (1, 1), (1, -1))
 
-def read_input() -> list[list[str]]:
-    """Read input as a 2D vector list."""
-    with open("dag_4/input.txt") as f:
-        lines = f.read().splitlines()
 
-    return [list(line) for line in lines]
+def read_input(file_path: Path) -> Grid:
+    """Read input as a grid."""
+    return Grid.read(file_path)
 
 
-def check_for_coordinates(
-    puzzle: list[list[str]],
-    coordinates: tuple,
-    search: tuple[str, str],
-) -> bool:
-    """Check if a set of coordinates contain one of the given search words."""
-    try:
-        if any(x < 0 or y < 0 for x, y in coordinates):
-            return False
-        result = "".join([puzzle[y][x] for y, x in coordinates])
-    except IndexError:
-        return False
+def word_at(puzzle: Grid, steps: list[tuple[int, int]], search: tuple[str, ...]) -> np.ndarray:
+    """Check for every cell if the letters at the given steps from that cell form one of the search words."""
+    letters = [shift(puzzle.cells, dy, dx) for dy, dx in steps]
 
-    return result in search
+    found = np.zeros(puzzle.shape, dtype=bool)
+    for word in search:
+        matches = np.ones(puzzle.shape, dtype=bool)
+        for letter, char in zip(letters, word):
+            matches &= letter == ord(char)
+        found |= matches
+    return found
 
 
-def part_1(puzzle: list[list[str]]) -> int:
+def part_1(puzzle: Grid) -> int:
     """Find the search words in the puzzle."""
-    x, y = 0, 0
-    len_x = len(puzzle[0])
-    len_y = len(puzzle)
-
-    coordinates_used = []
-    for y in range(len_y):
-        for x in range(len_x):
-            horizontal = (y, x), (y, x + 1), (y, x + 2), (y, x + 3)
-            vertical = (y, x), (y + 1, x), (y + 2, x), (y + 3, x)
-            diagonal_right_up = (y, x), (y - 1, x + 1), (y - 2, x + 2), (y - 3, x + 3)
-            diagonal_right_down = (y, x), (y + 1, x + 1), (y + 2, x + 2), (y + 3, x + 3)
-            diagonal_left_up = (y, x), (y + 1, x - 1), (y + 2, x - 2), (y + 3, x - 3)
-            diagonal_left_down = (y, x), (y - 1, x - 1), (y - 2, x - 2), (y - 3, x - 3)
-
-            coordinate_rules = [
-                horizontal,
-                vertical,
-                diagonal_right_up,
-                diagonal_right_down,
-                diagonal_left_up,
-                diagonal_left_down,
-            ]
-            for coordinates in coordinate_rules:
-                if check_for_coordinates(puzzle, coordinates, SEARCH_PART_1):
-                    coordinates_used.append(coordinates)
-
-    unique_coordinate_sets = list(map(list, {tuple(sorted(sublist)) for sublist in coordinates_used}))
-    return len(unique_coordinate_sets)
-
-
-def part_2(puzzle: list[list[str]]) -> int:
-    """Find the search words in the puzzle."""
-    x, y = 0, 0
-    len_x = len(puzzle[0])
-    len_y = len(puzzle)
-
-    total = 0
-    for y in range(len_y):
-        for x in range(len_x):
-            char = puzzle[y][x]
-            if char == SEARCH_PART_2[0][1]:
-                diagonal_left_to_right_up = (y - 1, x - 1), (y, x), (y + 1, x + 1)
-                diagonal_left_to_right_down = (y + 1, x - 1), (y, x), (y - 1, x + 1)
+    length = len(SEARCH_PART_1[0])
+    return sum(int(word_at(puzzle, [(dy * i, dx * i) for i in range(length)], SEARCH_PART_1).sum()) for dy, dx in LINES)
 
-                rules = [diagonal_left_to_right_down, diagonal_left_to_right_up]
-                if all(check_for_coordinates(puzzle, rule, SEARCH_PART_2) for rule in rules):
-                    total += 1
 
-    return total
+def part_2(puzzle: Grid) -> int:
+    """Find the search words crossing each other in an X."""
+    diagonal_left_to_right_down = [(-1, -1), (0, 0), (1, 1)]
+    diagonal_left_to_right_up = [(1, -1), (0, 0), (-1, 1)]
+    found = word_at(puzzle, diagonal_left_to_right_down, SEARCH_PART_2)
+    found &= word_at(puzzle, diagonal_left_to_right_up, SEARCH_PART_2)
+    return int(found.sum())
 
 
 def main() -> None:
     """Main function for day 4."""
-    puzzle = read_input()
+    puzzle = read_input(Path(__file__).parent / "input.txt")
 
     print(f"Result (1): {part_1(puzzle)}")
     print(f"Result (2): {part_2(puzzle)}")
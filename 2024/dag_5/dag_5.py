@@ -1,11 +1,14 @@
-def read_input() -> tuple[list, list]:
+from pathlib import Path
+
+
+def read_input(file_path: Path) -> tuple[list, list]:
     """Read input.
 
     1. Open file
     2. Split the ordering rules and page updates
     3. Split the rules and updates into a list
     """
-    with open("dag_5/input.txt") as f:
+    with open(file_path) as f:
         ordering_rules, page_updates = f.read().split("\n\n")
         ordering_rules = [page.split("|") for page in ordering_rules.splitlines()]
         page_updates = [page.split(",") for page in page_updates.splitlines()]
@@ -23,6 +26,7 @@ def is_update_in_order(ordering_rules: list, page_update: list) -> bool:
 
 def order_in_correct_page_update(ordering_rules: list, page_update: list) -> list:
     """Order an incorrectly sorted page update."""
+    page_update = page_update.copy()
     while not is_update_in_order(ordering_rules, page_update):
         for before, after in ordering_rules:
             if before in page_update and after in page_update:
@@ -58,14 +62,24 @@ def incorrectly_ordered_updates(ordering_rules: list, page_update: list) -> int:
     return 0
 
 
+def part_1(puzzle_input: tuple[list, list]) -> int:
+    """Sum the middle page numbers of the correctly ordered updates."""
+    ordering_rules, page_updates = puzzle_input
+    return sum([correctly_ordered_updates(ordering_rules, page_update) for page_update in page_updates])
+
+
+def part_2(puzzle_input: tuple[list, list]) -> int:
+    """Sum the middle page numbers of the incorrectly ordered updates after ordering them."""
+    ordering_rules, page_updates = puzzle_input
+    return sum([incorrectly_ordered_updates(ordering_rules, page_update) for page_update in page_updates])
+
+
 def main() -> None:
     """Main function for day 5."""
-    ordering_rules, page_updates = read_input()
+    puzzle_input = read_input(Path(__file__).parent / "input.txt")
 
-    part_1 = sum([correctly_ordered_updates(ordering_rules, page_update) for page_update in page_updates])
-    part_2 = sum([incorrectly_ordered_updates(ordering_rules, page_update) for page_update in page_updates])
-    print(f"Result (1): {part_1}")
-    print(f"Result (2): {part_2}")
+    print(f"Result (1): {part_1(puzzle_input)}")
+    print(f"Result (2): {part_2(puzzle_input)}")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,13 @@
-from copy import deepcopy
 from enum import Enum
+from pathlib import Path
+
+from aoc.counters import count
+from aoc.grid import Grid
 
 PRINT = False
+EMPTY = ord(".")
+# Part 2 walks the route again for an obstacle on every cell of the route
+EXPECTED_COMPLEXITY = {"part_2": 2}
 
 
 class StuckInLoopError(Exception):
@@ -32,23 +38,21 @@ class Direction(Enum):
         return Direction(v)
 
 
-def read_input() -> list[list[str]]:
+def read_input(file_path: Path) -> Grid:
     """Read input.
 
     1. Open file
-    2. Return puzzle as 2D array
+    2. Return puzzle as a grid
     """
-    with open("dag_6/input.txt") as f:
-        return [list(line) for line in f.read().splitlines()]
+    return Grid.read(file_path)
 
 
 class RouteTracer:
     """Class responsible for tracing the route of the guard."""
 
-    def __init__(self, puzzle: list[list[str]]) -> None:
+    def __init__(self, puzzle: Grid) -> None:
         self.puzzle = puzzle
-        self.len_y = len(puzzle)
-        self.len_x = len(puzzle[0])
+        self.len_y, self.len_x = puzzle.shape
         self.start_position = self.retrieve_start_position()
         self.current_position = self.start_position
         self.current_direction = Direction.UP
@@ -66,6 +70,8 @@ class RouteTracer:
                 inside_area = False
                 break
             elif self.check_if_in_loop(steps_taken):
+                count("routes")
+                count("states", len(positions_visited))
                 raise StuckInLoopError
 
             if self.something_directly_in_front():
@@ -75,11 +81,12 @@ class RouteTracer:
                 self.take_step_forward()
                 steps_taken += 1
 
+        # Counted once per route, so the loop itself stays free of counting
+        count("routes")
+        count("states", len(positions_visited))
         if return_unique_coordinates:
-            unique_coordinates = []
-            for coordinate in positions_visited:
-                if coordinate not in unique_coordinates:
-                    unique_coordinates.append(coordinate)
+            # A dict keeps the order of the first visits, and looks up a coordinate in constant time
+            unique_coordinates = list(dict.fromkeys(positions_visited))
 
             if PRINT:
                 self.print_grid(unique_coordinates)
@@ -88,14 +95,12 @@ class RouteTracer:
 
     def retrieve_start_position(self) -> tuple:
         """Retrieve the starting position from the puzzle."""
-        y, x = 0, 0
-        for y in range(self.len_y):
-            for x in range(self.len_x):
-                char = self.puzzle[y][x]
-                if char == "^":  # Assume starting position is up
-                    self.puzzle[y][x] = "."
-                    return y, x
-        raise NoStartPositionFoundError("No start position found!")
+        try:
+            y, x = self.puzzle.find("^")  # Assume starting position is up
+        except ValueError:
+            raise NoStartPositionFoundError("No start position found!")
+        self.puzzle[y, x] = "."
+        return y, x
 
     def next_position(self) -> tuple:
         """Calculate the next position based on the direction."""
@@ -116,8 +121,8 @@ class RouteTracer:
 
     def something_directly_in_front(self) -> bool:
         """Check if there is something directly in front of the guard."""
-        next_position = self.next_position()
-        return self.char_for_coordinate(next_position) != "."
+        y, x = self.next_position()
+        return self.puzzle.cells[y, x] != EMPTY
 
     def turn_90_degrees(self) -> None:
         """Turn the guard 90 degrees."""
@@ -138,8 +143,7 @@ class RouteTracer:
 
     def char_for_coordinate(self, coordinate: tuple) -> str:
         """Retrieve the character at the given coordinate."""
-        y, x = coordinate
-        return self.puzzle[y][x]
+        return self.puzzle[coordinate]
 
     def next_position_outside_area(self) -> bool:
         """Check if next position is inside the safe area."""
@@ -162,23 +166,27 @@ class RouteTracer:
             print()
 
 
-def main() -> None:
-    """Main function for day 6."""
-    original_puzzle = read_input()
+def unique_positions_visited(original_puzzle: Grid) -> list[tuple]:
+    """Trace the route of the guard on a copy of the puzzle."""
+    route_tracer = RouteTracer(original_puzzle.copy())
+    return route_tracer.trace_route(return_unique_coordinates=True)
 
-    puzzle = deepcopy(original_puzzle)
 
-    route_tracer = RouteTracer(puzzle)
-    unique_positions_visited = route_tracer.trace_route(return_unique_coordinates=True)
-    if not unique_positions_visited:
-        return
+def part_1(original_puzzle: Grid) -> int:
+    """Count the distinct positions visited by the guard."""
+    return len(unique_positions_visited(original_puzzle))
+
+
+def part_2(original_puzzle: Grid) -> int:
+    """Count the positions where a single obstacle makes the guard walk in a loop."""
+    positions_visited = unique_positions_visited(original_puzzle)
 
     possible_obstacle_positions = 0
-    for i, coordinate in enumerate(unique_positions_visited, start=1):
-        print(f"{i}/{len(unique_positions_visited)}: placing obstacle at {coordinate}")
-        puzzle_with_obstacle = deepcopy(original_puzzle)
-        y, x = coordinate
-        puzzle_with_obstacle[y][x] = "O"
+    for i, coordinate in enumerate(positions_visited, start=1):
+        if PRINT:
+            print(f"{i}/{len(positions_visited)}: placing obstacle at {coordinate}")
+        puzzle_with_obstacle = original_puzzle.copy()
+        puzzle_with_obstacle[coordinate] = "O"
 
         try:
             route_tracer = RouteTracer(puzzle_with_obstacle)
@@ -191,8 +199,15 @@ def main() -> None:
         except StuckInLoopError:
             possible_obstacle_positions += 1
 
-    print(f"Unique positions visited: {len(unique_positions_visited)}")
-    print(f"Possible obstacle positions: {possible_obstacle_positions}")
+    return possible_obstacle_positions
+
+
+def main() -> None:
+    """Main function for day 6."""
+    original_puzzle = read_input(Path(__file__).parent / "input.txt")
+
+    print(f"Unique positions visited: {part_1(original_puzzle)}")
+    print(f"Possible obstacle positions: {part_2(original_puzzle)}")
 
 
 if __name__ == "__main__":
@@ -1,11 +1,17 @@
 import itertools
 from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from aoc.counters import count
+from aoc.parallel import map_reduce
+from aoc.reader import read_records
 
 OPERATORS_PART_1 = ["+", "*"]
 OPERATORS_PART_2 = ["+", "*", "||"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Equation:
     """Represents an equation."""
 
@@ -32,35 +38,95 @@ class Equation:
         return value == self.result
 
 
-def read_input() -> list[Equation]:
+def stream_input(file_path: Path) -> Iterator[Equation]:
+    """Lazily read the equations, one equation per line."""
+    return read_records(file_path, Equation.parse)
+
+
+def read_input(file_path: Path) -> list[Equation]:
     """Read input.
 
     1. Open file
     2. Parse each equation
     """
-    with open("dag_7/input.txt") as f:
-        return [Equation.parse(input_str) for input_str in f.read().splitlines()]
+    return list(stream_input(file_path))
 
 
 def is_solvable(eq: Equation, available_operators: list) -> bool:
-    """Check if an equation is solvable."""
+    """Check if an equation is solvable by trying every combination of operators."""
     no_of_operator_positions = len(eq.values) - 1
     operator_combinations = itertools.product(available_operators, repeat=no_of_operator_positions)
-    for operators in operator_combinations:
+    for tried, operators in enumerate(operator_combinations, start=1):
         if eq.evaluate(operators):
+            count("combinations", tried)
             return True
+    count("combinations", len(available_operators) ** no_of_operator_positions)
     return False
 
 
-def main() -> None:
-    """Main function for day 5."""
-    equations = read_input()
+def can_produce(target: int, values: list[int], available_operators: list) -> bool:
+    """Check if the values can produce the target, working backwards from the last value.
+
+    The last operator can only be + if the target is at least the last value, * if the last
+    value divides the target and || if the target ends with the last value, so most
+    combinations of operators are never tried. The values are never negative.
+    """
+    *rest, last = values
+    if not rest:
+        # A combination of operators that survived the pruning
+        count("combinations")
+        return target == last
+    if target >= last and can_produce(target - last, rest, available_operators):
+        return True
+    if last == 0:
+        if target == 0 and "*" in available_operators:
+            return True
+    elif target % last == 0 and can_produce(target // last, rest, available_operators):
+        return True
+    if "||" in available_operators:
+        digits, suffix = str(target), str(last)
+        if digits.endswith(suffix):
+            prefix = digits[: -len(suffix)] or "0"
+            return can_produce(int(prefix), rest, available_operators)
+    return False
+
+
+def solvable_result(eq: Equation, available_operators: list) -> int:
+    """Result of the equation if it is solvable, otherwise 0."""
+    return eq.result if can_produce(eq.result, eq.values, available_operators) else 0
+
 
-    part_1 = sum([eq.result for eq in equations if is_solvable(eq, OPERATORS_PART_1)])
-    print(f"Result (1): {part_1}")
+def reference_solvable_result(eq: Equation, available_operators: list) -> int:
+    """Result of the equation if it is solvable according to `is_solvable`, otherwise 0."""
+    return eq.result if is_solvable(eq, available_operators) else 0
+
+
+def part_1(equations: Iterable[Equation]) -> int:
+    """Sum the results of the equations that can be solved with + and *."""
+    return map_reduce(solvable_result, equations, context=OPERATORS_PART_1)
+
+
+def part_2(equations: Iterable[Equation]) -> int:
+    """Sum the results of the equations that can be solved with +, * and ||."""
+    return map_reduce(solvable_result, equations, context=OPERATORS_PART_2)
+
+
+def reference_part_1(equations: Iterable[Equation]) -> int:
+    """Part 1 by trying every combination of operators."""
+    return sum(reference_solvable_result(eq, OPERATORS_PART_1) for eq in equations)
+
+
+def reference_part_2(equations: Iterable[Equation]) -> int:
+    """Part 2 by trying every combination of operators."""
+    return sum(reference_solvable_result(eq, OPERATORS_PART_2) for eq in equations)
+
+
+def main() -> None:
+    """Main function for day 7."""
+    equations = read_input(Path(__file__).parent / "input.txt")
 
-    part_2 = sum([eq.result for eq in equations if is_solvable(eq, OPERATORS_PART_2)])
-    print(f"Result (2): {part_2}")
+    print(f"Result (1): {part_1(equations)}")
+    print(f"Result (2): {part_2(equations)}")
 
 
 if __name__ == "__main__":
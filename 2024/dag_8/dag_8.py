@@ -1,102 +1,95 @@
-import itertools
-from collections import defaultdict
-from typing import TypedDict
+from pathlib import Path
 
+import numpy as np
 
-class Coordinate(TypedDict):
-    """Represent a x,y coordinate."""
+from aoc.grid import Grid
 
-    x: int
-    y: int
+EMPTY = ord(".")
 
 
-def read_input() -> list[list[str]]:
+def read_input(file_path: Path) -> Grid:
     """Read input.
 
     1. Open file
-    2. Return puzzle as 2D array
+    2. Return puzzle as a grid
     """
-    with open("dag_8/input.txt") as f:
-        return [list(line) for line in f.read().splitlines()]
+    return Grid.read(file_path)
 
 
-def find_frequencies_locations(array2d: list[list[str]]) -> dict[str, list[Coordinate]]:
-    """Locate all antenna frequency coordinates."""
-    sets = defaultdict(list)
-    for y in range(len(array2d)):
-        for x in range(len(array2d[0])):
-            char = array2d[y][x]
-            if char != ".":
-                sets[char].append({"y": y, "x": x})
-    return sets
+def find_frequencies_locations(grid: Grid) -> dict[int, np.ndarray]:
+    """Locate all antenna frequency coordinates, as (y, x) arrays per frequency."""
+    coordinates = np.argwhere(grid.cells != EMPTY)
+    frequencies = grid.cells[coordinates[:, 0], coordinates[:, 1]]
+    return {int(frequency): coordinates[frequencies == frequency] for frequency in np.unique(frequencies)}
 
 
-def create_antinodes(array2d: list[list[str]], frequencies: dict) -> int:
-    """Create antinodes for part 1."""
-    antinodes_coordinates = []
+def antenna_pairs(frequencies: dict[int, np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """All ordered pairs of antennas with the same frequency, as two (n, 2) arrays."""
+    first, second = [np.empty((0, 2), dtype=np.int64)], [np.empty((0, 2), dtype=np.int64)]
     for antennas in frequencies.values():
-        antenna_combinations = itertools.combinations(antennas, 2)
-        for antenna_combination in antenna_combinations:
-            for coordinate_1, coordinate_2 in itertools.permutations(antenna_combination, 2):
-                new_coordinate = calc_antinode(coordinate_1, coordinate_2)
+        i, j = np.nonzero(~np.eye(len(antennas), dtype=bool))
+        first.append(antennas[i])
+        second.append(antennas[j])
+    return np.concatenate(first), np.concatenate(second)
 
-                if coordinate_in_bounds(array2d, new_coordinate):
-                    antinodes_coordinates.append((new_coordinate["y"], new_coordinate["x"]))
 
-    return len(list(set(antinodes_coordinates)))
+def in_bounds(grid: Grid, coordinates: np.ndarray) -> np.ndarray:
+    """Check which (y, x) coordinates are in bounds."""
+    rows, cols = grid.shape
+    return (coordinates[:, 0] >= 0) & (coordinates[:, 0] < rows) & (coordinates[:, 1] >= 0) & (coordinates[:, 1] < cols)
 
 
-def calc_antinode(coordinate: Coordinate, combined_coordinate: Coordinate) -> Coordinate:
-    """Calculate an antinode for two coordinates."""
-    y_diff = coordinate["y"] - combined_coordinate["y"]
-    x_diff = coordinate["x"] - combined_coordinate["x"]
+def create_antinodes(grid: Grid, frequencies: dict[int, np.ndarray]) -> int:
+    """Create antinodes for part 1."""
+    first, second = antenna_pairs(frequencies)
+    antinodes = first + (first - second)
 
-    return {
-        "x": coordinate["x"] + x_diff,
-        "y": coordinate["y"] + y_diff,
-    }
+    antinode_map = np.zeros(grid.shape, dtype=bool)
+    antinodes = antinodes[in_bounds(grid, antinodes)]
+    antinode_map[antinodes[:, 0], antinodes[:, 1]] = True
+    return int(antinode_map.sum())
 
 
-def create_antinodes_resonant_harmonics(array2d: list[list[str]], frequencies: dict) -> int:
-    """Create antinodes for part 2."""
-    antinodes_coordinates = []
-    for antennas in frequencies.values():
-        antenna_combinations = itertools.combinations(antennas, 2)
-        for antenna_combination in antenna_combinations:
-            for coordinate_1, coordinate_2 in itertools.permutations(antenna_combination, 2):
-                new_coordinate = calc_antinode(coordinate_1, coordinate_2)
-                old_coordinate = coordinate_1
+def create_antinodes_resonant_harmonics(grid: Grid, frequencies: dict[int, np.ndarray]) -> int:
+    """Create antinodes for part 2.
 
-                antinodes_coordinates.append((coordinate_1["y"], coordinate_1["x"]))
-                antinodes_coordinates.append((coordinate_2["y"], coordinate_2["x"]))
+    Every antenna of a pair is an antinode, and so is every step of the distance between the pair
+    beyond the first antenna, until it leaves the map.
+    """
+    first, second = antenna_pairs(frequencies)
+    difference = first - second
 
-                while coordinate_in_bounds(array2d, new_coordinate):
-                    antinodes_coordinates.append((new_coordinate["y"], new_coordinate["x"]))
+    antinode_map = np.zeros(grid.shape, dtype=bool)
+    antinode_map[second[:, 0], second[:, 1]] = True
 
-                    old = new_coordinate
-                    new_coordinate = calc_antinode(new_coordinate, old_coordinate)
-                    old_coordinate = old
+    antinodes = first
+    while len(antinodes):
+        inside = in_bounds(grid, antinodes)
+        antinodes, difference = antinodes[inside], difference[inside]
+        antinode_map[antinodes[:, 0], antinodes[:, 1]] = True
+        antinodes = antinodes + difference
 
-    return len(list(set(antinodes_coordinates)))
+    return int(antinode_map.sum())
 
 
-def coordinate_in_bounds(array2d: list[list[str]], coordinate: Coordinate) -> bool:
-    """Check if a coordinate is in bounds."""
-    max_y = len(array2d)
-    max_x = len(array2d[0])
-    return coordinate["x"] >= 0 and coordinate["x"] < max_x and coordinate["y"] >= 0 and coordinate["y"] < max_y
+def part_1(grid: Grid) -> int:
+    """Count the unique antinode locations."""
+    return create_antinodes(grid, find_frequencies_locations(grid))
+
+
+def part_2(grid: Grid) -> int:
+    """Count the unique antinode locations, taking resonant harmonics into account."""
+    return create_antinodes_resonant_harmonics(grid, find_frequencies_locations(grid))
 
 
 def main() -> None:
     """Main function for day 8."""
-    array2d = read_input()
-
-    frequencies = find_frequencies_locations(array2d)
+    grid = read_input(Path(__file__).parent / "input.txt")
 
-    no_of_antinodes_part_1 = create_antinodes(array2d, frequencies)
+    no_of_antinodes_part_1 = part_1(grid)
     print(f"{no_of_antinodes_part_1=}")
 
-    no_of_antinodes_part_2 = create_antinodes_resonant_harmonics(array2d, frequencies)
+    no_of_antinodes_part_2 = part_2(grid)
     print(f"{no_of_antinodes_part_2=}")
 
 
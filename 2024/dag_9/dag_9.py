@@ -1,6 +1,13 @@
-from copy import deepcopy
+from pathlib import Path
 from typing import TypedDict
 
+import numpy as np
+
+from aoc.reader import map_file, strip_view
+
+# The input is memory-mapped, which is faster than hashing it and loading a copy from the parse cache
+PARSE_CACHE = False
+
 
 class File(TypedDict):
     """Representation of a file."""
@@ -10,23 +17,22 @@ class File(TypedDict):
     no_of_blocks: int
 
 
-def read_input() -> list[str]:
+def read_input(file_path: Path) -> np.ndarray:
     """Read input.
 
-    1. Open file
-    2. Return the disk map
+    1. Memory-map the file
+    2. Return a view of the digits of the disk map, as ASCII codes
     """
-    with open("dag_9/input.txt") as f:
-        return list(f.read())
+    return strip_view(map_file(file_path))
 
 
-def stretch_disk_map(disk_map: list[str]) -> list[str]:
+def stretch_disk_map(disk_map: np.ndarray) -> list[str]:
     """Stretch out the disk map from 12345 to 0..111....22222."""
     current_id = 0
     stretched_disk_map = []
-    for i, digit in enumerate(disk_map):
+    for i, digit in enumerate((disk_map - ord("0")).tolist()):
         is_free_space = i % 2 != 0
-        for i in range(int(digit)):
+        for i in range(digit):
             stretched_disk_map.append(str(current_id) if not is_free_space else ".")
         if not is_free_space:
             current_id += 1
@@ -123,17 +129,24 @@ def calculate_checksum(disk_map: list[str]) -> int:
     return sum([i * v for i, v in enumerate(disk_map_formatted)])
 
 
-def main() -> None:
-    """Main function for day 9."""
-    disk_map = read_input()
+def part_1(disk_map: np.ndarray) -> int:
+    """Checksum after compacting the disk by moving single blocks."""
+    compacted_disk_map = compact_disk_map_with_fragmentation(stretch_disk_map(disk_map))
+    return calculate_checksum(compacted_disk_map)
 
-    stretched_disk_map = stretch_disk_map(disk_map)
 
-    compacted_disk_map_1 = compact_disk_map_with_fragmentation(deepcopy(stretched_disk_map))
-    print(f"Checksum (1): {calculate_checksum(compacted_disk_map_1)}")
+def part_2(disk_map: np.ndarray) -> int:
+    """Checksum after compacting the disk by moving whole files."""
+    compacted_disk_map = compact_disk_map_without_fragmentation(stretch_disk_map(disk_map))
+    return calculate_checksum(compacted_disk_map)
+
+
+def main() -> None:
+    """Main function for day 9."""
+    disk_map = read_input(Path(__file__).parent / "input.txt")
 
-    compacted_disk_map_2 = compact_disk_map_without_fragmentation(deepcopy(stretched_disk_map))
-    print(f"Checksum (2): {calculate_checksum(compacted_disk_map_2)}")
+    print(f"Checksum (1): {part_1(disk_map)}")
+    print(f"Checksum (2): {part_2(disk_map)}")
 
 
 if __name__ == "__main__":
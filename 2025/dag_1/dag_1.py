@@ -1,8 +1,11 @@
 from dataclasses import dataclass
-from typing import Self
+from pathlib import Path
+from typing import Iterable, Iterator, Self
 
+from aoc.reader import read_records
 
-@dataclass
+
+@dataclass(slots=True)
 class Rotation:
     direction: str
     no_of_rotations: int
@@ -23,14 +26,15 @@ class Rotation:
         raise ValueError
 
 
-def read_input() -> list[Rotation]:
-    with open("2025/dag_1/input.txt") as f:
-        lines = f.read().splitlines()
+def stream_input(file_path: Path) -> Iterator[Rotation]:
+    return read_records(file_path, Rotation.from_string)
+
 
-    return [Rotation.from_string(s) for s in lines]
+def read_input(file_path: Path) -> list[Rotation]:
+    return list(stream_input(file_path))
 
 
-def part_1(rotations: list[Rotation]) -> None:
+def part_1(rotations: Iterable[Rotation]) -> int:
     dail = 50
     pointing_at_zero = 0
     for rotation in rotations:
@@ -38,10 +42,10 @@ def part_1(rotations: list[Rotation]) -> None:
         if dail == 0:
             pointing_at_zero += 1
 
-    print(f"Part 1: {pointing_at_zero}")
+    return pointing_at_zero
 
 
-def part_2(rotations: list[Rotation]) -> None:
+def part_2(rotations: Iterable[Rotation]) -> int:
     dail = 50
     pointing_at_zero = 0
     for rotation in rotations:
@@ -50,14 +54,14 @@ def part_2(rotations: list[Rotation]) -> None:
             if dail == 0:
                 pointing_at_zero += 1
 
-    print(f"Part 2: {pointing_at_zero}")
+    return pointing_at_zero
 
 
 def main() -> None:
     """Main function for day 1."""
-    rotations = read_input()
-    part_1(rotations)
-    part_2(rotations)
+    rotations = read_input(Path(__file__).parent / "input.txt")
+    print(f"Part 1: {part_1(rotations)}")
+    print(f"Part 2: {part_2(rotations)}")
 
 
 if __name__ == "__main__":
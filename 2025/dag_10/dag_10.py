@@ -3,10 +3,18 @@ from itertools import combinations
 from pathlib import Path
 
 import click
-from ortools.sat.python import cp_model
 
+from aoc import budget
+from aoc.counters import count
+from aoc.cpu import cpu_budget
+from aoc.lazy import lazy_import
+from aoc.parallel import map_reduce
+from aoc.profiling import Profiler
 
-@dataclass
+cp_model = lazy_import("ortools.sat.python.cp_model")
+
+
+@dataclass(slots=True)
 class Machine:
     target: list[bool]
     buttons: list[tuple[int, ...]]
@@ -36,7 +44,7 @@ class Machine:
         return Machine(target=target, buttons=buttons, joltage=joltage, state=state)
 
 
-def read_input(file_path: Path) -> list[list[str]]:
+def read_input(file_path: Path) -> list[Machine]:
     """Read input."""
     with open(file_path) as f:
         return [Machine.parse_from_string(line) for line in f.read().splitlines()]
@@ -103,22 +111,47 @@ def solve_min_presses_joltage(machine: Machine) -> int:
     model.Minimize(sum(x))
 
     solver = cp_model.CpSolver()
-    solver.parameters.num_search_workers = 16  # Go fast
-
-    solver.Solve(model)
+    # Search with the cores of this process' CPU budget, not with all cores of the machine
+    solver.parameters.num_workers = cpu_budget()
+    # CP-SAT can't be interrupted by the time budget, so it gets the remaining time as its own limit
+    if (seconds := budget.remaining()) is not None:
+        solver.parameters.max_time_in_seconds = seconds
+
+    status = solver.Solve(model)
+    count("branches", solver.num_branches)
+    count("conflicts", solver.num_conflicts)
+    if status != cp_model.OPTIMAL:
+        if seconds is not None and status in (cp_model.FEASIBLE, cp_model.UNKNOWN):
+            raise budget.BudgetExceeded("CP-SAT reached the time limit")
+        raise ValueError("No optimal number of presses found")
 
     return sum([solver.Value(v) for v in x])
 
 
+def part_1(machines: list[Machine]) -> int:
+    return sum([configure_indicator_light(machine) for machine in machines])
+
+
+def part_2(machines: list[Machine]) -> int:
+    return map_reduce(solve_min_presses_joltage, machines)
+
+
 @click.command()
 # test flag
 @click.option("--test", is_flag=True, help="Run with test input")
-def cli(test: bool) -> None:
+@click.option("--profile", is_flag=True, help="Run under cProfile and print the hot functions")
+@click.option("--memory", is_flag=True, help="Report peak memory and top allocations per phase")
+def cli(test: bool, profile: bool, memory: bool) -> None:
     """CLI function."""
     file_path = Path(__file__).parent / ("example.txt" if test else "input.txt")
-    puzzle_input = read_input(file_path)
-    print(f"Part 1: {sum([configure_indicator_light(machine) for machine in puzzle_input])}")
-    print(f"Part 2: {sum([solve_min_presses_joltage(machine) for machine in puzzle_input])}")
+    profiler = Profiler(profile=profile, memory=memory)
+    with profiler.phase("parse"):
+        puzzle_input = read_input(file_path)
+    with profiler.phase("part 1"):
+        print(f"Part 1: {part_1(puzzle_input)}")
+    with profiler.phase("part 2"):
+        print(f"Part 2: {part_2(puzzle_input)}")
+    profiler.report()
 
 
 if __name__ == "__main__":
@@ -1,11 +1,12 @@
-from functools import lru_cache
 from pathlib import Path
 
 import click
-import networkx as nx
 
+from aoc.graph import Graph, topological_order
+from aoc.profiling import Profiler
 
-def read_input(file_path: Path) -> list[list[str]]:
+
+def read_input(file_path: Path) -> dict[str, list[str]]:
     """Read input."""
     with open(file_path) as f:
         connected_devices = {}
@@ -15,30 +16,30 @@ def read_input(file_path: Path) -> list[list[str]]:
         return connected_devices
 
 
-def build_graph(connected_devices: dict[str, list[str]]) -> nx.Graph:
-    G = nx.DiGraph()
-
+def build_graph(connected_devices: dict[str, list[str]]) -> tuple[Graph, dict[str, int]]:
+    """Graph of the devices, numbered in order of appearance, and the number of every device."""
+    ids: dict[str, int] = {}
+    sources, targets = [], []
     for u, vs in connected_devices.items():
         for v in vs:
-            G.add_edge(u, v)
-
-    if not nx.is_directed_acyclic_graph(G):
-        raise ValueError("Graph is not a DAG.")
+            sources.append(ids.setdefault(u, len(ids)))
+            targets.append(ids.setdefault(v, len(ids)))
+    return Graph.from_edges(len(ids), sources, targets), ids
 
-    return G
 
-
-def count_paths_between_nodes(G: nx.DiGraph, start: str, end: str) -> int:
-    @lru_cache(maxsize=None)
-    def count_paths_from(node: str) -> int:
+def count_paths_between_nodes(G: Graph, start: int, end: int) -> int:
+    """Count the paths from start to end, counting from the last node in topological order backwards."""
+    indptr, indices = G.indptr.tolist(), G.indices.tolist()
+    paths = [0] * G.n_nodes
+    for node in reversed(topological_order(G).tolist()):
         if node == end:
-            return 1
-        return sum(count_paths_from(v) for v in G.successors(node))
-
-    return count_paths_from(start)
+            paths[node] = 1
+        else:
+            paths[node] = sum(paths[v] for v in indices[indptr[node] : indptr[node + 1]])
+    return paths[start]
 
 
-def count_paths_via_nodes(G: nx.DiGraph, start: str, end: str, via_nodes: list[str]) -> int:
+def count_paths_via_nodes(G: Graph, start: int, end: int, via_nodes: list[int]) -> int:
     nodes = [start] + list(via_nodes) + [end]
     total = 1
     for a, b in zip(nodes, nodes[1:]):
@@ -46,16 +47,32 @@ def count_paths_via_nodes(G: nx.DiGraph, start: str, end: str, via_nodes: list[s
     return total
 
 
+def part_1(connected_devices: dict[str, list[str]]) -> int:
+    G, ids = build_graph(connected_devices)
+    return count_paths_between_nodes(G, ids["you"], ids["out"])
+
+
+def part_2(connected_devices: dict[str, list[str]]) -> int:
+    G, ids = build_graph(connected_devices)
+    return count_paths_via_nodes(G, ids["svr"], ids["out"], [ids["fft"], ids["dac"]])
+
+
 @click.command()
 # test flag
 @click.option("--test", is_flag=True, help="Run with test input")
-def cli(test: bool) -> None:
+@click.option("--profile", is_flag=True, help="Run under cProfile and print the hot functions")
+@click.option("--memory", is_flag=True, help="Report peak memory and top allocations per phase")
+def cli(test: bool, profile: bool, memory: bool) -> None:
     """CLI function."""
     file_path = Path(__file__).parent / ("example.txt" if test else "input.txt")
-    puzzle_input = read_input(file_path)
-    G = build_graph(puzzle_input)
-    print(f"Part 1: {count_paths_between_nodes(G, "you", "out")}")
-    print(f"Part 2: {count_paths_via_nodes(G, "svr", "out", ["fft", "dac"])}")
+    profiler = Profiler(profile=profile, memory=memory)
+    with profiler.phase("parse"):
+        puzzle_input = read_input(file_path)
+    with profiler.phase("part 1"):
+        print(f"Part 1: {part_1(puzzle_input)}")
+    with profiler.phase("part 2"):
+        print(f"Part 2: {part_2(puzzle_input)}")
+    profiler.report()
 
 
 if __name__ == "__main__":
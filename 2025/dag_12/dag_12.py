@@ -4,8 +4,10 @@ from typing import List
 
 import click
 
+from aoc.profiling import Profiler
 
-@dataclass
+
+@dataclass(slots=True)
 class Shape:
     pattern: list[list[str]]
     filled_count: int = 0
@@ -14,7 +16,7 @@ class Shape:
         self.filled_count = sum(1 for row in self.pattern for cell in row if cell == "#")
 
 
-@dataclass
+@dataclass(slots=True)
 class Region:
     x: int
     y: int
@@ -65,15 +67,25 @@ def region_can_fit_all_shapes(region: Region, shapes: List[Shape]) -> bool:
     return required_cells <= available_cells
 
 
+def part_1(puzzle_input: tuple[list[Shape], list[Region]]) -> int:
+    shapes, regions = puzzle_input
+    return sum(region_can_fit_all_shapes(region, shapes) for region in regions)
+
+
 @click.command()
 # test flag
 @click.option("--test", is_flag=True, help="Run with test input")
-def cli(test: bool) -> None:
+@click.option("--profile", is_flag=True, help="Run under cProfile and print the hot functions")
+@click.option("--memory", is_flag=True, help="Report peak memory and top allocations per phase")
+def cli(test: bool, profile: bool, memory: bool) -> None:
     """CLI function."""
     file_path = Path(__file__).parent / ("example.txt" if test else "input.txt")
-    shapes, regions = read_input(file_path)
-    result = sum(region_can_fit_all_shapes(region, shapes) for region in regions)
-    print(f"Result: {result}")
+    profiler = Profiler(profile=profile, memory=memory)
+    with profiler.phase("parse"):
+        puzzle_input = read_input(file_path)
+    with profiler.phase("part 1"):
+        print(f"Result: {part_1(puzzle_input)}")
+    profiler.report()
 
 
 if __name__ == "__main__":
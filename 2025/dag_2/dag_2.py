@@ -1,6 +1,14 @@
-def read_input() -> list[str]:
-    with open("2025/dag_2/input.txt") as f:
-        lines = f.read().split(",")
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+from aoc.interval import IntervalSet
+
+
+def read_input(file_path: Path) -> list[str]:
+    with open(file_path) as f:
+        lines = f.read().strip().split(",")
     return lines
 
 
@@ -10,41 +18,93 @@ def split_into_parts(s: str, x: int) -> list[str]:
     return [s[i * size : (i + 1) * size] for i in range(x)]
 
 
-def solution(ranges: list[str]) -> None:
-    sum_of_invalid_ids_part_1 = 0
-    sum_of_invalid_ids_part_2 = 0
+def values_in_ranges(ranges: list[str]) -> Iterator[int]:
     for r in ranges:
         start, stop = r.split("-")
-        for value in range(int(start), int(stop) + 1):
-            str_val = str(value)
-            str_len = len(str_val)
+        yield from range(int(start), int(stop) + 1)
+
+
+def parse_ranges(ranges: list[str]) -> IntervalSet:
+    return IntervalSet.from_inclusive(tuple(map(int, r.split("-"))) for r in ranges)
+
+
+def repeated_numbers(max_value: int, only_twice: bool) -> np.ndarray:
+    """All numbers up to `max_value` whose digits are a sequence repeated twice, or at least twice.
+
+    A sequence of `length` digits repeated `repeats` times is the sequence multiplied by
+    1, 10**length, 10**(2 * length), ... added up, e.g. 123123 = 123 * 1001.
+    """
+    numbers = []
+    for digits in range(2, len(str(max_value)) + 1):
+        for repeats in [2] if only_twice else range(2, digits + 1):
+            if digits % repeats != 0:
+                continue
+            length = digits // repeats
+            multiplier = sum(10 ** (length * i) for i in range(repeats))
+            numbers.append(np.arange(10 ** (length - 1), 10**length, dtype=np.int64) * multiplier)
+    # Numbers such as 222222 are repeated in multiple ways
+    numbers = np.unique(np.concatenate(numbers)) if numbers else np.zeros(0, dtype=np.int64)
+    return numbers[numbers <= max_value]
+
+
+def sum_of_invalid_ids(ranges: list[str], only_twice: bool) -> int:
+    """Look up every number made of a repeated sequence in the ranges, instead of checking every id."""
+    id_ranges = parse_ranges(ranges)
+    if len(id_ranges) == 0:
+        return 0
+    candidates = repeated_numbers(int(id_ranges.stops[-1]) - 1, only_twice)
+    return int(candidates[id_ranges.contains(candidates)].sum())
+
+
+def part_1(ranges: list[str]) -> int:
+    return sum_of_invalid_ids(ranges, only_twice=True)
+
+
+def part_2(ranges: list[str]) -> int:
+    return sum_of_invalid_ids(ranges, only_twice=False)
+
+
+def reference_part_1(ranges: list[str]) -> int:
+    """Check every id in every range."""
+    sum_of_invalid_ids = 0
+    for value in values_in_ranges(ranges):
+        str_val = str(value)
+
+        # Split into two parts if even
+        if len(str_val) % 2 == 0:
+            first_part, second_part = split_into_parts(str_val, 2)
+            if first_part == second_part:
+                sum_of_invalid_ids += value
+
+    return sum_of_invalid_ids
+
 
-            # Part 1: split into two parts if even
-            if len(str_val) % 2 == 0:
-                first_part, second_part = split_into_parts(str_val, 2)
-                if first_part == second_part:
-                    sum_of_invalid_ids_part_1 += value
+def reference_part_2(ranges: list[str]) -> int:
+    """Check every id in every range."""
+    sum_of_invalid_ids = 0
+    for value in values_in_ranges(ranges):
+        str_val = str(value)
+        str_len = len(str_val)
 
-            # Part 2: split into all possible divisors
-            divisors = [d for d in range(2, str_len + 1) if str_len % d == 0]
+        # Split into all possible divisors
+        divisors = [d for d in range(2, str_len + 1) if str_len % d == 0]
 
-            for d in divisors:
-                parts = split_into_parts(str_val, d)
+        for d in divisors:
+            parts = split_into_parts(str_val, d)
 
-                # check if all parts are equal
-                if parts.count(parts[0]) == len(parts):
-                    sum_of_invalid_ids_part_2 += value
-                    break
+            # check if all parts are equal
+            if parts.count(parts[0]) == len(parts):
+                sum_of_invalid_ids += value
+                break
 
-    print(f"Part 1: {sum_of_invalid_ids_part_1}")
-    print(f"Part 2: {sum_of_invalid_ids_part_2}")
+    return sum_of_invalid_ids
 
 
 def main() -> None:
     """Main function for day 2."""
-    ranges = read_input()
-    print("Running...")
-    solution(ranges)
+    ranges = read_input(Path(__file__).parent / "input.txt")
+    print(f"Part 1: {part_1(ranges)}")
+    print(f"Part 2: {part_2(ranges)}")
 
 
 if __name__ == "__main__":
@@ -1,14 +1,23 @@
-def read_input() -> list[list]:
-    with open("niek/2025/dag_3/input.txt") as f:
-        lines = f.read().splitlines()
+from pathlib import Path
+from typing import Iterable, Iterator
 
-    result = []
-    for line in lines:
-        battery_bank = []
-        for char in line:
-            battery_bank.append(int(char))
-        result.append(battery_bank)
-    return result
+from aoc.parallel import map_reduce
+from aoc.reader import read_records
+
+# Finding the joltage of a bank is cheap, only spread larger inputs over workers
+MIN_BANKS_IN_PARALLEL = 5000
+
+
+def parse_battery_bank(line: str) -> list[int]:
+    return [int(char) for char in line]
+
+
+def stream_input(file_path: Path) -> Iterator[list[int]]:
+    return read_records(file_path, parse_battery_bank)
+
+
+def read_input(file_path: Path) -> list[list[int]]:
+    return list(stream_input(file_path))
 
 
 def max_joltage(batteries: list[int], no_of_batteries: int = 12) -> int:
@@ -33,16 +42,19 @@ def max_joltage(batteries: list[int], no_of_batteries: int = 12) -> int:
     return int("".join(result))
 
 
+def part_1(battery_banks: Iterable[list[int]]) -> int:
+    return map_reduce(max_joltage, battery_banks, context=2, min_records=MIN_BANKS_IN_PARALLEL)
+
+
+def part_2(battery_banks: Iterable[list[int]]) -> int:
+    return map_reduce(max_joltage, battery_banks, context=12, min_records=MIN_BANKS_IN_PARALLEL)
+
+
 def main() -> None:
     """Main function for day 3."""
-    battery_banks = read_input()
-    p1 = 0
-    p2 = 0
-    for battery_bank in battery_banks:
-        p1 += max_joltage(battery_bank, no_of_batteries=2)
-        p2 += max_joltage(battery_bank, no_of_batteries=12)
-    print(f"Part 1: {p1}")
-    print(f"Part 2: {p2}")
+    battery_banks = read_input(Path(__file__).parent / "input.txt")
+    print(f"Part 1: {part_1(battery_banks)}")
+    print(f"Part 2: {part_2(battery_banks)}")
 
 
 if __name__ == "__main__":
@@ -1,19 +1,46 @@
-def read_input() -> tuple[list[tuple[int, int]], list[int]]:
-    with open("2025/dag_5/input.txt") as f:
-        lines = f.read().splitlines()
-    sep = lines.index("")
+from itertools import batched, takewhile
+from pathlib import Path
+from typing import Iterable, Iterator
 
-    ingredient_ids = [int(v) for v in lines[sep + 1 :]]
+from aoc.interval import IntervalSet
+from aoc.reader import read_lines
 
-    id_ranges = []
-    for r in lines[:sep]:
-        s, e = r.split("-")
-        id_ranges.append((int(s), int(e)))
+# Ids are looked up in batches, so a stream of ids is processed in constant memory
+BATCH_SIZE = 65536
 
+
+def parse_range(line: str) -> tuple[int, int]:
+    s, e = line.split("-")
+    return int(s), int(e)
+
+
+def stream_input(file_path: Path) -> tuple[list[tuple[int, int]], Iterator[int]]:
+    """Read the id ranges, which are needed for every id, and lazily read the ingredient ids after them."""
+    lines = read_lines(file_path)
+    id_ranges = [parse_range(line) for line in takewhile(bool, lines)]
+    ingredient_ids = (int(line) for line in lines if line)
     return id_ranges, ingredient_ids
 
 
-def part_1(id_ranges: list[tuple[int, int]], ingredient_ids: list[int]) -> int:
+def read_input(file_path: Path) -> tuple[list[tuple[int, int]], list[int]]:
+    id_ranges, ingredient_ids = stream_input(file_path)
+    return id_ranges, list(ingredient_ids)
+
+
+def part_1(puzzle_input: tuple[list[tuple[int, int]], Iterable[int]]) -> int:
+    id_ranges, ingredient_ids = puzzle_input
+    fresh = IntervalSet.from_inclusive(id_ranges)
+    return sum(int(fresh.contains(batch).sum()) for batch in batched(ingredient_ids, BATCH_SIZE))
+
+
+def part_2(puzzle_input: tuple[list[tuple[int, int]], Iterable[int]]) -> int:
+    id_ranges, _ = puzzle_input
+    return IntervalSet.from_inclusive(id_ranges).length
+
+
+def reference_part_1(puzzle_input: tuple[list[tuple[int, int]], Iterable[int]]) -> int:
+    """Check every id against every range."""
+    id_ranges, ingredient_ids = puzzle_input
     fresh_ingredients = 0
     for ingredient in ingredient_ids:
         for r in id_ranges:
@@ -23,7 +50,9 @@ def part_1(id_ranges: list[tuple[int, int]], ingredient_ids: list[int]) -> int:
     return fresh_ingredients
 
 
-def part_2(id_ranges: list[tuple[int, int]]) -> int:
+def reference_part_2(puzzle_input: tuple[list[tuple[int, int]], Iterable[int]]) -> int:
+    """Sort and merge the ranges."""
+    id_ranges, _ = puzzle_input
     # Sort id ranges
     id_ranges = sorted(id_ranges, key=lambda x: x[0])
 
@@ -47,9 +76,9 @@ def part_2(id_ranges: list[tuple[int, int]]) -> int:
 
 
 def main() -> None:
-    id_ranges, ingredient_ids = read_input()
-    print(f"Part 1: {part_1(id_ranges, ingredient_ids)}")
-    print(f"Part 2: {part_2(id_ranges)}")
+    puzzle_input = read_input(Path(__file__).parent / "input.txt")
+    print(f"Part 1: {part_1(puzzle_input)}")
+    print(f"Part 2: {part_2(puzzle_input)}")
 
 
 if __name__ == "__main__":
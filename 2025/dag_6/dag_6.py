@@ -1,8 +1,9 @@
 import math
+from pathlib import Path
 
 
-def read_input() -> list[str]:
-    with open("2025/dag_6/input.txt") as f:
+def read_input(file_path: Path) -> list[str]:
+    with open(file_path) as f:
         return f.read().splitlines()
 
 
@@ -59,7 +60,7 @@ def part_2(lines: list[str]) -> int:
 
 def main() -> None:
     """Main function for day 6."""
-    lines = read_input()
+    lines = read_input(Path(__file__).parent / "input.txt")
     print(f"Part 1: {part_1(lines)}")
     print(f"Part 2: {part_2(lines)}")
 
@@ -1,93 +1,70 @@
-from functools import lru_cache
 from pathlib import Path
-from typing import Generator
 
 import click
+import numpy as np
 
+from aoc.grid import Grid
+from aoc.profiling import Profiler
 
-def read_input(file_path: Path) -> list[list[str]]:
-    """Read input."""
-    with open(file_path) as f:
-        return [list(line) for line in f.read().splitlines()]
 
+def read_input(file_path: Path) -> Grid:
+    """Read input."""
+    return Grid.read(file_path)
 
-def part_1(puzzle_input: list[list[str]]) -> int:
-    start_pos = (0, puzzle_input[0].index("S"))
-    rows, cols = len(puzzle_input), len(puzzle_input[0])
 
-    current_beams_cols = [start_pos[1]]
-    total_times_splitted = 0
+def split_beams(beams: np.ndarray, splitters: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Move the beams one row down, splitting the beams that reach a splitter to the left and right.
 
-    # Move downwards from the start position
-    for i in range(1, rows):
-        # for every beam col, check if reach splitter (^) or empty space (.)
-        beams_to_check = current_beams_cols.copy()
-        for beam_col in beams_to_check:
-            cell = puzzle_input[i][beam_col]
-            # beam continues downwards
-            if cell == ".":
-                puzzle_input[i][beam_col] = "|"
-            # beam reaches splitter
-            elif cell == "^":
-                # split beam to left and right
-                if beam_col - 1 >= 0 and (beam_col - 1) not in current_beams_cols:
-                    current_beams_cols.append(beam_col - 1)
-                    puzzle_input[i][beam_col - 1] = "|"
-                if beam_col + 1 < cols and (beam_col + 1) not in current_beams_cols:
-                    current_beams_cols.append(beam_col + 1)
-                    puzzle_input[i][beam_col + 1] = "|"
-
-                # Remove current beam as it splits
-                current_beams_cols.remove(beam_col)
-
-                total_times_splitted += 1
+    Beams are counted per column, so beams that end up in the same column are added together.
+    Returns the beams that reached a splitter and the beams in the next row.
+    """
+    hits = np.where(splitters, beams, 0)
+    next_beams = np.where(splitters, 0, beams)
+    next_beams[:-1] += hits[1:]
+    next_beams[1:] += hits[:-1]
+    return hits, next_beams
 
-    return total_times_splitted
 
+def trace_beams(manifold: Grid) -> tuple[int, int]:
+    """Count how often the beams split and the number of timelines a single particle ends up in."""
+    # Python integers, as the number of timelines grows exponentially with the number of splitters
+    timelines = np.zeros(manifold.cols, dtype=object)
+    timelines[manifold.find("S")[1]] = 1
+    splitters = manifold.cells == ord("^")
 
-def part_2(puzzle_input: list[list[str]]) -> int:
-    rows, cols = len(puzzle_input), len(puzzle_input[0])
-
-    def neighbors(r: int, c: int) -> Generator:
-        nr = r + 1
-        if nr >= rows:
-            # No valid neighbors beyond last row
-            return
+    total_times_splitted = 0
+    for row in splitters[1:]:
+        hits, timelines = split_beams(timelines, row)
+        total_times_splitted += int(np.count_nonzero(hits))
 
-        # Continue vertically down if beam
-        if puzzle_input[nr][c] == "|":
-            yield nr, c
+    return total_times_splitted, int(timelines.sum())
 
-        # If splitter, track down left and right
-        if puzzle_input[nr][c] == "^":
-            if c - 1 >= 0 and puzzle_input[nr][c - 1] == "|":
-                yield nr, c - 1
-            if c + 1 < cols and puzzle_input[nr][c + 1] == "|":
-                yield nr, c + 1
 
-    @lru_cache(maxsize=None)
-    def dfs(r: int, c: int) -> int:
-        # Add valid path if reached bottom row
-        if r == rows - 1:
-            return 1
+def part_1(manifold: Grid) -> int:
+    total_times_splitted, _ = trace_beams(manifold)
+    return total_times_splitted
 
-        total = 0
-        for nr, nc in neighbors(r, c):
-            total += dfs(nr, nc)
-        return total
 
-    start_col = puzzle_input[0].index("S")
-    return dfs(0, start_col)
+def part_2(manifold: Grid) -> int:
+    _, timelines = trace_beams(manifold)
+    return timelines
 
 
 @click.command()
 @click.option("--test", is_flag=True, help="Run with test input")
-def cli(test: bool) -> None:
+@click.option("--profile", is_flag=True, help="Run under cProfile and print the hot functions")
+@click.option("--memory", is_flag=True, help="Report peak memory and top allocations per phase")
+def cli(test: bool, profile: bool, memory: bool) -> None:
     """CLI function."""
     file_path = Path(__file__).parent / ("example.txt" if test else "input.txt")
-    puzzle_input = read_input(file_path)
-    print(f"Part 1: {part_1(puzzle_input)}")
-    print(f"Part 2: {part_2(puzzle_input)}")
+    profiler = Profiler(profile=profile, memory=memory)
+    with profiler.phase("parse"):
+        puzzle_input = read_input(file_path)
+    with profiler.phase("part 1"):
+        print(f"Part 1: {part_1(puzzle_input)}")
+    with profiler.phase("part 2"):
+        print(f"Part 2: {part_2(puzzle_input)}")
+    profiler.report()
 
 
 if __name__ == "__main__":
@@ -2,30 +2,34 @@ import math
 from pathlib import Path
 
 import click
-import networkx as nx
 import numpy as np
 
+from aoc.graph import Graph, connected_components, count_components
+from aoc.profiling import Profiler
+from aoc.tokenizer import read_integers
+
+# The distance between every pair of boxes is computed
+EXPECTED_COMPLEXITY = {"part_1": 2, "part_2": 2}
+# The example connects the 10 closest pairs, a real input the 1000 closest pairs
+PART_ARGUMENTS = {"part_1": {"no_of_iterations": 1000}}
+
 
 def read_input(file_path: Path) -> list:
-    """Read input."""
-    with open(file_path) as f:
-        vectors = []
-        for line in f.read().splitlines():
-            vectors.append(tuple(int(c) for c in line.split(",")))
-        return vectors
+    """Read input, three coordinates per line."""
+    return [tuple(vector) for vector in read_integers(file_path).reshape(-1, 3).tolist()]
 
 
-def k_closest_pairs(vectors: list[tuple], k: int = None) -> list[tuple]:
+def k_closest_pairs(vectors: list[tuple], k: int = None) -> tuple[np.ndarray, np.ndarray]:
     """Compute the k closest vector pairs.
 
     Uses exact Euclidean distance. All pairwise distances are computed once,
     then the k smallest distinct pairs (i < j) are selected and returned
-    in ascending order of distance.
+    in ascending order of distance, as the indices i and j of the vectors.
     """
     X = np.asarray(vectors, dtype=np.float32)
     n = X.shape[0]
     if n < 2:
-        return []
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
 
     s = np.sum(X * X, axis=1)
     D2 = s[:, None] + s[None, :] - 2.0 * (X @ X.T)
@@ -40,52 +44,58 @@ def k_closest_pairs(vectors: list[tuple], k: int = None) -> list[tuple]:
         sel = np.argpartition(d2, k - 1)[:k]
         order = sel[np.argsort(d2[sel])]
 
-    out = []
-    for idx in order:
-        i, j = int(iu[idx]), int(ju[idx])
-        out.append((tuple(vectors[i]), tuple(vectors[j])))
-
-    return out
+    return iu[order], ju[order]
 
 
 def part_1(puzzle_input: list, no_of_iterations: int = 10) -> int:
-    graph = nx.Graph()
-    graph.add_nodes_from(puzzle_input)
-
-    for pair in k_closest_pairs(puzzle_input, k=no_of_iterations):
-        graph.add_edge(*pair)
+    iu, ju = k_closest_pairs(puzzle_input, k=no_of_iterations)
+    labels = connected_components(Graph.from_edges(len(puzzle_input), iu, ju, undirected=True))
 
     # Get the largest 3 results and multiply
-    result = [len(v) for v in sorted(nx.connected_components(graph), key=len, reverse=True)]
+    sizes = np.bincount(labels)
+    result = sorted(sizes[np.unique(labels)].tolist(), reverse=True)
     return math.prod(result[:3])
 
 
 def part_2(puzzle_input: list) -> int:
-    graph = nx.Graph()
-    graph.add_nodes_from(puzzle_input)
-
-    pairs = k_closest_pairs(puzzle_input)
+    if len(puzzle_input) < 2:
+        # A single box is connected without any pair, so there is no last pair to multiply
+        return 0
+    iu, ju = k_closest_pairs(puzzle_input)
 
-    last_connected_pair = None
-    for pair in pairs:
-        if nx.number_connected_components(graph) == 1:
-            break
+    def is_connected(no_of_pairs: int) -> bool:
+        graph = Graph.from_edges(len(puzzle_input), iu[:no_of_pairs], ju[:no_of_pairs], undirected=True)
+        return count_components(connected_components(graph)) == 1
 
-        graph.add_edge(*pair)
-        last_connected_pair = pair
+    # Once all boxes are connected they stay connected, so binary search the first pair that connects them
+    low, high = 0, len(iu)
+    while high - low > 1:
+        middle = (low + high) // 2
+        if is_connected(middle):
+            high = middle
+        else:
+            low = middle
 
-    return last_connected_pair[0][0] * last_connected_pair[1][0]
+    i, j = iu[high - 1], ju[high - 1]
+    return puzzle_input[i][0] * puzzle_input[j][0]
 
 
 @click.command()
 # test flag
 @click.option("--test", is_flag=True, help="Run with test input")
-def cli(test: bool) -> None:
+@click.option("--profile", is_flag=True, help="Run under cProfile and print the hot functions")
+@click.option("--memory", is_flag=True, help="Report peak memory and top allocations per phase")
+def cli(test: bool, profile: bool, memory: bool) -> None:
     """CLI function."""
     file_path = Path(__file__).parent / ("example.txt" if test else "input.txt")
-    puzzle_input = read_input(file_path)
-    print(f"Part 1: {part_1(puzzle_input, no_of_iterations=1000 if not test else 10)}")
-    print(f"Part 2: {part_2(puzzle_input)}")
+    profiler = Profiler(profile=profile, memory=memory)
+    with profiler.phase("parse"):
+        puzzle_input = read_input(file_path)
+    with profiler.phase("part 1"):
+        print(f"Part 1: {part_1(puzzle_input, no_of_iterations=1000 if not test else 10)}")
+    with profiler.phase("part 2"):
+        print(f"Part 2: {part_2(puzzle_input)}")
+    profiler.report()
 
 
 if __name__ == "__main__":
@@ -2,15 +2,19 @@ import random
 from pathlib import Path
 
 import click
-from matplotlib import path
+
+from aoc.lazy import lazy_import
+from aoc.profiling import Profiler
+from aoc.tokenizer import read_integers
+
+path = lazy_import("matplotlib.path")
+
+# Every pair of red tiles is a candidate rectangle, part 2 checks its border against the whole polygon
+EXPECTED_COMPLEXITY = {"part_1": 2, "part_2": 3}
 
 
 def read_input(file_path: Path) -> list[list[int]]:
-    with open(file_path) as f:
-        return [
-            [int(x) for x in line.split(",")]
-            for line in f.read().splitlines()
-        ]
+    return read_integers(file_path).reshape(-1, 2).tolist()
 
 
 def rectangle_other_corners(p1, p2):
@@ -46,45 +50,65 @@ def calc_bounds(corners, step=10):
     random.shuffle(boundary)
     return boundary
 
+
 def within_bounds(poly_path, points: list[tuple[int, int]]) -> bool:
     for point in points:
         if not poly_path.contains_point(point, radius=1):
             return False
     return True
 
-def solution(poly: list[list[int]]) -> None:
+
+def rectangle_area(p1: list[int], p2: list[int]) -> int:
+    x1, y1 = p1
+    x2, y2 = p2
+    return (abs(x1 - x2) + 1) * (abs(y1 - y2) + 1)
+
+
+def part_1(poly: list[list[int]]) -> int:
+    largest_rectangle_area = 0
+    for p1 in poly:
+        for p2 in poly:
+            if p1 == p2:
+                continue
+            largest_rectangle_area = max(largest_rectangle_area, rectangle_area(p1, p2))
+    return largest_rectangle_area
+
+
+def part_2(poly: list[list[int]]) -> int:
     poly_path = path.Path(poly + [poly[0]])
 
-    largest_rectangle_area_p1 = 0
-    largest_rectangle_area_p2 = 0
+    largest_rectangle_area = 0
     for p1 in poly:
         for p2 in poly:
             if p1 == p2:
                 continue
-            x1, y1 = p1
-            x2, y2 = p2
-            rectangle_area = (abs(x1 - x2) + 1) * (abs(y1 - y2) + 1)
-            if rectangle_area > largest_rectangle_area_p1:
-                largest_rectangle_area_p1 = rectangle_area
-            if rectangle_area > largest_rectangle_area_p2:
+            area = rectangle_area(p1, p2)
+            if area > largest_rectangle_area:
                 p3, p4 = rectangle_other_corners(p1, p2)
                 corners = [p1, p2, p3, p4]
                 if within_bounds(poly_path, corners):
                     if within_bounds(poly_path, calc_bounds(corners)):
-                        print(f"Found largest rectangle area: {rectangle_area} with {p1} and {p2}")
-                        largest_rectangle_area_p2 = rectangle_area
+                        largest_rectangle_area = area
+
+    return largest_rectangle_area
 
-    print(f"Part 1: {largest_rectangle_area_p1}")
-    print(f"Part 2: {largest_rectangle_area_p2}")
 
 @click.command()
 # test flag
 @click.option("--test", is_flag=True, help="Run with test input")
-def cli(test: bool) -> None:
+@click.option("--profile", is_flag=True, help="Run under cProfile and print the hot functions")
+@click.option("--memory", is_flag=True, help="Report peak memory and top allocations per phase")
+def cli(test: bool, profile: bool, memory: bool) -> None:
     """CLI function."""
     file_path = Path(__file__).parent / ("example.txt" if test else "input.txt")
-    puzzle_input = read_input(file_path)
-    solution(puzzle_input)
+    profiler = Profiler(profile=profile, memory=memory)
+    with profiler.phase("parse"):
+        puzzle_input = read_input(file_path)
+    with profiler.phase("part 1"):
+        print(f"Part 1: {part_1(puzzle_input)}")
+    with profiler.phase("part 2"):
+        print(f"Part 2: {part_2(puzzle_input)}")
+    profiler.report()
 
 
 if __name__ == "__main__":
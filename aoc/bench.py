@@ -0,0 +1,200 @@
+import functools
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from aoc.cache import cached_read_input
+from aoc.discovery import ROOT, Day
+from aoc.memo import clear_caches
+from aoc.memory import memory_limit
+from aoc.parallel import limit_workers
+from aoc.runner import PARTS, part_solver
+
+HISTORY_PATH = ROOT / ".benchmarks" / "history.json"
+
+
+@dataclass
+class PhaseTimings:
+    """Timings of repeated runs of a single phase."""
+
+    times: list[float] = field(default_factory=list)
+
+    @property
+    def median(self) -> float:
+        """Median of the measured times."""
+        return statistics.median(self.times)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summary of the timings for the history file."""
+        return {"median": self.median, "min": min(self.times), "max": max(self.times), "times": self.times}
+
+
+@dataclass
+class Regression:
+    """A phase of a day that got slower than allowed."""
+
+    day: str
+    phase: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """How much slower the current median is compared to the baseline."""
+        return self.current / self.baseline
+
+
+def benchmark_day(
+    day: Day,
+    input_path: Path | None = None,
+    warmup: int = 1,
+    repeat: int = 5,
+    cache: bool = False,
+    workers: int = 1,
+    max_memory: int | None = None,
+) -> dict[str, PhaseTimings]:
+    """Time the parse, part 1 and part 2 phases of a day.
+
+    The warmup runs are not recorded. Every repetition clears the memoized functions of the
+    day and parses the input again, so neither a warm cache nor a part that mutates its
+    input influences the next repetition. With `cache`, the
+    input comes from the parse cache instead, so the parse phase measures loading it.
+    Solutions that use `map_reduce` run with at most `workers` workers, by default serially,
+    so the timings do not include starting a pool of workers.
+
+    With `max_memory`, an extra unrecorded run first checks that no phase uses more than
+    `max_memory` bytes, raising MemoryLimitExceeded otherwise. The ceiling needs tracemalloc,
+    which would slow down the recorded runs.
+    """
+    module = day.load()
+    input_path = input_path or day.input_path()
+    read_input = module.read_input
+    if cache:
+        read_input = functools.partial(cached_read_input, module.read_input)
+    solvers = {part: solve for part in PARTS if (solve := part_solver(module, part)) is not None}
+
+    timings = {phase: PhaseTimings() for phase in ("parse", *solvers)}
+    with limit_workers(workers):
+        if max_memory is not None:
+            with memory_limit(max_memory):
+                puzzle_input = read_input(input_path)
+            for solve in solvers.values():
+                with memory_limit(max_memory):
+                    solve(puzzle_input)
+            puzzle_input = None
+
+        for i in range(warmup + repeat):
+            clear_caches(module)
+            start = time.perf_counter()
+            puzzle_input = read_input(input_path)
+            elapsed = {"parse": time.perf_counter() - start}
+
+            for part, solve in solvers.items():
+                start = time.perf_counter()
+                solve(puzzle_input)
+                elapsed[part] = time.perf_counter() - start
+
+            if i >= warmup:
+                for phase, seconds in elapsed.items():
+                    timings[phase].times.append(seconds)
+
+    return timings
+
+
+def benchmark_startup(day: Day, repeat: int = 5) -> PhaseTimings:
+    """Time importing the solution of a day in a fresh interpreter.
+
+    Every repetition starts a new process, so the imports of the day are not cached
+    and the measurement includes the cost of every dependency it imports at load time.
+    """
+    code = (
+        "import time\n"
+        "from aoc.discovery import load_module\n"
+        "start = time.perf_counter()\n"
+        f"load_module({str(day.path)!r}, {day.module_name!r})\n"
+        "print(time.perf_counter() - start)\n"
+    )
+
+    timings = PhaseTimings()
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        timings.times.append(float(output.stdout.strip().splitlines()[-1]))
+    return timings
+
+
+def current_commit() -> str | None:
+    """Short hash of the checked out commit, if available."""
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def load_history(path: Path = HISTORY_PATH) -> list[dict[str, Any]]:
+    """Load all recorded benchmark runs, oldest first."""
+    if not path.exists():
+        return []
+    with open(path) as f:
+        return json.load(f)["runs"]
+
+
+def save_run(results: dict[str, dict[str, PhaseTimings]], label: str | None = None, path: Path = HISTORY_PATH) -> dict:
+    """Append a benchmark run to the history file."""
+    run = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": current_commit(),
+        "label": label,
+        "python": platform.python_version(),
+        "machine": platform.node(),
+        "results": {
+            day: {phase: timings.to_dict() for phase, timings in phases.items()} for day, phases in results.items()
+        },
+    }
+    runs = load_history(path)
+    runs.append(run)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"runs": runs}, f, indent=2)
+    return run
+
+
+def find_run(runs: list[dict[str, Any]], reference: str) -> dict[str, Any]:
+    """Find a run by its index in the history (negative counts from the end), label or commit."""
+    try:
+        return runs[int(reference)]
+    except ValueError:
+        pass
+    except IndexError:
+        raise KeyError(f"No run with index {reference}")
+
+    for run in reversed(runs):
+        if reference in (run.get("label"), run.get("commit")):
+            return run
+    raise KeyError(f"No run with label or commit {reference}")
+
+
+def compare_runs(baseline: dict[str, Any], current: dict[str, Any], threshold: float = 0.1) -> list[Regression]:
+    """Find the phases whose median got worse by more than the threshold (0.1 means 10%).
+
+    Days or phases that are missing from one of the runs are ignored.
+    """
+    regressions = []
+    for day, phases in current["results"].items():
+        for phase, timings in phases.items():
+            baseline_timings = baseline["results"].get(day, {}).get(phase)
+            if baseline_timings is None:
+                continue
+            if timings["median"] > baseline_timings["median"] * (1 + threshold):
+                regressions.append(Regression(day, phase, baseline_timings["median"], timings["median"]))
+    return regressions
@@ -0,0 +1,118 @@
+"""Time budgets that cancel solutions which run for too long.
+
+A budget sets a deadline, after which a `BudgetExceeded` is raised in the main thread of
+the process by a SIGALRM timer, so pure Python loops are interrupted wherever they are.
+Budgets nest, the earliest deadline wins. Work outside of Python can't be interrupted
+by a signal, so solvers such as CP-SAT are given `remaining()` as their own time limit.
+
+Long loops can report how many records they processed with `advance`, which is included
+in the report of a cancelled phase.
+"""
+
+import contextlib
+import signal
+import threading
+import time
+from typing import Iterator
+
+# Deadline of the innermost budget as a time.time() timestamp, comparable between processes
+_deadline: float | None = None
+# Whether the timer runs for the current deadline
+_timed = False
+_progress = 0
+
+
+class BudgetExceeded(Exception):
+    """The time budget of a day or part ran out."""
+
+
+@contextlib.contextmanager
+def time_budget(seconds: float | None) -> Iterator[None]:
+    """Raise BudgetExceeded when the with block runs longer than `seconds`.
+
+    With None, the block is only limited by the enclosing budgets. Outside of the main
+    thread, no timer can be set and only `remaining()` is limited.
+    """
+    global _deadline, _timed
+    previous, previous_timed = _deadline, _timed
+    if seconds is not None:
+        end = time.time() + seconds
+        _deadline = end if previous is None else min(previous, end)
+    if _deadline is None or not _can_signal():
+        try:
+            yield
+        finally:
+            _deadline = previous
+        return
+
+    previous_handler = signal.signal(signal.SIGALRM, _raise_exceeded)
+    _start_timer(_deadline)
+    _timed = True
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+        _deadline, _timed = previous, previous_timed
+        # The timer is shared, so it is started again for the enclosing budget
+        if previous_timed:
+            _start_timer(previous)
+
+
+def set_deadline(deadline: float | None) -> None:
+    """Limit the rest of this process to the deadline of another process, e.g. in a worker.
+
+    No timer is started, so only `remaining()`, `check()` and the blocks of `time_budget` are limited.
+    """
+    global _deadline
+    _deadline = deadline
+
+
+def deadline() -> float | None:
+    """Deadline of the innermost budget as a time.time() timestamp, None without a budget."""
+    return _deadline
+
+
+def remaining() -> float | None:
+    """Seconds left of the innermost budget, None without a budget."""
+    return None if _deadline is None else max(_deadline - time.time(), 0.0)
+
+
+def check() -> None:
+    """Raise BudgetExceeded when the deadline has passed, for code that is not interrupted by the timer."""
+    if _deadline is not None and time.time() >= _deadline:
+        raise BudgetExceeded("Time budget exceeded")
+
+
+def advance(records: int = 1) -> None:
+    """Count processed records, reported when a phase is cancelled."""
+    global _progress
+    _progress += records
+
+
+def reset_progress() -> int:
+    """Number of records counted by `advance` since the last reset."""
+    global _progress
+    progress, _progress = _progress, 0
+    return progress
+
+
+def exceeded(error: BaseException) -> bool:
+    """Whether an error is caused by an exceeded budget, e.g. an import that was interrupted by the timer."""
+    while error is not None:
+        if isinstance(error, BudgetExceeded):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def _start_timer(deadline: float) -> None:
+    signal.setitimer(signal.ITIMER_REAL, max(deadline - time.time(), 1e-6))
+
+
+def _can_signal() -> bool:
+    return hasattr(signal, "SIGALRM") and threading.current_thread() is threading.main_thread()
+
+
+def _raise_exceeded(signum: int, frame: object) -> None:
+    raise BudgetExceeded("Time budget exceeded")
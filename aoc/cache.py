@@ -0,0 +1,136 @@
+"""On-disk cache of parsed puzzle inputs.
+
+Entries are keyed by the hash of the input file, the source of the module that defines
+`read_input` and the source of the `aoc` modules it uses (such as `aoc.grid`), so editing
+either the input or the parser invalidates the entry. The cache is bounded in size: when
+it grows too large, the least recently used entries are removed. Memory-mapped inputs
+are never cached, as a cache entry would undo their zero-copy load.
+"""
+
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, TypeVar
+
+from aoc.discovery import ROOT
+from aoc.reader import is_mapped
+
+CACHE_DIRECTORY = ROOT / ".cache" / "parsed"
+MAX_CACHE_BYTES = 256 * 1024**2
+
+T = TypeVar("T")
+
+
+def local_imports(module: ModuleType) -> list[ModuleType]:
+    """The `aoc` modules that a module uses, directly or through other `aoc` modules, sorted by name.
+
+    A module is found through the names it imported, e.g. `from aoc.grid import Grid`.
+    """
+    found: dict[str, ModuleType] = {}
+    pending = [module]
+    while pending:
+        for value in vars(pending.pop()).values():
+            name = value.__name__ if isinstance(value, ModuleType) else getattr(value, "__module__", None)
+            if not isinstance(name, str) or not name.startswith("aoc.") or name in found:
+                continue
+            if (imported := sys.modules.get(name)) is not None:
+                found[name] = imported
+                pending.append(imported)
+    return [found[name] for name in sorted(found)]
+
+
+def source_hash(module: ModuleType) -> bytes:
+    """Hash of the source of a module and of the `aoc` modules it uses."""
+    digest = hashlib.sha256()
+    for source_module in [module, *local_imports(module)]:
+        digest.update(Path(inspect.getfile(source_module)).read_bytes())
+    return digest.digest()
+
+
+def cache_key(read_input: Callable[[Path], Any], file_path: Path) -> str:
+    """Hash of the input file, the source of the parser and the `aoc` modules it uses."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        digest.update(hashlib.file_digest(f, "sha256").digest())
+    digest.update(source_hash(inspect.getmodule(read_input)))
+    digest.update(read_input.__qualname__.encode())
+    return digest.hexdigest()
+
+
+def cached_read_input(
+    read_input: Callable[[Path], T],
+    file_path: Path,
+    directory: Path = CACHE_DIRECTORY,
+    max_bytes: int = MAX_CACHE_BYTES,
+) -> T:
+    """Return the parsed input from the cache, parsing and storing it on a miss.
+
+    Parsed inputs that cannot be pickled are returned without being cached, and so are
+    memory-mapped inputs: loading them takes constant time, while a cache entry would be a
+    full copy. A day whose parser maps its input sets `PARSE_CACHE = False`, so the input
+    is not even hashed.
+    """
+    if not getattr(inspect.getmodule(read_input), "PARSE_CACHE", True):
+        return read_input(file_path)
+
+    path = directory / f"{cache_key(read_input, file_path)}.pickle"
+    try:
+        with open(path, "rb") as f:
+            puzzle_input = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        pass
+    else:
+        # Mark the entry as recently used for the eviction
+        os.utime(path)
+        return puzzle_input
+
+    puzzle_input = read_input(file_path)
+    if is_mapped(puzzle_input):
+        return puzzle_input
+    try:
+        data = pickle.dumps(puzzle_input, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return puzzle_input
+
+    directory.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first, other processes of the runner may read the same entry
+    with tempfile.NamedTemporaryFile(dir=directory, suffix=".tmp", delete=False) as f:
+        f.write(data)
+    os.replace(f.name, path)
+
+    evict(directory, max_bytes)
+    return puzzle_input
+
+
+def evict(directory: Path = CACHE_DIRECTORY, max_bytes: int = MAX_CACHE_BYTES) -> int:
+    """Remove the least recently used entries until the cache fits in `max_bytes`.
+
+    Returns the number of removed entries.
+    """
+    entries = []
+    for path in directory.glob("*.pickle"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    return removed
+
+
+def clear_cache(directory: Path = CACHE_DIRECTORY) -> int:
+    """Remove all entries, returning the number of removed entries."""
+    return evict(directory, max_bytes=0)
@@ -0,0 +1,471 @@
+import time
+from pathlib import Path
+
+import click
+
+from aoc.bench import (
+    HISTORY_PATH,
+    PhaseTimings,
+    Regression,
+    benchmark_day,
+    benchmark_startup,
+    compare_runs,
+    find_run,
+    load_history,
+    save_run,
+)
+from aoc.cache import CACHE_DIRECTORY, clear_cache
+from aoc.complexity import estimate_complexity
+from aoc.cpu import set_cpu_budget
+from aoc.daemon import MAX_INPUTS, SOCKET_PATH, send_request, serve
+from aoc.differential import differential_test, reference_parts
+from aoc.discovery import discover_days
+from aoc.generators import generate, write_input
+from aoc.memory import MemoryLimitExceeded
+from aoc.records import bytes_per_record, find_records
+from aoc.runner import (
+    PARTS,
+    DayResult,
+    PhaseResult,
+    format_batch_header,
+    format_batch_row,
+    format_result,
+    format_seconds,
+    resolve_inputs,
+    run_batch,
+    run_days,
+)
+from aoc.store import STORE_DIRECTORY
+from aoc.telemetry import TELEMETRY_PATH, TelemetryWriter
+
+
+@click.group()
+def cli() -> None:
+    """Run and measure the Advent of Code solutions."""
+
+
+@cli.command()
+@click.argument("years", type=int, nargs=-1)
+@click.option("--day", "-d", "days", type=int, multiple=True, help="Only run the given day(s)")
+@click.option("--test", is_flag=True, help="Run with test input")
+@click.option(
+    "--workers", "-j", type=int, default=None, help="Number of worker processes, defaults to one per core of --cpus"
+)
+@click.option("--cpus", type=int, help="Cores shared by the workers, map_reduce and solvers, defaults to all cores")
+@click.option("--cache/--no-cache", default=True, show_default=True, help="Reuse parsed inputs from the parse cache")
+@click.option("--stream", is_flag=True, help="Solve days that support it from a stream of records, in constant memory")
+@click.option(
+    "--store/--no-store", default=True, show_default=True, help="Reuse answers of days with unchanged source and input"
+)
+@click.option("--day-budget", type=float, help="Cancel a day after this many seconds")
+@click.option("--part-budget", type=float, help="Cancel a part after this many seconds")
+@click.option("--memory", is_flag=True, help="Report the peak RSS and tracemalloc peak of every phase")
+@click.option("--max-memory", type=float, help="Abort a phase that uses more than this many MiB")
+@click.option("--counts", is_flag=True, help="Report the operations that the solutions count, e.g. states expanded")
+@click.option("--telemetry", type=click.Path(path_type=Path), default=TELEMETRY_PATH, show_default=True)
+@click.option("--no-telemetry", is_flag=True, help="Do not append a JSON line per phase to the telemetry file")
+def run(
+    years: tuple[int, ...],
+    days: tuple[int, ...],
+    test: bool,
+    workers: int | None,
+    cpus: int | None,
+    cache: bool,
+    stream: bool,
+    store: bool,
+    day_budget: float | None,
+    part_budget: float | None,
+    memory: bool,
+    max_memory: float | None,
+    counts: bool,
+    telemetry: Path,
+    no_telemetry: bool,
+) -> None:
+    """Run all days of the given years."""
+    selected = discover_days(years=years, days=days)
+    if not selected:
+        raise click.ClickException("No days found")
+
+    set_cpu_budget(cpus)
+    start = time.perf_counter()
+    failed = aborted = 0
+    results = run_days(
+        selected,
+        workers=workers,
+        test=test,
+        cache=cache,
+        stream=stream,
+        store=store,
+        day_budget=day_budget,
+        part_budget=part_budget,
+        memory=memory,
+        max_memory=mebibytes(max_memory),
+        counts=counts,
+    )
+    with TelemetryWriter(None if no_telemetry else telemetry) as writer:
+        for result in results:
+            click.echo(format_result(result))
+            writer.write(result)
+            failed += result.error is not None
+            aborted += result.aborted is not None
+
+    click.echo(f"Ran {len(selected)} day(s) in {format_seconds(time.perf_counter() - start).strip()}")
+    if failed or aborted:
+        raise click.ClickException(f"{failed} day(s) failed, {aborted} day(s) aborted")
+
+
+@cli.command()
+@click.argument("year", type=int)
+@click.argument("day", type=int)
+@click.argument("inputs", nargs=-1, required=True)
+@click.option("--workers", "-j", type=int, default=1, show_default=True, help="Number of worker processes")
+@click.option("--cpus", type=int, help="Cores shared by the workers, map_reduce and solvers, defaults to all cores")
+@click.option("--cache/--no-cache", default=True, show_default=True, help="Reuse parsed inputs from the parse cache")
+@click.option("--day-budget", type=float, help="Cancel an input after this many seconds")
+@click.option("--part-budget", type=float, help="Cancel a part after this many seconds")
+@click.option("--max-memory", type=float, help="Abort a phase that uses more than this many MiB")
+@click.option("--telemetry", type=click.Path(path_type=Path), default=TELEMETRY_PATH, show_default=True)
+@click.option("--no-telemetry", is_flag=True, help="Do not append a JSON line per phase to the telemetry file")
+def batch(
+    year: int,
+    day: int,
+    inputs: tuple[str, ...],
+    workers: int,
+    cpus: int | None,
+    cache: bool,
+    day_budget: float | None,
+    part_budget: float | None,
+    max_memory: float | None,
+    telemetry: Path,
+    no_telemetry: bool,
+) -> None:
+    """Solve a single day on many inputs: files, directories or glob patterns."""
+    selected = discover_days(years=(year,), days=(day,))
+    if not selected:
+        raise click.ClickException(f"No solution for {year}/dag_{day}")
+    input_paths = resolve_inputs(inputs)
+    if not input_paths:
+        raise click.ClickException("No inputs found")
+
+    module = selected[0].load()
+    click.echo(format_batch_header([part for part in PARTS if hasattr(module, part)]))
+
+    set_cpu_budget(cpus)
+    start = time.perf_counter()
+    failed = aborted = 0
+    results = run_batch(
+        selected[0],
+        input_paths,
+        workers=workers,
+        cache=cache,
+        day_budget=day_budget,
+        part_budget=part_budget,
+        max_memory=mebibytes(max_memory),
+    )
+    with TelemetryWriter(None if no_telemetry else telemetry) as writer:
+        for result in results:
+            click.echo(format_batch_row(result))
+            writer.write(result)
+            failed += result.error is not None
+            aborted += result.aborted is not None
+
+    click.echo(f"Solved {len(input_paths)} input(s) in {format_seconds(time.perf_counter() - start).strip()}")
+    if failed or aborted:
+        raise click.ClickException(f"{failed} input(s) failed, {aborted} input(s) aborted")
+
+
+@cli.command()
+@click.argument("years", type=int, nargs=-1)
+@click.option("--day", "-d", "days", type=int, multiple=True, help="Only benchmark the given day(s)")
+@click.option("--warmup", type=int, default=1, show_default=True, help="Number of unrecorded runs")
+@click.option("--repeat", "-n", type=int, default=5, show_default=True, help="Number of recorded runs")
+@click.option("--label", help="Label to find this run back in the history")
+@click.option("--history", type=click.Path(path_type=Path), default=HISTORY_PATH, show_default=True)
+@click.option("--threshold", type=float, default=0.1, show_default=True, help="Allowed slowdown, 0.1 means 10%")
+@click.option("--size", type=float, default=None, help="Benchmark on a generated input of this size factor")
+@click.option("--cache", is_flag=True, help="Load parsed inputs from the parse cache instead of parsing")
+@click.option("--startup", is_flag=True, help="Also time importing each day in a fresh interpreter")
+@click.option("--max-memory", type=float, help="Fail a day when a phase uses more than this many MiB")
+def bench(
+    years: tuple[int, ...],
+    days: tuple[int, ...],
+    warmup: int,
+    repeat: int,
+    label: str | None,
+    history: Path,
+    threshold: float,
+    size: float | None,
+    cache: bool,
+    startup: bool,
+    max_memory: float | None,
+) -> None:
+    """Benchmark the days, store the results and compare them with the previous run.
+
+    A day that fails is reported and the other days are still benchmarked and stored.
+    """
+    results = {}
+    failed = []
+    for day in discover_days(years=years, days=days):
+        name = day.name if size is None else f"{day.name}@{size:g}x"
+        try:
+            input_path = day.input_path() if size is None else write_input(day, size=size)
+            if not input_path.exists():
+                click.echo(f"{name:<12} skipped, no input")
+                continue
+            timings = benchmark_day(
+                day, input_path=input_path, warmup=warmup, repeat=repeat, cache=cache, max_memory=mebibytes(max_memory)
+            )
+            if startup:
+                timings = {"import": benchmark_startup(day, repeat=repeat), **timings}
+        except MemoryLimitExceeded as e:
+            click.echo(f"{name:<12} {e}")
+            failed.append(name)
+            continue
+        except Exception as e:
+            # A day that fails should not stop the other days, nor lose their timings
+            click.echo(f"{name:<12} failed, {type(e).__name__}: {e}")
+            failed.append(name)
+            continue
+        results[name] = timings
+        medians = "  ".join(f"{phase} {format_seconds(t.median)}" for phase, t in timings.items())
+        click.echo(f"{name:<12} {medians}")
+
+    if results:
+        save_and_compare(results, label=label, history=history, threshold=threshold, failed=failed)
+    if failed:
+        raise click.ClickException(f"{len(failed)} day(s) failed: {', '.join(failed)}")
+    if not results:
+        raise click.ClickException("Nothing to benchmark")
+
+
+def save_and_compare(
+    results: dict[str, dict[str, PhaseTimings]], label: str | None, history: Path, threshold: float, failed: list[str]
+) -> None:
+    """Store a benchmark run and report its regressions against the previous run.
+
+    When days failed, the regressions are printed but the failed days are the error.
+    """
+    previous_runs = load_history(history)
+    run = save_run(results, label=label, path=history)
+    if not previous_runs:
+        return
+    try:
+        report_regressions(compare_runs(previous_runs[-1], run, threshold))
+    except click.ClickException:
+        if not failed:
+            raise
+
+
+@cli.command()
+@click.option("--baseline", default="-2", show_default=True, help="Index, label or commit of the baseline run")
+@click.option("--current", default="-1", show_default=True, help="Index, label or commit of the compared run")
+@click.option("--history", type=click.Path(path_type=Path), default=HISTORY_PATH, show_default=True)
+@click.option("--threshold", type=float, default=0.1, show_default=True, help="Allowed slowdown, 0.1 means 10%")
+def compare(baseline: str, current: str, history: Path, threshold: float) -> None:
+    """Compare two benchmark runs from the history."""
+    runs = load_history(history)
+    try:
+        baseline_run, current_run = find_run(runs, baseline), find_run(runs, current)
+    except KeyError as e:
+        raise click.ClickException(str(e.args[0]))
+    report_regressions(compare_runs(baseline_run, current_run, threshold))
+
+
+def mebibytes(size: float | None) -> int | None:
+    """Number of bytes in a size given in MiB on the command line."""
+    return None if size is None else int(size * 1024**2)
+
+
+def report_regressions(regressions: list[Regression]) -> None:
+    """Print the regressions and fail when there are any."""
+    if not regressions:
+        click.echo("No regressions found")
+        return
+
+    for regression in regressions:
+        click.echo(
+            f"{regression.day:<12} {regression.phase:<8} {format_seconds(regression.baseline)} -> "
+            f"{format_seconds(regression.current)} ({regression.ratio:.2f}x)"
+        )
+    raise click.ClickException(f"{len(regressions)} regression(s) found")
+
+
+@cli.command()
+@click.argument("years", type=int, nargs=-1)
+@click.option("--day", "-d", "days", type=int, multiple=True, help="Only estimate the given day(s)")
+@click.option("--base", type=float, default=0.25, show_default=True, help="Size factor of the smallest input")
+@click.option("--steps", type=int, default=4, show_default=True, help="Number of times the size is doubled")
+@click.option("--repeat", "-n", type=int, default=3, show_default=True, help="Runs per input, the median is used")
+@click.option("--seeds", type=int, default=3, show_default=True, help="Inputs per size, the median is used")
+@click.option("--tolerance", type=float, default=0.3, show_default=True, help="Allowed excess of the exponent")
+@click.option("--max-seconds", type=float, default=30, show_default=True, help="Stop doubling after a slower run")
+def complexity(
+    years: tuple[int, ...],
+    days: tuple[int, ...],
+    base: float,
+    steps: int,
+    repeat: int,
+    seeds: int,
+    tolerance: float,
+    max_seconds: float,
+) -> None:
+    """Estimate how the time of every phase grows with the size of the input."""
+    worse = []
+    for day in discover_days(years=years, days=days):
+        try:
+            scalings = estimate_complexity(
+                day, base=base, steps=steps, repeat=repeat, max_seconds=max_seconds, seeds=seeds
+            )
+        except KeyError as e:
+            click.echo(f"{day.name:<12} skipped, {e.args[0]}")
+            continue
+        except Exception as e:
+            # A solution that fails on a generated input should not stop the other days
+            click.echo(f"{day.name:<12} failed, {type(e).__name__}: {e}")
+            continue
+
+        for scaling in scalings:
+            exponent = scaling.exponent
+            fitted = "n/a" if exponent is None else f"n^{exponent:.2f}"
+            flag = ""
+            if scaling.is_worse_than_expected(tolerance):
+                flag = "  worse than expected"
+                worse.append(scaling)
+            timings = " ".join(format_seconds(t) for t in scaling.times)
+            click.echo(
+                f"{day.name:<12} {scaling.phase:<8} {fitted:>8} (expected n^{scaling.expected:g}) {timings}{flag}"
+            )
+
+    if worse:
+        raise click.ClickException(f"{len(worse)} phase(s) grow faster than expected")
+
+
+@cli.command()
+@click.argument("years", type=int, nargs=-1)
+@click.option("--day", "-d", "days", type=int, multiple=True, help="Only test the given day(s)")
+@click.option("--runs", "-n", type=int, default=1000, show_default=True, help="Number of generated inputs per part")
+@click.option("--size", type=float, default=0.01, show_default=True, help="Size factor of the generated inputs")
+@click.option("--seed", type=int, default=0, show_default=True, help="Seed of the first generated input")
+def difftest(years: tuple[int, ...], days: tuple[int, ...], runs: int, size: float, seed: int) -> None:
+    """Compare parts with their reference implementation on generated inputs."""
+    failures = 0
+    for day in discover_days(years=years, days=days):
+        parts = reference_parts(day.load())
+        if not parts:
+            continue
+        mismatches = {mismatch.part: mismatch for mismatch in differential_test(day, runs, size, seed)}
+        for part in parts:
+            mismatch = mismatches.get(part)
+            if mismatch is None:
+                click.echo(f"{day.name:<12} {part:<8} ok on {runs} inputs")
+                continue
+            failures += 1
+            click.echo(f"{day.name:<12} {part:<8} mismatch on seed {mismatch.seed}, shrunk to:")
+            click.echo(mismatch.input_text, nl=False)
+            click.echo(f"  answer    {mismatch.answer}\n  reference {mismatch.reference_answer}")
+
+    if failures:
+        raise click.ClickException(f"{failures} part(s) differ from their reference")
+
+
+@cli.command(name="record-size")
+@click.argument("years", type=int, nargs=-1)
+@click.option("--day", "-d", "days", type=int, multiple=True, help="Only measure the given day(s)")
+@click.option("--size", type=float, default=None, help="Measure on a generated input of this size factor")
+def record_size(years: tuple[int, ...], days: tuple[int, ...], size: float | None) -> None:
+    """Measure the bytes per parsed record as regular dataclass, slotted dataclass and table."""
+    click.echo(f"{'day':<12} {'record':<10} {'count':>8} {'dict':>8} {'slots':>8} {'table':>8}")
+    for day in discover_days(years=years, days=days):
+        input_path = day.input_path() if size is None else write_input(day, size=size)
+        if not input_path.exists():
+            continue
+        for name, records in find_records(day.load().read_input(input_path)).items():
+            sizes = "".join(f"{per_record:>9.0f}" for per_record in bytes_per_record(records).values())
+            click.echo(f"{day.name:<12} {name:<10} {len(records):>8}{sizes}")
+
+
+@cli.group()
+def daemon() -> None:
+    """Keep solutions imported and inputs parsed in a background process."""
+
+
+@daemon.command()
+@click.option("--socket", "socket_path", type=click.Path(path_type=Path), default=SOCKET_PATH, show_default=True)
+@click.option("--max-inputs", type=int, default=MAX_INPUTS, show_default=True, help="Parsed inputs kept in memory")
+def start(socket_path: Path, max_inputs: int) -> None:
+    """Start the daemon in the foreground."""
+    click.echo(f"Listening on {socket_path}")
+    serve(socket_path, max_inputs=max_inputs)
+
+
+@daemon.command(name="run")
+@click.argument("year", type=int)
+@click.argument("day", type=int)
+@click.option("--part", "-p", "parts", type=int, multiple=True, help="Only solve the given part(s)")
+@click.option("--input", "input_path", type=click.Path(path_type=Path, exists=True), help="Input file to solve")
+@click.option("--test", is_flag=True, help="Run with test input")
+@click.option("--socket", "socket_path", type=click.Path(path_type=Path), default=SOCKET_PATH, show_default=True)
+def daemon_run(
+    year: int, day: int, parts: tuple[int, ...], input_path: Path | None, test: bool, socket_path: Path
+) -> None:
+    """Solve a day using the running daemon."""
+    selected = discover_days(years=(year,), days=(day,))
+    if not selected:
+        raise click.ClickException(f"No solution for {year}/dag_{day}")
+
+    request = {"command": "run", "year": year, "day": day, "parts": parts, "test": test}
+    if input_path is not None:
+        request["input"] = str(input_path.resolve())
+    response = request_daemon(request, socket_path)
+
+    result = DayResult(
+        day=selected[0], phases=[PhaseResult(**phase) for phase in response["phases"]], error=response["error"]
+    )
+    click.echo(format_result(result))
+    if result.error:
+        raise click.ClickException("Day failed")
+
+
+@daemon.command()
+@click.option("--socket", "socket_path", type=click.Path(path_type=Path), default=SOCKET_PATH, show_default=True)
+def stop(socket_path: Path) -> None:
+    """Stop the running daemon."""
+    request_daemon({"command": "stop"}, socket_path)
+
+
+def request_daemon(request: dict, socket_path: Path) -> dict:
+    """Send a request to the daemon, failing with a readable message when it is not running."""
+    try:
+        response = send_request(request, socket_path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        raise click.ClickException(f"No daemon running on {socket_path}, start it with `aoc daemon start`")
+    if "phases" not in response and response.get("error"):
+        raise click.ClickException(response["error"])
+    return response
+
+
+@cli.command(name="clear-cache")
+@click.option("--directory", type=click.Path(path_type=Path), default=CACHE_DIRECTORY, show_default=True)
+@click.option("--store-directory", type=click.Path(path_type=Path), default=STORE_DIRECTORY, show_default=True)
+def clear_parse_cache(directory: Path, store_directory: Path) -> None:
+    """Remove all parsed inputs from the parse cache and all stored results."""
+    click.echo(f"Removed {clear_cache(directory)} cached input(s) and {clear_cache(store_directory)} stored result(s)")
+
+
+@cli.command(name="generate")
+@click.argument("year", type=int)
+@click.argument("day", type=int)
+@click.option("--size", type=float, default=1, show_default=True, help="Size factor compared to a real input")
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option("--output", "-o", type=click.Path(path_type=Path), help="Write to a file instead of stdout")
+def generate_input(year: int, day: int, size: float, seed: int, output: Path | None) -> None:
+    """Generate a synthetic input for a day."""
+    try:
+        text = generate(year, day, size=size, seed=seed)
+    except KeyError as e:
+        raise click.ClickException(str(e.args[0]))
+
+    if output is None:
+        click.echo(text, nl=False)
+    else:
+        output.write_text(text)
@@ -0,0 +1,121 @@
+"""Empirical complexity estimation.
+
+Every phase of a day is timed on generated inputs of size n, 2n, 4n, ... and a power law
+`time = c * size ** exponent` is fitted to the timings. A day can declare the exponent it
+is expected to grow with per phase in `EXPECTED_COMPLEXITY`, e.g. `{"part_2": 2}`; phases
+that are not declared are expected to grow linearly with the size of the input.
+"""
+
+import math
+import statistics
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+
+from aoc.discovery import Day
+from aoc.generators import write_input
+from aoc.memo import clear_caches
+from aoc.parallel import limit_workers
+from aoc.runner import PARTS, part_solver
+
+DEFAULT_EXPONENT = 1.0
+# Timings below this are dominated by noise and constant overhead
+MIN_SECONDS = 1e-3
+
+
+@dataclass
+class Scaling:
+    """Timings of a phase on inputs of increasing size."""
+
+    day: str
+    phase: str
+    expected: float
+    sizes: list[float] = field(default_factory=list)
+    times: list[float] = field(default_factory=list)
+
+    @property
+    def exponent(self) -> float | None:
+        """Fitted exponent, None when there are not enough timings to fit it."""
+        return fit_exponent(self.sizes, self.times)
+
+    def is_worse_than_expected(self, tolerance: float) -> bool:
+        """Check if the phase grows faster than expected."""
+        exponent = self.exponent
+        return exponent is not None and exponent > self.expected + tolerance
+
+
+def fit_exponent(sizes: list[float], times: list[float]) -> float | None:
+    """Least squares fit of the slope of log(time) against log(size).
+
+    Timings below MIN_SECONDS are left out when enough other timings remain.
+    """
+    points = [(s, t) for s, t in zip(sizes, times) if t >= MIN_SECONDS]
+    if len(points) < 2:
+        points = [(s, t) for s, t in zip(sizes, times) if t > 0]
+    if len(points) < 2:
+        return None
+
+    xs = [math.log(s) for s, _ in points]
+    ys = [math.log(t) for _, t in points]
+    mean_x, mean_y = statistics.fmean(xs), statistics.fmean(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if variance == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+
+
+def time_phases(module: ModuleType, input_path: Path, repeat: int) -> dict[str, float]:
+    """Median time of the parse and every part over the repetitions."""
+    times: dict[str, list[float]] = {}
+    for _ in range(repeat):
+        clear_caches(module)
+        start = time.perf_counter()
+        puzzle_input = module.read_input(input_path)
+        times.setdefault("parse", []).append(time.perf_counter() - start)
+
+        for part in PARTS:
+            solve = part_solver(module, part)
+            if solve is None:
+                continue
+            start = time.perf_counter()
+            solve(puzzle_input)
+            times.setdefault(part, []).append(time.perf_counter() - start)
+
+    return {phase: statistics.median(phase_times) for phase, phase_times in times.items()}
+
+
+def estimate_complexity(
+    day: Day, base: float = 0.25, steps: int = 4, repeat: int = 3, max_seconds: float = 30, seeds: int = 3
+) -> list[Scaling]:
+    """Time the phases of a day on inputs of size base, 2 * base, 4 * base, ...
+
+    Every size is timed on inputs of `seeds` seeds and the median over the seeds is used,
+    so a single input that happens to be easy or hard doesn't decide the fitted exponent.
+    A warmup run on a separate input takes care of lazy imports. The size stops doubling
+    once a run of the day took longer than `max_seconds`. Solutions that use `map_reduce`
+    run serially, as switching to worker processes above a number of records would show up
+    as a jump in the timings.
+    """
+    module = day.load()
+    expected = getattr(module, "EXPECTED_COMPLEXITY", {})
+    scalings: dict[str, Scaling] = {}
+    with limit_workers(1):
+        time_phases(module, write_input(day, size=base, seed=seeds), repeat=1)
+
+        for step in range(steps):
+            size = base * 2**step
+            start = time.perf_counter()
+            times: dict[str, list[float]] = {}
+            for seed in range(seeds):
+                for phase, seconds in time_phases(module, write_input(day, size=size, seed=seed), repeat).items():
+                    times.setdefault(phase, []).append(seconds)
+            for phase, seed_times in times.items():
+                default = Scaling(day.name, phase, expected.get(phase, DEFAULT_EXPONENT))
+                scaling = scalings.setdefault(phase, default)
+                scaling.sizes.append(size)
+                scaling.times.append(statistics.median(seed_times))
+            if (time.perf_counter() - start) / (repeat * seeds) > max_seconds:
+                break
+
+    return list(scalings.values())
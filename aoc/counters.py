@@ -0,0 +1,57 @@
+"""Counters of the operations of a solution, such as states expanded or memo hits.
+
+Wall time depends on the machine, the number of operations only on the algorithm. So
+solutions call `count` at the key points of their hot loops, and the runner reports the
+counts of each phase next to its timings. Outside of a `counting` block, `count` only
+checks a global, so the counters can stay in the solutions.
+
+`map_reduce` counts in its workers as well and adds their counts to the caller's.
+"""
+
+import contextlib
+from collections import Counter
+from typing import Iterator
+
+# Counts of the innermost counting block, None when counting is disabled
+_counts: Counter[str] | None = None
+
+
+def count(name: str, amount: int = 1) -> None:
+    """Add `amount` to the counter `name`, nothing happens when counting is disabled."""
+    if _counts is not None:
+        _counts[name] += amount
+
+
+def enabled() -> bool:
+    """Whether `count` is counting, e.g. to skip gathering statistics that are only needed for a counter."""
+    return _counts is not None
+
+
+def add(counts: dict[str, int] | None) -> None:
+    """Add counts of another process to the counts of this process, e.g. of a worker."""
+    if _counts is not None and counts:
+        _counts.update(counts)
+
+
+@contextlib.contextmanager
+def counting(enable: bool = True) -> Iterator[Counter[str] | None]:
+    """Count the calls of `count` in the with block, yields the counts or None when not enabled.
+
+    Counts of a nested block are added to the enclosing block as well.
+    """
+    global _counts
+    if not enable:
+        yield None
+        return
+
+    previous, _counts = _counts, Counter()
+    try:
+        yield _counts
+    finally:
+        counts, _counts = _counts, previous
+        add(counts)
+
+
+def format_counts(counts: dict[str, int]) -> str:
+    """Format counts as `name=1,234` pairs in order of name."""
+    return "  ".join(f"{name}={value:,}" for name, value in sorted(counts.items()))
@@ -0,0 +1,51 @@
+"""A budget of CPU cores, divided between the process pools and the solvers.
+
+Days run in parallel by the runner, records in parallel by `map_reduce`, and CP-SAT
+searches with threads of its own. Each of them taking all cores oversubscribes the machine
+as soon as they are combined. Instead, every process has a budget of cores: a pool divides
+the budget of its process between its workers, and a worker uses only its share for its
+own pools and solvers.
+
+The budget defaults to the cores this process may run on, which respects taskset and
+container limits, and can be lowered with `set_cpu_budget`, e.g. on a shared machine.
+"""
+
+import multiprocessing
+import os
+
+# Budget of this process, None for all available cores
+_cpus: int | None = None
+
+
+def available_cpus() -> int:
+    """Number of cores this process may run on."""
+    return os.process_cpu_count() or 1
+
+
+def cpu_budget() -> int:
+    """Number of cores this process may use.
+
+    A worker process that was not given a share, such as a worker of a pool outside of
+    this module's control, gets a single core.
+    """
+    if _cpus is not None:
+        return _cpus
+    if multiprocessing.parent_process() is not None:
+        return 1
+    return available_cpus()
+
+
+def set_cpu_budget(cpus: int | None) -> None:
+    """Limit this process to `cpus` cores, None for all available cores. Also the initializer of pool workers."""
+    global _cpus
+    _cpus = None if cpus is None else max(cpus, 1)
+
+
+def pool_size(workers: int | None, tasks: int) -> int:
+    """Number of workers of a pool for `tasks` tasks, by default one per core of the budget."""
+    return max(min(workers or cpu_budget(), tasks), 1)
+
+
+def worker_share(workers: int) -> int:
+    """Cores of the budget of this process that each of `workers` workers may use."""
+    return max(cpu_budget() // workers, 1)
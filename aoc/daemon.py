@@ -0,0 +1,167 @@
+"""Long-lived solver process that keeps solutions imported and parsed inputs in memory.
+
+The daemon listens on a Unix socket. Every request and response is a single line of JSON:
+
+    {"command": "run", "year": 2025, "day": 10, "parts": [2], "input": "/path/to/input.txt"}
+
+A solution is imported again when its file changed, and an input is parsed again when either
+the input or the solution changed, so edits are picked up without restarting the daemon.
+"""
+
+import json
+import socket
+import socketserver
+import sys
+import time
+import traceback
+from collections import OrderedDict
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from aoc.discovery import ROOT, Day, discover_days
+from aoc.runner import PARTS, DayResult, PhaseResult, part_solver
+
+SOCKET_PATH = ROOT / ".cache" / "daemon.sock"
+MAX_INPUTS = 32
+
+
+class Solver:
+    """Keeps solution modules imported and parsed inputs in memory between requests."""
+
+    def __init__(self, max_inputs: int = MAX_INPUTS) -> None:
+        self.max_inputs = max_inputs
+        self.modules: dict[str, tuple[int, ModuleType]] = {}
+        self.inputs: OrderedDict[tuple, Any] = OrderedDict()
+
+    def load(self, day: Day) -> ModuleType:
+        """Import the solution of a day, importing it again when the file changed."""
+        mtime = day.path.stat().st_mtime_ns
+        cached = self.modules.get(day.module_name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        sys.modules.pop(day.module_name, None)
+        module = day.load()
+        self.modules[day.module_name] = (mtime, module)
+        return module
+
+    def parse(self, module: ModuleType, input_path: Path) -> tuple[Any, bool]:
+        """Parse an input, returning the parsed input and whether it came from memory.
+
+        The least recently used inputs are dropped when more than `max_inputs` are kept.
+        """
+        stat = input_path.stat()
+        key = (module.__name__, id(module), str(input_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        if key in self.inputs:
+            self.inputs.move_to_end(key)
+            return self.inputs[key], True
+
+        puzzle_input = module.read_input(input_path)
+        self.inputs[key] = puzzle_input
+        while len(self.inputs) > self.max_inputs:
+            self.inputs.popitem(last=False)
+        return puzzle_input, False
+
+    def run(self, day: Day, input_path: Path, parts: tuple[int, ...] = (), test: bool = False) -> DayResult:
+        """Solve the given parts of a day (all parts when empty) on an input, see `part_solver` for `test`."""
+        result = DayResult(day=day)
+        try:
+            module = self.load(day)
+
+            start = time.perf_counter()
+            puzzle_input, cached = self.parse(module, input_path)
+            result.phases.append(PhaseResult("parse", time.perf_counter() - start, cached=cached))
+
+            for part in PARTS:
+                solve = part_solver(module, part, test)
+                if solve is None or (parts and int(part.removeprefix("part_")) not in parts):
+                    continue
+                start = time.perf_counter()
+                answer = solve(puzzle_input)
+                result.phases.append(PhaseResult(part, time.perf_counter() - start, answer))
+        except Exception:
+            result.error = traceback.format_exc()
+        return result
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Unix socket server that handles one request at a time with a shared Solver."""
+
+    def __init__(self, socket_path: Path, solver: Solver) -> None:
+        super().__init__(str(socket_path), RequestHandler)
+        self.solver = solver
+        self.stopping = False
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Handles a single JSON request."""
+
+    server: DaemonServer
+
+    def handle(self) -> None:
+        """Read the request, dispatch it and write the response."""
+        try:
+            response = self.dispatch(json.loads(self.rfile.readline()))
+        except Exception:
+            response = {"error": traceback.format_exc()}
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+    def dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Execute a request."""
+        command = request.get("command")
+        if command == "ping":
+            return {"status": "ok"}
+        if command == "stop":
+            self.server.stopping = True
+            return {"status": "stopping"}
+        if command != "run":
+            raise ValueError(f"Unknown command {command}")
+
+        days = discover_days(years=(request["year"],), days=(request["day"],))
+        if not days:
+            raise ValueError(f"No solution for {request['year']}/dag_{request['day']}")
+        day = days[0]
+
+        test = request.get("test", False)
+        input_path = Path(request["input"]) if request.get("input") else day.input_path(test)
+        result = self.server.solver.run(day, input_path, tuple(request.get("parts", ())), test)
+        return result_to_dict(result)
+
+
+def result_to_dict(result: DayResult) -> dict[str, Any]:
+    """Convert a result to JSON, answers are sent as their string representation."""
+    return {
+        "day": result.day.name,
+        "phases": [
+            {
+                "phase": p.phase,
+                "seconds": p.seconds,
+                "answer": None if p.answer is None else str(p.answer),
+                "cached": p.cached,
+            }
+            for p in result.phases
+        ],
+        "error": result.error,
+    }
+
+
+def serve(socket_path: Path = SOCKET_PATH, max_inputs: int = MAX_INPUTS) -> None:
+    """Handle requests on the socket until a stop request arrives."""
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    socket_path.unlink(missing_ok=True)
+    try:
+        with DaemonServer(socket_path, Solver(max_inputs)) as server:
+            while not server.stopping:
+                server.handle_request()
+    finally:
+        socket_path.unlink(missing_ok=True)
+
+
+def send_request(request: dict[str, Any], socket_path: Path = SOCKET_PATH) -> dict[str, Any]:
+    """Send a request to the daemon and wait for the response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path))
+        client.sendall(json.dumps(request).encode() + b"\n")
+        with client.makefile("rb") as f:
+            return json.loads(f.readline())
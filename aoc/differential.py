@@ -0,0 +1,116 @@
+"""Differential testing of fast solutions against reference implementations.
+
+When a part is rewritten for speed, the previous (slow but trusted) version stays in the
+day module as `reference_part_1` or `reference_part_2`. The harness runs both versions on
+many small generated inputs and compares the answers. A mismatch is shrunk to a minimal
+failing input by removing lines for as long as the answers still differ (delta debugging).
+"""
+
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterator
+
+from aoc.discovery import Day
+from aoc.generators import generate
+from aoc.parallel import limit_workers
+from aoc.runner import PARTS
+
+REFERENCE_PREFIX = "reference_"
+
+
+@dataclass
+class Mismatch:
+    """Different answers of a part and its reference implementation on the same input."""
+
+    day: str
+    part: str
+    seed: int
+    size: float
+    input_text: str
+    answer: str
+    reference_answer: str
+
+
+def reference_parts(module: ModuleType) -> dict[str, tuple[Callable, Callable]]:
+    """Parts of a day module that have a reference implementation, with both functions."""
+    return {
+        part: (getattr(module, part), getattr(module, REFERENCE_PREFIX + part))
+        for part in PARTS
+        if hasattr(module, part) and hasattr(module, REFERENCE_PREFIX + part)
+    }
+
+
+class DifferentialRunner:
+    """Runs a part and its reference on input texts, parsing the text again for every run."""
+
+    def __init__(self, module: ModuleType, solve: Callable, reference: Callable, directory: Path) -> None:
+        self.module = module
+        self.solve = solve
+        self.reference = reference
+        self.input_path = directory / "input.txt"
+
+    def solve_with(self, solve: Callable, text: str) -> Any:  # noqa: ANN401
+        """Parse the text and solve it, parts can change their input so it is parsed for every call."""
+        self.input_path.write_text(text)
+        return solve(self.module.read_input(self.input_path))
+
+    def compare(self, text: str) -> tuple[str, str] | None:
+        """The answer and the reference answer when they differ, otherwise None.
+
+        An input on which the reference fails is not a valid input, so it never counts as a
+        mismatch. An error of the fast version on a valid input does.
+        """
+        try:
+            expected = self.solve_with(self.reference, text)
+        except Exception:
+            return None
+        try:
+            answer = self.solve_with(self.solve, text)
+        except Exception as e:
+            return f"{type(e).__name__}: {e}", repr(expected)
+        return None if answer == expected else (repr(answer), repr(expected))
+
+    def shrink(self, text: str) -> str:
+        """Remove chunks of lines from a failing input for as long as it keeps failing.
+
+        Chunks start at half of the lines and are halved whenever no chunk can be removed, so
+        the result is a failing input from which no single line can be removed.
+        """
+        lines = text.splitlines()
+        chunk = max(1, len(lines) // 2)
+        while lines:
+            removed = False
+            start = 0
+            while start < len(lines):
+                candidate = lines[:start] + lines[start + chunk :]
+                if candidate and self.compare("\n".join(candidate) + "\n") is not None:
+                    lines, removed = candidate, True
+                else:
+                    start += chunk
+            if not removed:
+                if chunk == 1:
+                    break
+                chunk //= 2
+        return "\n".join(lines) + "\n"
+
+
+def differential_test(day: Day, runs: int = 1000, size: float = 0.01, seed: int = 0) -> Iterator[Mismatch]:
+    """Compare every part that has a reference implementation on `runs` generated inputs.
+
+    Every part reports at most one mismatch, shrunk to a minimal failing input. Solutions
+    that use `map_reduce` run serially, so the inputs are not sent to worker processes.
+    """
+    module = day.load()
+    with tempfile.TemporaryDirectory() as directory, limit_workers(1):
+        for part, (solve, reference) in reference_parts(module).items():
+            runner = DifferentialRunner(module, solve, reference, Path(directory))
+            for run_seed in range(seed, seed + runs):
+                text = generate(day.year, day.day, size=size, seed=run_seed)
+                if runner.compare(text) is None:
+                    continue
+                text = runner.shrink(text)
+                answer, reference_answer = runner.compare(text)
+                yield Mismatch(day.name, part, run_seed, size, text, answer, reference_answer)
+                break
@@ -0,0 +1,78 @@
+import importlib.util
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+
+ROOT = Path(__file__).resolve().parent.parent
+DAY_DIRECTORY = re.compile(r"^dag_(\d+)$")
+
+
+@dataclass(frozen=True, order=True)
+class Day:
+    """Represents the solution of a single day."""
+
+    year: int
+    day: int
+    path: Path
+
+    @property
+    def name(self) -> str:
+        """Name of the day as used in the repository, e.g. 2024/dag_1."""
+        return f"{self.year}/dag_{self.day}"
+
+    @property
+    def module_name(self) -> str:
+        """Unique module name, the directory names are not valid identifiers."""
+        return f"aoc_{self.year}_dag_{self.day}"
+
+    def input_path(self, test: bool = False) -> Path:
+        """Resolve the input file next to the solution."""
+        return self.path.parent / ("example.txt" if test else "input.txt")
+
+    def load(self) -> ModuleType:
+        """Import the solution module."""
+        return load_module(self.path, self.module_name)
+
+
+def load_module(path: Path, module_name: str) -> ModuleType:
+    """Import a module from a file path, reusing it when it was already imported."""
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load {path}")
+
+    module = importlib.util.module_from_spec(spec)
+    # Register before executing, dataclasses look up their module in sys.modules
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+def discover_days(root: Path = ROOT, years: tuple[int, ...] = (), days: tuple[int, ...] = ()) -> list[Day]:
+    """Find every <year>/dag_N/dag_N.py, optionally filtered on years and days."""
+    found = []
+    for year_directory in root.iterdir():
+        if not year_directory.is_dir() or not year_directory.name.isdigit():
+            continue
+        year = int(year_directory.name)
+        if years and year not in years:
+            continue
+
+        for day_directory in year_directory.iterdir():
+            match = DAY_DIRECTORY.match(day_directory.name)
+            if not match:
+                continue
+            day = int(match.group(1))
+            path = day_directory / f"{day_directory.name}.py"
+            if path.exists() and (not days or day in days):
+                found.append(Day(year=year, day=day, path=path))
+
+    return sorted(found)
@@ -0,0 +1,40 @@
+"""Generators for synthetic puzzle inputs.
+
+Every day has a generator that produces a valid input, scaled by a size factor: 1 is
+roughly the size of a real input, 10, 100 and 1000 are stress tests. Grids scale their
+area, the other days scale the number of records.
+"""
+
+import hashlib
+import inspect
+import random
+from pathlib import Path
+
+from aoc.discovery import ROOT, Day
+from aoc.generators import y2023, y2024, y2025  # noqa: F401, registers the generators
+from aoc.generators.base import GENERATORS
+
+GENERATED_DIRECTORY = ROOT / ".generated"
+
+
+def generate(year: int, day: int, size: float = 1, seed: int = 0) -> str:
+    """Generate the text of an input file for a day."""
+    try:
+        generator = GENERATORS[(year, day)]
+    except KeyError:
+        raise KeyError(f"No generator for {year}/dag_{day}")
+    return generator(random.Random(seed), size)
+
+
+def write_input(day: Day, directory: Path = GENERATED_DIRECTORY, size: float = 1, seed: int = 0) -> Path:
+    """Generate an input for a day and write it to a file, reusing the file when it already exists.
+
+    The name of the file includes a hash of the generator, so a changed generator writes a new file.
+    """
+    generator = GENERATORS.get((day.year, day.day))
+    version = hashlib.sha256(inspect.getsource(generator).encode()).hexdigest()[:8] if generator else "none"
+    path = directory / f"{day.year}_dag_{day.day}_{size:g}x_{seed}_{version}.txt"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(generate(day.year, day.day, size, seed))
+    return path
@@ -0,0 +1,32 @@
+import math
+import random
+from typing import Callable
+
+Generator = Callable[[random.Random, float], str]
+
+GENERATORS: dict[tuple[int, int], Generator] = {}
+
+
+def generator(year: int, day: int) -> Callable[[Generator], Generator]:
+    """Register a function that generates a valid puzzle input for a day."""
+
+    def register(func: Generator) -> Generator:
+        GENERATORS[(year, day)] = func
+        return func
+
+    return register
+
+
+def scaled(count: int, size: float) -> int:
+    """Scale the number of records of a real input with the size factor."""
+    return max(1, round(count * size))
+
+
+def scaled_side(side: int, size: float, minimum: int = 5) -> int:
+    """Scale the side of a square grid, so that the number of cells scales with the size factor."""
+    return max(minimum, round(side * math.sqrt(size)))
+
+
+def grid_to_string(grid: list[list[str]]) -> str:
+    """Join a 2D list of characters into the text of an input file."""
+    return "\n".join("".join(row) for row in grid) + "\n"
@@ -0,0 +1,40 @@
+import random
+import string
+
+from aoc.generators.base import generator, scaled
+
+SPELLED_DIGITS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+@generator(2023, 1)
+def calibration_document(rng: random.Random, size: float) -> str:
+    """Lines of letters, digits and spelled out digits, with at least one digit per line."""
+    lines = []
+    for _ in range(scaled(1000, size)):
+        pieces = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(2, 8)):
+            match rng.randint(0, 2):
+                case 0:
+                    pieces.append(str(rng.randint(1, 9)))
+                case 1:
+                    pieces.append(rng.choice(SPELLED_DIGITS))
+                case _:
+                    pieces.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))))
+        rng.shuffle(pieces)
+        lines.append("".join(pieces))
+    return "\n".join(lines) + "\n"
+
+
+@generator(2023, 2)
+def cube_games(rng: random.Random, size: float) -> str:
+    """Games in which every color is revealed at least once."""
+    lines = []
+    for game_id in range(1, scaled(100, size) + 1):
+        reveals = [[] for _ in range(rng.randint(1, 6))]
+        for color in ("red", "green", "blue"):
+            for reveal in rng.sample(reveals, rng.randint(1, len(reveals))):
+                reveal.append(f"{rng.randint(1, 20)} {color}")
+        for reveal in reveals:
+            rng.shuffle(reveal)
+        lines.append(f"Game {game_id}: " + "; ".join(", ".join(reveal) for reveal in reveals if reveal))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,405 @@
+import random
+
+from aoc.generators.base import generator, grid_to_string, scaled, scaled_side
+
+DIRECTIONS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+# Share of the cells visited by the guard and of the cells with an obstruction in a real input of 2024 day 6
+GUARD_ROUTE_SHARE = 0.3
+GUARD_OBSTRUCTION_DENSITY = 0.05
+# Offset of the prizes in part 2 of 2024 day 13
+CLAW_PRIZE_OFFSET = 10_000_000_000_000
+# Distances between the rings of the spiral route of a generated guard map
+SPIRAL_GAPS = (2, 2, 3, 3, 4)
+
+
+@generator(2024, 1)
+def location_lists(rng: random.Random, size: float) -> str:
+    """Two columns of location ids, drawn from a shared pool so that ids repeat."""
+    count = scaled(1000, size)
+    pool = [rng.randint(10000, 99999) for _ in range(max(1, count // 2))]
+    return "".join(f"{rng.choice(pool)}   {rng.choice(pool)}\n" for _ in range(count))
+
+
+@generator(2024, 2)
+def reports(rng: random.Random, size: float) -> str:
+    """Mostly monotone reports, some of them with a single bad level."""
+    lines = []
+    for _ in range(scaled(1000, size)):
+        direction = rng.choice((-1, 1))
+        levels = [rng.randint(20, 80)]
+        for _ in range(rng.randint(4, 7)):
+            levels.append(levels[-1] + direction * rng.randint(1, 3))
+        if rng.random() < 0.5:
+            levels[rng.randrange(len(levels))] += rng.randint(-4, 4)
+        lines.append(" ".join(str(level) for level in levels))
+    return "\n".join(lines) + "\n"
+
+
+@generator(2024, 3)
+def corrupted_memory(rng: random.Random, size: float) -> str:
+    """Valid mul, do and don't instructions between corrupted ones and noise."""
+    noise = ["mul[3,7]", "mul(4*", "mul ( 2 , 4 )", "?(12,34)", "select()", "from()", "how()", "+", "!", "@", "'", "<"]
+    pieces = []
+    for _ in range(scaled(3000, size)):
+        match rng.randint(0, 9):
+            case 0:
+                pieces.append("do()")
+            case 1:
+                pieces.append("don't()")
+            case 2 | 3 | 4:
+                pieces.append(f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})")
+            case _:
+                pieces.append(rng.choice(noise))
+    lines = ["".join(pieces[i : i + 500]) for i in range(0, len(pieces), 500)]
+    return "\n".join(lines) + "\n"
+
+
+@generator(2024, 4)
+def word_search(rng: random.Random, size: float) -> str:
+    """Grid with the letters of XMAS."""
+    side = scaled_side(140, size)
+    return grid_to_string([rng.choices("XMAS", k=side) for _ in range(side)])
+
+
+@generator(2024, 5)
+def page_ordering(rng: random.Random, size: float) -> str:
+    """Rules for every pair of pages of a total order, followed by ordered and unordered updates."""
+    pages = rng.sample(range(10, 100), 49)
+    rules = [f"{before}|{after}" for i, before in enumerate(pages) for after in pages[i + 1 :]]
+    rng.shuffle(rules)
+
+    rank = {page: i for i, page in enumerate(pages)}
+    updates = []
+    for _ in range(scaled(200, size)):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=rank.__getitem__)
+        updates.append(",".join(str(page) for page in update))
+    return "\n".join(rules) + "\n\n" + "\n".join(updates) + "\n"
+
+
+def guard_route(grid: list[list[str]], start: tuple[int, int]) -> set[tuple[int, int]] | None:
+    """Simulate the guard, returning the visited cells of a route that leaves the area and None for a loop."""
+    rows, cols = len(grid), len(grid[0])
+    (y, x), direction = start, 0
+    visited, seen = {start}, set()
+    while (y, x, direction) not in seen:
+        seen.add((y, x, direction))
+        dy, dx = DIRECTIONS[direction]
+        if not (0 <= y + dy < rows and 0 <= x + dx < cols):
+            return visited
+        if grid[y + dy][x + dx] == "#":
+            direction = (direction + 1) % 4
+        else:
+            y, x = y + dy, x + dx
+            visited.add((y, x))
+    return None
+
+
+def spiral_obstructions(rng: random.Random, grid: list[list[str]], start: tuple[int, int], length: int) -> None:
+    """Place obstructions that turn the guard into an outward spiral until the route is `length` cells long.
+
+    Every segment is longer than the previous parallel one by a random gap of at least two
+    cells. So the route never returns to a cell in the same direction and can't loop, and no
+    obstruction is placed on the route.
+    """
+    rows, cols = len(grid), len(grid[0])
+    (y, x), direction = start, 0
+    segments = [rng.randint(1, 3), rng.randint(1, 3)]
+    steps = 1
+    while steps < length:
+        dy, dx = DIRECTIONS[direction]
+        segments[direction % 2] += rng.choice(SPIRAL_GAPS)
+        y, x = y + dy * segments[direction % 2], x + dx * segments[direction % 2]
+        steps += segments[direction % 2]
+        if not (0 <= y + dy < rows and 0 <= x + dx < cols):
+            return
+        if steps < length:
+            grid[y + dy][x + dx] = "#"
+            direction = (direction + 1) % 4
+
+
+@generator(2024, 6)
+def guard_map(rng: random.Random, size: float) -> str:
+    """Lab with obstructions and a guard (^) whose route covers a fixed share of the cells before leaving the area.
+
+    A real input has a route of about 5000 of its 16900 cells. The obstructions that shape
+    the route make it spiral outwards from the guard, the remaining obstructions are
+    scattered over the cells off the route. Maps whose route is too short are rejected.
+    """
+    side = scaled_side(130, size)
+    length = round(GUARD_ROUTE_SHARE * side * side)
+    margin = side // 3
+    while True:
+        grid = [["." for _ in range(side)] for _ in range(side)]
+        start = (rng.randrange(margin, side - margin), rng.randrange(margin, side - margin))
+        spiral_obstructions(rng, grid, start, length)
+        route = guard_route(grid, start)
+        if route is None or len(route) < length:
+            continue
+
+        free = [(y, x) for y in range(side) for x in range(side) if grid[y][x] == "." and (y, x) not in route]
+        scattered = round(GUARD_OBSTRUCTION_DENSITY * side * side) - sum(row.count("#") for row in grid)
+        for y, x in rng.sample(free, min(max(scattered, 0), len(free))):
+            grid[y][x] = "#"
+        grid[start[0]][start[1]] = "^"
+        return grid_to_string(grid)
+
+
+@generator(2024, 7)
+def calibration_equations(rng: random.Random, size: float) -> str:
+    """Equations of which about half can be made true with +, * and ||."""
+    lines = []
+    for _ in range(scaled(850, size)):
+        values = [rng.randint(1, 999) for _ in range(rng.randint(2, 12))]
+        result = values[0]
+        for value in values[1:]:
+            match rng.randint(0, 2):
+                case 0:
+                    result += value
+                case 1:
+                    result *= value
+                case _:
+                    result = int(f"{result}{value}")
+        if rng.random() < 0.5:
+            result += 1
+        lines.append(f"{result}: " + " ".join(str(value) for value in values))
+    return "\n".join(lines) + "\n"
+
+
+@generator(2024, 8)
+def antenna_map(rng: random.Random, size: float) -> str:
+    """Map with a few antennas per frequency."""
+    side = scaled_side(50, size)
+    frequencies = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    grid = [["." for _ in range(side)] for _ in range(side)]
+    for _ in range(scaled(50, size)):
+        frequency = rng.choice(frequencies)
+        for _ in range(rng.randint(3, 5)):
+            grid[rng.randrange(side)][rng.randrange(side)] = frequency
+    return grid_to_string(grid)
+
+
+@generator(2024, 9)
+def disk_map(rng: random.Random, size: float) -> str:
+    """Alternating file and free space lengths, starting and ending with a file."""
+    digits = [str(rng.randint(1, 9))]
+    for _ in range(scaled(10000, size) - 1):
+        digits.append(str(rng.randint(0, 9)))
+        digits.append(str(rng.randint(1, 9)))
+    return "".join(digits) + "\n"
+
+
+@generator(2024, 10)
+def topographic_map(rng: random.Random, size: float) -> str:
+    """Random heights with hiking trails from 0 to 9 painted over them."""
+    side = scaled_side(50, size)
+    grid = [[str(rng.randint(0, 9)) for _ in range(side)] for _ in range(side)]
+    for _ in range(scaled(250, size)):
+        trail = [(rng.randrange(side), rng.randrange(side))]
+        while len(trail) < 10:
+            y, x = trail[-1]
+            options = [
+                (y + dy, x + dx)
+                for dy, dx in DIRECTIONS
+                if 0 <= y + dy < side and 0 <= x + dx < side and (y + dy, x + dx) not in trail
+            ]
+            if not options:
+                break
+            trail.append(rng.choice(options))
+        for height, (y, x) in enumerate(trail):
+            grid[y][x] = str(height)
+    return grid_to_string(grid)
+
+
+@generator(2024, 11)
+def stones(rng: random.Random, size: float) -> str:
+    """Engraved numbers on the stones."""
+    return " ".join(str(rng.randint(0, 9999999)) for _ in range(scaled(8, size))) + "\n"
+
+
+@generator(2024, 12)
+def garden_map(rng: random.Random, size: float) -> str:
+    """Regions of plants, each row is a mutated copy of the row above it."""
+    side = scaled_side(140, size)
+    row = rng.choices("ABCDEFGHIJKLMNOPQRSTUVWXYZ", k=side)
+    for i in range(1, side):
+        row[i] = row[i - 1] if rng.random() < 0.8 else row[i]
+
+    grid = []
+    for _ in range(side):
+        row = row.copy()
+        for _ in range(max(1, side // 20)):
+            start = rng.randrange(side)
+            plant = rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+            for i in range(start, min(side, start + rng.randint(1, 8))):
+                row[i] = plant
+        grid.append(row)
+    return grid_to_string(grid)
+
+
+def claw_presses(ax: int, ay: int, bx: int, by: int, prize_x: int, prize_y: int) -> tuple[int, int] | None:
+    """Presses of button A and B that reach the prize, None when no whole number of presses does."""
+    determinant = ax * by - ay * bx
+    presses_a, remainder_a = divmod(prize_x * by - prize_y * bx, determinant)
+    presses_b, remainder_b = divmod(ax * prize_y - ay * prize_x, determinant)
+    return None if remainder_a or remainder_b else (presses_a, presses_b)
+
+
+def valid_claw_machine(ax: int, ay: int, bx: int, by: int, prize_x: int, prize_y: int) -> bool:
+    """Whether the prize can be won with at most 100 presses per button or not at all, also when moved for part 2."""
+    if ax * by == ay * bx:
+        return False
+    near = claw_presses(ax, ay, bx, by, prize_x, prize_y)
+    far = claw_presses(ax, ay, bx, by, prize_x + CLAW_PRIZE_OFFSET, prize_y + CLAW_PRIZE_OFFSET)
+    return (near is None or 0 <= min(near) <= max(near) <= 100) and (far is None or min(far) >= 0)
+
+
+@generator(2024, 13)
+def claw_machines(rng: random.Random, size: float) -> str:
+    """Claw machines of which some can be won in part 1 and others only once the prize moved in part 2.
+
+    The diagonal lies between the buttons, like in a real input, so the far prizes of part 2
+    are reached with positive presses. Machines that would need negative presses or more
+    than 100 presses in part 1 are left out.
+    """
+    machines = []
+    while len(machines) < scaled(320, size):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        if (ax - ay) * (by - bx) <= 0:
+            continue
+        if rng.random() < 0.5:
+            presses_a, presses_b = rng.randint(0, 100), rng.randint(0, 100)
+            prize_x = presses_a * ax + presses_b * bx + (rng.randint(1, 5) if rng.random() < 0.3 else 0)
+            prize_y = presses_a * ay + presses_b * by
+        else:
+            # Round the presses that reach a random far prize, and move the prize to where they end up
+            target_x, target_y = rng.randint(1000, 20000), rng.randint(1000, 20000)
+            determinant = ax * by - ay * bx
+            far_x, far_y = target_x + CLAW_PRIZE_OFFSET, target_y + CLAW_PRIZE_OFFSET
+            presses_a = round((far_x * by - far_y * bx) / determinant)
+            presses_b = round((ax * far_y - ay * far_x) / determinant)
+            prize_x = presses_a * ax + presses_b * bx - CLAW_PRIZE_OFFSET
+            prize_y = presses_a * ay + presses_b * by - CLAW_PRIZE_OFFSET
+        if prize_x > 0 and prize_y > 0 and valid_claw_machine(ax, ay, bx, by, prize_x, prize_y):
+            machines.append(f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={prize_x}, Y={prize_y}")
+    return "\n\n".join(machines) + "\n"
+
+
+@generator(2024, 14)
+def robots(rng: random.Random, size: float) -> str:
+    """Robots with a position on the 101x103 grid and a velocity."""
+    lines = []
+    for _ in range(scaled(500, size)):
+        px, py = rng.randrange(101), rng.randrange(103)
+        vx, vy = rng.randint(-99, 99), rng.randint(-99, 99)
+        lines.append(f"p={px},{py} v={vx},{vy}")
+    return "\n".join(lines) + "\n"
+
+
+@generator(2024, 15)
+def warehouse(rng: random.Random, size: float) -> str:
+    """Walled warehouse with boxes, a robot (@) and the robot's moves."""
+    side = scaled_side(50, size)
+    grid = []
+    for i in range(side):
+        if i in (0, side - 1):
+            grid.append(["#"] * side)
+            continue
+        row = rng.choices(".O#", weights=(65, 27, 8), k=side)
+        row[0] = row[-1] = "#"
+        grid.append(row)
+    grid[side // 2][side // 2] = "@"
+
+    moves = rng.choices("^v<>", k=scaled(20000, size))
+    lines = ["".join(moves[i : i + 1000]) for i in range(0, len(moves), 1000)]
+    return grid_to_string(grid) + "\n" + "\n".join(lines) + "\n"
+
+
+@generator(2024, 16)
+def reindeer_maze(rng: random.Random, size: float) -> str:
+    """Maze carved with a randomized depth first search, with some walls removed to create loops.
+
+    The start (S) is in the bottom left corner and the end (E) in the top right corner.
+    """
+    side = scaled_side(141, size)
+    side += side % 2 == 0  # The maze needs an odd side
+    grid = [["#"] * side for _ in range(side)]
+
+    start = (side - 2, 1)
+    grid[start[0]][start[1]] = "."
+    stack = [start]
+    while stack:
+        y, x = stack[-1]
+        options = [
+            (y + 2 * dy, x + 2 * dx)
+            for dy, dx in DIRECTIONS
+            if 0 < y + 2 * dy < side - 1 and 0 < x + 2 * dx < side - 1 and grid[y + 2 * dy][x + 2 * dx] == "#"
+        ]
+        if not options:
+            stack.pop()
+            continue
+        ny, nx = rng.choice(options)
+        grid[(y + ny) // 2][(x + nx) // 2] = "."
+        grid[ny][nx] = "."
+        stack.append((ny, nx))
+
+    for _ in range(scaled(200, size)):
+        y, x = rng.randrange(1, side - 1), rng.randrange(1, side - 1)
+        grid[y][x] = "."
+
+    grid[start[0]][start[1]] = "S"
+    grid[1][side - 2] = "E"
+    return grid_to_string(grid)
+
+
+@generator(2024, 17)
+def chronospatial_computer(rng: random.Random, size: float) -> str:
+    """Program that outputs one value per octal digit of register A, so the size scales the run time."""
+    register_a = rng.randint(8 ** (scaled(16, size) - 1), 8 ** scaled(16, size) - 1)
+    a, b, c = rng.randint(0, 7), rng.randint(0, 7), rng.randint(0, 7)
+    program = [2, 4, 1, a, 7, 5, 1, b, 4, c, 5, 5, 0, 3, 3, 0]
+    return f"Register A: {register_a}\nRegister B: 0\nRegister C: 0\n\nProgram: {','.join(map(str, program))}\n"
+
+
+@generator(2024, 18)
+def falling_bytes(rng: random.Random, size: float) -> str:
+    """Unique positions of falling bytes on the 71x71 memory space.
+
+    The memory space has a fixed size, so at most all of its cells except the start and the exit fall.
+    Among the bytes is a wall across the diagonal x + y = k that blocks the exit once it is complete.
+    Its last byte falls after the first 1024 bytes, so the exit is still reachable for part 1 and
+    blocked for part 2 at every size.
+    """
+    k = rng.randint(20, 120)
+    wall = [(x, k - x) for x in range(max(0, k - 70), min(70, k) + 1)]
+    rng.shuffle(wall)
+    others = [(x, y) for x in range(71) for y in range(71) if x + y != k and (x, y) not in ((0, 0), (70, 70))]
+    rng.shuffle(others)
+
+    count = max(scaled(3450, size), 1024 + len(wall))
+    cells = wall[:-1] + others[: count - len(wall)]
+    rng.shuffle(cells)
+    cells.insert(rng.randint(1024, len(cells)), wall[-1])
+    return "".join(f"{x},{y}\n" for x, y in cells)
+
+
+@generator(2024, 19)
+def towel_designs(rng: random.Random, size: float) -> str:
+    """Available towel patterns, followed by designs that are mostly made out of them."""
+    towels = set()
+    while len(towels) < 400:
+        towels.add("".join(rng.choices("wubrg", k=rng.randint(1, 8))))
+    towels.discard("g")  # Make sure that not every design is possible
+    towels = sorted(towels)
+
+    designs = []
+    for _ in range(scaled(400, size)):
+        if rng.random() < 0.7:
+            design = ""
+            while len(design) < 20:
+                design += rng.choice(towels)
+            designs.append(design)
+        else:
+            designs.append("".join(rng.choices("wubrg", k=rng.randint(20, 60))))
+    return ", ".join(towels) + "\n\n" + "\n".join(designs) + "\n"
@@ -0,0 +1,199 @@
+import random
+import string
+
+from aoc.generators.base import generator, grid_to_string, scaled, scaled_side
+
+
+@generator(2025, 1)
+def rotations(rng: random.Random, size: float) -> str:
+    """Dial rotations to the left or right."""
+    return "".join(f"{rng.choice('LR')}{rng.randint(1, 999)}\n" for _ in range(scaled(4500, size)))
+
+
+@generator(2025, 2)
+def id_ranges(rng: random.Random, size: float) -> str:
+    """Comma separated product id ranges, most of them around an id made of a repeated sequence of digits."""
+    ranges = []
+    for _ in range(scaled(35, size)):
+        sequence = str(rng.randint(1, 99999))
+        invalid_id = int(sequence * rng.randint(2, max(2, 10 // len(sequence))))
+        start = max(1, invalid_id - rng.randint(0, 50000)) if rng.random() < 0.8 else rng.randint(10, 10**10)
+        ranges.append(f"{start}-{start + rng.randint(0, 100000)}")
+    return ",".join(ranges) + "\n"
+
+
+@generator(2025, 3)
+def battery_banks(rng: random.Random, size: float) -> str:
+    """Banks of 100 batteries with a joltage of 1 to 9."""
+    return "".join("".join(rng.choices("123456789", k=100)) + "\n" for _ in range(scaled(200, size)))
+
+
+@generator(2025, 4)
+def paper_rolls(rng: random.Random, size: float) -> str:
+    """Grid with rolls of paper (@)."""
+    side = scaled_side(137, size)
+    return grid_to_string([rng.choices("@.", weights=(6, 4), k=side) for _ in range(side)])
+
+
+@generator(2025, 5)
+def ingredient_database(rng: random.Random, size: float) -> str:
+    """Overlapping fresh id ranges, followed by the available ingredient ids."""
+    ranges = []
+    for _ in range(scaled(180, size)):
+        start = rng.randint(1, 5 * 10**14)
+        ranges.append((start, start + int(10 ** rng.uniform(0, 13))))
+
+    ids = []
+    for _ in range(scaled(1000, size)):
+        if rng.random() < 0.5:
+            ids.append(rng.randint(*rng.choice(ranges)))
+        else:
+            ids.append(rng.randint(1, 5 * 10**14))
+    ranges = [f"{start}-{end}" for start, end in ranges]
+    return "\n".join(ranges) + "\n\n" + "\n".join(map(str, ids)) + "\n"
+
+
+@generator(2025, 6)
+def math_worksheet(rng: random.Random, size: float) -> str:
+    """Problems written in columns, with the numbers of a problem aligned to the left or right."""
+    rows = [[] for _ in range(4)]
+    operators = []
+    for _ in range(scaled(1000, size)):
+        numbers = [str(rng.randint(1, 9999)) for _ in rows]
+        width = max(len(number) for number in numbers)
+        left_aligned = rng.random() < 0.5
+        for row, number in zip(rows, numbers):
+            row.append(number.ljust(width) if left_aligned else number.rjust(width))
+        operators.append(rng.choice("+*").ljust(width))
+    return "\n".join(" ".join(row) for row in [*rows, operators]) + "\n"
+
+
+@generator(2025, 7)
+def tachyon_manifold(rng: random.Random, size: float) -> str:
+    """Manifold with a start (S) on top and splitters (^) on every other row.
+
+    The splitters are placed on the positions a beam can reach, never next to each other.
+    """
+    width = scaled_side(141, size)
+    height = scaled_side(142, size)
+    start = width // 2
+    grid = [["."] * width for _ in range(height)]
+    grid[0][start] = "S"
+    for i in range(2, height, 2):
+        reach = i // 2 - 1
+        for col in range(start - reach, start + reach + 1, 2):
+            if 0 <= col < width and rng.random() < 0.6:
+                grid[i][col] = "^"
+    return grid_to_string(grid)
+
+
+@generator(2025, 8)
+def junction_boxes(rng: random.Random, size: float) -> str:
+    """Positions of the junction boxes in 3D space."""
+    return "".join(
+        f"{rng.randint(0, 99999)},{rng.randint(0, 99999)},{rng.randint(0, 99999)}\n" for _ in range(scaled(1000, size))
+    )
+
+
+@generator(2025, 9)
+def red_tiles(rng: random.Random, size: float) -> str:
+    """Corners of a rectilinear polygon, in order.
+
+    The polygon looks like a histogram: a flat bottom and a bar of random height between each pair of x's.
+    """
+    bars = scaled(250, size)
+    max_coordinate = max(100000, 4 * bars)
+    xs = sorted(rng.sample(range(1, max_coordinate), bars + 1))
+    heights = [rng.randint(1, max_coordinate) for _ in range(bars)]
+
+    corners = [(xs[0], 0)]
+    for i, height in enumerate(heights):
+        corners.append((xs[i], height))
+        corners.append((xs[i + 1], height))
+    corners.append((xs[-1], 0))
+    # List the corners counterclockwise
+    return "".join(f"{x},{y}\n" for x, y in reversed(corners))
+
+
+@generator(2025, 10)
+def factory_machines(rng: random.Random, size: float) -> str:
+    """Machines with reachable indicator lights and joltage requirements."""
+    lines = []
+    for _ in range(scaled(180, size)):
+        no_of_lights = rng.randint(4, 10)
+        buttons = [
+            sorted(rng.sample(range(no_of_lights), rng.randint(1, no_of_lights))) for _ in range(rng.randint(3, 13))
+        ]
+
+        target = [False] * no_of_lights
+        for button in rng.sample(buttons, rng.randint(1, len(buttons))):
+            for light in button:
+                target[light] = not target[light]
+
+        joltage = [0] * no_of_lights
+        for button in buttons:
+            presses = rng.randint(0, 20)
+            for light in button:
+                joltage[light] += presses
+
+        lights = "".join("#" if on else "." for on in target)
+        wiring = " ".join("(" + ",".join(map(str, button)) + ")" for button in buttons)
+        lines.append(f"[{lights}] {wiring} {{{','.join(map(str, joltage))}}}")
+    return "\n".join(lines) + "\n"
+
+
+def device_name(index: int, length: int) -> str:
+    """Unique lowercase name for a device."""
+    name = ""
+    for _ in range(length):
+        index, remainder = divmod(index, 26)
+        name = string.ascii_lowercase[remainder] + name
+    return name
+
+
+@generator(2025, 11)
+def device_graph(rng: random.Random, size: float) -> str:
+    """Directed acyclic graph of devices.
+
+    Every device is connected to the next device in a random order, which makes all devices reachable
+    from svr and you, and makes out reachable from all devices. The other outputs skip ahead a bit.
+    """
+    count = scaled(600, size)
+    length = 3
+    while 26**length < count + 5:
+        length += 1
+
+    reserved = {"you", "out", "svr", "fft", "dac"}
+    names = [name for name in (device_name(i, length) for i in range(count + 5)) if name not in reserved]
+    names = names[:count]
+    rng.shuffle(names)
+    for position, name in ((0, "svr"), (count // 10, "you"), (count // 3, "fft"), (2 * count // 3, "dac")):
+        names.insert(position, name)
+    names.append("out")
+
+    lines = []
+    for i, name in enumerate(names[:-1]):
+        outputs = {names[i + 1]}
+        for _ in range(rng.randint(0, 2)):
+            outputs.add(names[min(len(names) - 1, i + rng.randint(2, 20))])
+        lines.append(f"{name}: {' '.join(sorted(outputs))}")
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+@generator(2025, 12)
+def present_regions(rng: random.Random, size: float) -> str:
+    """Six 3x3 present shapes, followed by regions with the number of presents of each shape."""
+    shapes = []
+    for index in range(6):
+        cells = ["#"] * rng.randint(5, 8) + ["."] * 9
+        cells = cells[:9]
+        rng.shuffle(cells)
+        pattern = ["".join(cells[i : i + 3]) for i in range(0, 9, 3)]
+        shapes.append(f"{index}:\n" + "\n".join(pattern))
+
+    regions = []
+    for _ in range(scaled(1000, size)):
+        counts = " ".join(str(rng.randint(0, 60)) for _ in shapes)
+        regions.append(f"{rng.randint(35, 50)}x{rng.randint(35, 50)}: {counts}")
+    return "\n\n".join(shapes) + "\n\n" + "\n".join(regions) + "\n"
@@ -0,0 +1,172 @@
+"""Graphs with integer nodes stored as compressed sparse row (CSR) arrays.
+
+The nodes of a graph are the integers 0..n-1 and the outgoing edges of node `u` are
+`indices[indptr[u] : indptr[u + 1]]`, with optional integer weights in the same order.
+Compared to a dict of dicts, this takes a few bytes per edge. Days map their own nodes
+(coordinates, names) to integers, e.g. the flat index of a cell in a grid.
+
+The searches loop over plain lists of the arrays, which takes time linear in the size of
+the graph however deep it is; NumPy is used where all edges can be processed at once.
+"""
+
+import heapq
+from collections import deque
+
+import numpy as np
+
+from aoc.grid import ORTHOGONAL, shift
+
+UNREACHABLE = -1
+
+
+class Graph:
+    """A directed graph in compressed sparse row form."""
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray | None = None) -> None:
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.weights = None if weights is None else np.asarray(weights, dtype=np.int64)
+
+    @classmethod
+    def from_edges(
+        cls,
+        n_nodes: int,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        weights: np.ndarray | None = None,
+        undirected: bool = False,
+    ) -> "Graph":
+        """Create a graph from arrays of edges, with every edge in both directions when `undirected` is set."""
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        if weights is not None:
+            weights = np.broadcast_to(np.asarray(weights, dtype=np.int64), sources.shape)
+        if undirected:
+            sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+            if weights is not None:
+                weights = np.concatenate([weights, weights])
+
+        order = np.argsort(sources, kind="stable")
+        indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n_nodes), out=indptr[1:])
+        return cls(indptr, targets[order], None if weights is None else weights[order])
+
+    @classmethod
+    def from_grid(cls, open_cells: np.ndarray) -> "Graph":
+        """Undirected graph between orthogonally adjacent open cells, with the flat index of a cell as node."""
+        rows, cols = open_cells.shape
+        flat = np.arange(rows * cols).reshape(rows, cols)
+        sources, targets = [], []
+        for dy, dx in ORTHOGONAL[1:3]:  # right and down, the other directions are the reverse edges
+            connected = open_cells & shift(open_cells, dy, dx, fill=False)
+            sources.append(flat[connected])
+            targets.append(flat[connected] + dy * cols + dx)
+        return cls.from_edges(rows * cols, np.concatenate(sources), np.concatenate(targets), undirected=True)
+
+    @property
+    def n_nodes(self) -> int:
+        """Number of nodes."""
+        return len(self.indptr) - 1
+
+    @property
+    def n_edges(self) -> int:
+        """Number of edges."""
+        return len(self.indices)
+
+    def successors(self, node: int) -> np.ndarray:
+        """Targets of the outgoing edges of a node."""
+        return self.indices[self.indptr[node] : self.indptr[node + 1]]
+
+    def sources(self) -> np.ndarray:
+        """Source of every edge, in the same order as `indices`."""
+        return np.repeat(np.arange(self.n_nodes), np.diff(self.indptr))
+
+    def edge_weights(self) -> np.ndarray:
+        """Weight of every edge, 1 for an unweighted graph."""
+        return np.ones(self.n_edges, dtype=np.int64) if self.weights is None else self.weights
+
+    def reverse(self) -> "Graph":
+        """Graph with the direction of every edge reversed."""
+        return Graph.from_edges(self.n_nodes, self.indices, self.sources(), self.weights)
+
+
+def bfs(graph: Graph, source: int) -> np.ndarray:
+    """Number of edges on the shortest path from the source to every node, UNREACHABLE if there is none."""
+    indptr, indices = graph.indptr.tolist(), graph.indices.tolist()
+    distances = [UNREACHABLE] * graph.n_nodes
+    distances[source] = 0
+    queue = deque([source])
+    while queue:
+        node = queue.popleft()
+        distance = distances[node] + 1
+        for target in indices[indptr[node] : indptr[node + 1]]:
+            if distances[target] == UNREACHABLE:
+                distances[target] = distance
+                queue.append(target)
+    return np.array(distances, dtype=np.int64)
+
+
+def dijkstra(graph: Graph, source: int) -> np.ndarray:
+    """Total weight of the lightest path from the source to every node, UNREACHABLE if there is none.
+
+    Weights must not be negative.
+    """
+    indptr, indices, weights = graph.indptr.tolist(), graph.indices.tolist(), graph.edge_weights().tolist()
+    distances = [UNREACHABLE] * graph.n_nodes
+    distances[source] = 0
+    queue = [(0, source)]
+    while queue:
+        distance, node = heapq.heappop(queue)
+        if distance > distances[node]:
+            continue
+        for edge in range(indptr[node], indptr[node + 1]):
+            target, new_distance = indices[edge], distance + weights[edge]
+            if distances[target] == UNREACHABLE or new_distance < distances[target]:
+                distances[target] = new_distance
+                heapq.heappush(queue, (new_distance, target))
+    return np.array(distances, dtype=np.int64)
+
+
+def topological_order(graph: Graph) -> np.ndarray:
+    """Nodes ordered such that every edge points forward (Kahn's algorithm).
+
+    Raises:
+        ValueError: If the graph contains a cycle.
+
+    """
+    indptr, indices = graph.indptr.tolist(), graph.indices.tolist()
+    in_degree = np.bincount(graph.indices, minlength=graph.n_nodes).tolist()
+    order = np.flatnonzero(np.array(in_degree) == 0).tolist()
+    for node in order:  # The list grows while it is iterated
+        for target in indices[indptr[node] : indptr[node + 1]]:
+            in_degree[target] -= 1
+            if in_degree[target] == 0:
+                order.append(target)
+
+    if len(order) < graph.n_nodes:
+        raise ValueError("Graph is not a DAG.")
+    return np.array(order, dtype=np.int64)
+
+
+def connected_components(graph: Graph) -> np.ndarray:
+    """Label every node with the smallest node of its component, following edges in both directions.
+
+    Every round, the label of the label of each node is lowered to the label of a neighbour
+    (hooking), after which labels are followed to the label of the label until nothing
+    changes (pointer jumping). Both steps process all edges at once.
+    """
+    sources, targets = graph.sources(), graph.indices
+    labels = np.arange(graph.n_nodes)
+    while True:
+        previous = labels.copy()
+        np.minimum.at(labels, labels[sources], labels[targets])
+        np.minimum.at(labels, labels[targets], labels[sources])
+        while not np.array_equal(jumped := labels[labels], labels):
+            labels = jumped
+        if np.array_equal(labels, previous):
+            return labels
+
+
+def count_components(labels: np.ndarray) -> int:
+    """Number of components given the labels of `connected_components`."""
+    return int(np.count_nonzero(labels == np.arange(len(labels))))
@@ -0,0 +1,126 @@
+from pathlib import Path
+
+import numpy as np
+
+from aoc.reader import map_grid
+
+# (dy, dx) offsets
+ORTHOGONAL = ((-1, 0), (0, 1), (1, 0), (0, -1))
+DIAGONAL = ((-1, -1), (-1, 1), (1, 1), (1, -1))
+ALL_DIRECTIONS = ORTHOGONAL + DIAGONAL
+
+
+def shift(array: np.ndarray, dy: int, dx: int, fill: int | bool = 0) -> np.ndarray:
+    """Return an array where every cell holds the value of its neighbour at (y + dy, x + dx).
+
+    Neighbours outside of the array are replaced by `fill`.
+    """
+    rows, cols = array.shape
+    shifted = np.full_like(array, fill)
+    if abs(dy) >= rows or abs(dx) >= cols:
+        return shifted
+    shifted[max(0, -dy) : rows - max(0, dy), max(0, -dx) : cols - max(0, dx)] = array[
+        max(0, dy) : rows - max(0, -dy), max(0, dx) : cols - max(0, -dx)
+    ]
+    return shifted
+
+
+class Grid:
+    """A 2D grid of characters, stored as a contiguous uint8 array."""
+
+    def __init__(self, cells: np.ndarray) -> None:
+        self.cells = np.ascontiguousarray(cells, dtype=np.uint8)
+
+    @classmethod
+    def from_lines(cls, lines: list[str]) -> "Grid":
+        """Create a grid from lines of equal length."""
+        if not lines:
+            raise ValueError("Grid needs at least one line")
+        cols = len(lines[0])
+        if any(len(line) != cols for line in lines):
+            raise ValueError("All lines of a grid need to have the same length")
+        cells = np.frombuffer("".join(lines).encode(), dtype=np.uint8)
+        return cls(cells.reshape(len(lines), cols))
+
+    @classmethod
+    def read(cls, file_path: Path) -> "Grid":
+        """Read a grid from a file, ignoring empty lines.
+
+        The file is memory-mapped and copied once into the cells. Files with empty lines in
+        between are read as text instead.
+        """
+        try:
+            return cls(map_grid(file_path))
+        except ValueError:
+            pass
+        with open(file_path) as f:
+            return cls.from_lines([line for line in f.read().splitlines() if line])
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Number of rows and columns."""
+        return self.cells.shape
+
+    @property
+    def rows(self) -> int:
+        """Number of rows."""
+        return self.cells.shape[0]
+
+    @property
+    def cols(self) -> int:
+        """Number of columns."""
+        return self.cells.shape[1]
+
+    def __getitem__(self, key: tuple[int, int]) -> str:
+        y, x = key
+        return chr(self.cells[y, x])
+
+    def __setitem__(self, key: tuple[int, int], char: str) -> None:
+        y, x = key
+        self.cells[y, x] = ord(char)
+
+    def __str__(self) -> str:
+        return "\n".join(row.tobytes().decode() for row in self.cells)
+
+    def copy(self) -> "Grid":
+        """Copy of the grid that can be changed independently."""
+        return Grid(self.cells.copy())
+
+    def mask(self, chars: str) -> np.ndarray:
+        """Boolean array that is True where the cell is one of the given characters."""
+        return np.isin(self.cells, np.frombuffer(chars.encode(), dtype=np.uint8))
+
+    def find(self, char: str) -> tuple[int, int]:
+        """Coordinate (y, x) of the first occurrence of a character, e.g. a start marker."""
+        index = np.flatnonzero(self.cells == ord(char))
+        if index.size == 0:
+            raise ValueError(f"{char} not found in grid")
+        return self.to_coordinates(int(index[0]))
+
+    def find_all(self, chars: str) -> np.ndarray:
+        """Coordinates (y, x) of all occurrences of the given characters, as an array of shape (n, 2)."""
+        return np.argwhere(self.mask(chars))
+
+    def shift(self, dy: int, dx: int, fill: str = "\0") -> np.ndarray:
+        """Cells of the neighbour at (y + dy, x + dx), see `shift`."""
+        return shift(self.cells, dy, dx, ord(fill))
+
+    def padded(self, fill: str = "\0", width: int = 1) -> "Grid":
+        """Grid with a border of `fill` around it.
+
+        With a border, the neighbours of all original cells exist, so a neighbour can be found
+        by adding an offset to the flat index without a bounds check.
+        """
+        return Grid(np.pad(self.cells, width, constant_values=ord(fill)))
+
+    def to_flat(self, y: int | np.ndarray, x: int | np.ndarray) -> int | np.ndarray:
+        """Convert coordinates to indices in the flattened grid."""
+        return y * self.cols + x
+
+    def to_coordinates(self, index: int | np.ndarray) -> tuple[int | np.ndarray, int | np.ndarray]:
+        """Convert indices in the flattened grid to coordinates (y, x)."""
+        return divmod(index, self.cols)
+
+    def flat_offset(self, dy: int, dx: int) -> int:
+        """Offset in the flattened grid to move to the neighbour at (y + dy, x + dx)."""
+        return dy * self.cols + dx
@@ -0,0 +1,91 @@
+"""Sets of integers stored as sorted, disjoint intervals.
+
+Days with ranges of ids ask whether ids fall in any of the ranges, or how many ids the
+ranges cover. An `IntervalSet` merges the ranges once into disjoint half-open intervals
+`[start, stop)`, stored as two sorted NumPy arrays. A membership query is then a binary
+search over the intervals, O(log n) instead of checking every range, and a batch of
+values is answered at once with `searchsorted`.
+"""
+
+from typing import Iterable, Iterator
+
+import numpy as np
+
+
+class IntervalSet:
+    """A set of integers stored as sorted, disjoint and non-adjacent half-open intervals."""
+
+    def __init__(self, starts: np.ndarray, stops: np.ndarray) -> None:
+        """Create a set from intervals that are already sorted, disjoint and non-adjacent, see `from_ranges`."""
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.stops = np.asarray(stops, dtype=np.int64)
+
+    @classmethod
+    def from_ranges(cls, starts: Iterable[int] | np.ndarray, stops: Iterable[int] | np.ndarray) -> "IntervalSet":
+        """Create a set from half-open intervals in any order, merging the intervals that overlap or touch."""
+        starts = np.asarray(starts if isinstance(starts, np.ndarray) else list(starts), dtype=np.int64)
+        stops = np.asarray(stops if isinstance(stops, np.ndarray) else list(stops), dtype=np.int64)
+        non_empty = starts < stops
+        starts, stops = starts[non_empty], stops[non_empty]
+        if starts.size == 0:
+            return cls(starts, stops)
+
+        order = np.argsort(starts, kind="stable")
+        starts, stops = starts[order], stops[order]
+        # An interval starts a new group when it begins after every earlier interval ended
+        reach = np.maximum.accumulate(stops)
+        first = np.ones(len(starts), dtype=bool)
+        first[1:] = starts[1:] > reach[:-1]
+        groups = np.flatnonzero(first)
+        return cls(starts[groups], np.maximum.reduceat(stops, groups))
+
+    @classmethod
+    def from_inclusive(cls, ranges: Iterable[tuple[int, int]]) -> "IntervalSet":
+        """Create a set from (first, last) pairs that include both ends, such as the range `3-5`."""
+        bounds = np.array(list(ranges), dtype=np.int64).reshape(-1, 2)
+        return cls.from_ranges(bounds[:, 0], bounds[:, 1] + 1)
+
+    def __len__(self) -> int:
+        """Number of disjoint intervals."""
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """The intervals as (start, stop) pairs, with the stop excluded."""
+        return zip(self.starts.tolist(), self.stops.tolist())
+
+    def __contains__(self, value: int) -> bool:
+        index = int(np.searchsorted(self.starts, value, side="right")) - 1
+        return index >= 0 and value < self.stops[index]
+
+    def contains(self, values: Iterable[int] | np.ndarray) -> np.ndarray:
+        """Boolean array that is True for every value in the set."""
+        values = np.asarray(values if isinstance(values, np.ndarray) else list(values), dtype=np.int64)
+        if len(self) == 0:
+            return np.zeros(values.shape, dtype=bool)
+        index = np.searchsorted(self.starts, values, side="right") - 1
+        return (index >= 0) & (values < self.stops[np.maximum(index, 0)])
+
+    @property
+    def length(self) -> int:
+        """Number of integers in the set."""
+        return int((self.stops - self.starts).sum())
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        """Integers in either set."""
+        return IntervalSet.from_ranges(
+            np.concatenate([self.starts, other.starts]), np.concatenate([self.stops, other.stops])
+        )
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        """Integers in both sets.
+
+        Every boundary of either set splits the numbers into segments that lie completely
+        inside or outside each set, so a segment is kept when its start is in both sets.
+        """
+        bounds = np.unique(np.concatenate([self.starts, self.stops, other.starts, other.stops]))
+        segment_starts, segment_stops = bounds[:-1], bounds[1:]
+        keep = self.contains(segment_starts) & other.contains(segment_starts)
+        return IntervalSet.from_ranges(segment_starts[keep], segment_stops[keep])
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
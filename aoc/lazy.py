@@ -0,0 +1,31 @@
+"""Deferred imports of heavy dependencies.
+
+Importing sympy, ortools or matplotlib takes much longer than most days need
+to solve their puzzle. A lazily imported module is only imported on first attribute
+access, so a day only pays for the libraries on the code paths that actually run.
+
+Annotations that refer to a lazily imported module need to be quoted, otherwise they
+are evaluated when the function is defined and trigger the import anyway.
+"""
+
+import importlib
+import sys
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule(ModuleType):
+    """Placeholder for a module that is imported on first attribute access."""
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        module = importlib.import_module(self.__name__)
+        # After the import, attributes are found in __dict__ without calling __getattr__ again
+        self.__dict__.update(module.__dict__)
+        return getattr(module, name)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return a module that is imported on first use, or the module itself when it is already imported."""
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
@@ -0,0 +1,143 @@
+"""Bounded memoization with statistics, for the recursive solvers.
+
+`functools.cache` grows without bound and hashes every argument of every call, also the
+arguments that are the same for every call of a recursion, such as the available towels.
+`memoize` keeps at most `maxsize` results and hashes only the key that `key` projects
+from the arguments. Arguments that are left out of the key are checked by identity with
+`scope` instead: the cache is cleared when they change, so results for other arguments are
+never returned.
+
+The hits, misses and evictions of a memoized function are returned by its `stats()`.
+"""
+
+import functools
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Callable, Hashable, NamedTuple
+
+MAXSIZE = 1 << 16
+POLICIES = ("lru", "fifo")
+
+# Scope before the first call, never the same object as a scope of the arguments
+_NO_SCOPE = object()
+
+
+class CacheInfo(NamedTuple):
+    """Statistics in the shape of `functools.cache`, see `stats` for evictions as well."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+@dataclass(frozen=True)
+class MemoStats:
+    """Statistics of a memoized function since it was created or cleared."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int | None
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of the calls that were answered from the cache."""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+    def cache_info(self) -> CacheInfo:
+        """The statistics in the shape of `functools.cache`."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, self.size)
+
+
+def memoize(
+    maxsize: int | None = MAXSIZE,
+    policy: str = "lru",
+    key: Callable[..., Hashable] | None = None,
+    scope: Callable[..., Any] | None = None,
+) -> Callable[[Callable], Callable]:
+    """Memoize a function on at most `maxsize` results, None for no bound.
+
+    When the cache is full, `policy` "lru" evicts the least recently used result and "fifo"
+    the oldest result, which saves the bookkeeping of a hit. `key` projects the arguments
+    to the key of the cache, by default all arguments. `scope` returns the arguments left
+    out of the key, compared by identity: the cache is cleared when the scope changes.
+
+    The memoized function has `stats()`, and `cache_info()` and `cache_clear()` like a
+    function of `functools.cache`, so `clear_caches` empties both.
+    """
+    _check_options(maxsize, policy)
+    key = key or _all_arguments
+
+    def decorator(function: Callable) -> Callable:
+        cache: OrderedDict[Hashable, Any] = OrderedDict()
+        hits = misses = evictions = 0
+        current_scope: Any = _NO_SCOPE
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            nonlocal hits, misses, evictions, current_scope
+            if scope is not None and (call_scope := scope(*args, **kwargs)) is not current_scope:
+                cache.clear()
+                current_scope = call_scope
+            cache_key = key(*args, **kwargs)
+            try:
+                value = cache[cache_key]
+            except KeyError:
+                pass
+            else:
+                hits += 1
+                if policy == "lru":
+                    cache.move_to_end(cache_key)
+                return value
+
+            misses += 1
+            value = function(*args, **kwargs)
+            cache[cache_key] = value
+            if maxsize is not None and len(cache) > maxsize:
+                cache.popitem(last=False)
+                evictions += 1
+            return value
+
+        def stats() -> MemoStats:
+            return MemoStats(hits, misses, evictions, len(cache), maxsize)
+
+        def cache_clear() -> None:
+            nonlocal hits, misses, evictions, current_scope
+            cache.clear()
+            hits = misses = evictions = 0
+            current_scope = _NO_SCOPE
+
+        wrapper.stats = stats
+        wrapper.cache_info = lambda: stats().cache_info()
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+def clear_caches(module: ModuleType) -> None:
+    """Clear the memoized functions of a module, so every repetition of a benchmark does the full work.
+
+    Both `memoize` and `functools.cache` functions are cleared. Raises RuntimeError when a
+    cache is not empty afterwards, as the timings would then measure a warm cache.
+    """
+    for value in vars(module).values():
+        if callable(getattr(value, "cache_clear", None)):
+            value.cache_clear()
+            if callable(getattr(value, "cache_info", None)) and value.cache_info().currsize:
+                raise RuntimeError(f"The cache of {value.__qualname__} is not empty after clearing it")
+
+
+def _check_options(maxsize: int | None, policy: str) -> None:
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown eviction policy {policy!r}, expected one of {', '.join(POLICIES)}")
+    if maxsize is not None and maxsize < 1:
+        raise ValueError("A memoized function needs room for at least one result")
+
+
+def _all_arguments(*args: Hashable, **kwargs: Hashable) -> Hashable:
+    return (args, *kwargs.items()) if kwargs else args
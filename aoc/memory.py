@@ -0,0 +1,180 @@
+"""Peak memory of a phase and a ceiling on the memory it may use.
+
+The peak RSS is the most physical memory the process used, read from `/proc` on Linux
+where it can be reset before every phase. Elsewhere it falls back to the peak since the
+start of the process. The tracemalloc peak counts the bytes allocated by Python and NumPy,
+so it shows the memory of a phase without the interpreter and the imported modules.
+
+`memory_limit` stops a phase as soon as it allocates more than a ceiling, instead of when
+the machine runs out of memory, and reports where the memory went. The address space
+limit of the process is not used for this, as native libraries such as OpenBLAS and
+CP-SAT abort the whole process when they can't allocate a buffer or start a thread.
+"""
+
+import _thread
+import contextlib
+import resource
+import signal
+import sys
+import threading
+import traceback
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+from aoc.profiling import TRACE_FRAMES, format_bytes, format_line, is_own_file
+
+STATUS_PATH = Path("/proc/self/status")
+CLEAR_REFS_PATH = Path("/proc/self/clear_refs")
+# Writing 5 to clear_refs resets the peak RSS (VmHWM) of the process
+RESET_PEAK_RSS = "5"
+WATCH_INTERVAL = 0.01
+# Signal simulated in the main thread by the watchdog of memory_limit
+INTERRUPT_SIGNAL = signal.SIGUSR1
+
+
+class MemoryLimitExceeded(Exception):
+    """A phase needed more memory than its ceiling."""
+
+
+@dataclass
+class MemoryUsage:
+    """Peak memory of a phase, filled in when the phase ends."""
+
+    peak_rss: int | None = None
+    peak_traced: int | None = None
+
+
+def peak_rss() -> int:
+    """Peak resident set size of this process in bytes, since the last `reset_peak_rss`."""
+    if (peak := _status_bytes("VmHWM")) is not None:
+        return peak
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kibibytes, macOS bytes
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def reset_peak_rss() -> bool:
+    """Reset the peak RSS to the current RSS, returns False where this is not supported."""
+    try:
+        CLEAR_REFS_PATH.write_text(RESET_PEAK_RSS)
+    except OSError:
+        return False
+    return True
+
+
+@contextlib.contextmanager
+def measure_memory(trace: bool = True) -> Iterator[MemoryUsage]:
+    """Measure the peak RSS of the with block, and with `trace` the tracemalloc peak.
+
+    The peak RSS costs next to nothing, tracemalloc slows down allocations considerably.
+    """
+    usage = MemoryUsage()
+    tracing = tracemalloc.is_tracing()
+    if trace and tracing:
+        tracemalloc.reset_peak()
+    elif trace:
+        tracemalloc.start()
+    reset_peak_rss()
+    try:
+        yield usage
+    finally:
+        usage.peak_rss = peak_rss()
+        if trace:
+            usage.peak_traced = tracemalloc.get_traced_memory()[1]
+            if not tracing:
+                tracemalloc.stop()
+
+
+@contextlib.contextmanager
+def memory_limit(max_bytes: int | None) -> Iterator[None]:
+    """Raise MemoryLimitExceeded when the with block allocates more than `max_bytes` of additional memory.
+
+    Allocations are counted by tracemalloc. A watchdog thread interrupts the main thread as
+    soon as the ceiling is crossed, so a loop that keeps allocating is stopped in time. A
+    single allocation inside NumPy is only noticed once it returns. Outside of the main
+    thread, the peak is only checked when the block ends. No limit for None.
+    """
+    if max_bytes is None:
+        yield
+        return
+
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.start(TRACE_FRAMES)
+    start_traced, _ = tracemalloc.get_traced_memory()
+    stop = threading.Event()
+    watchdog = None
+    if threading.current_thread() is threading.main_thread():
+        previous_handler = signal.signal(INTERRUPT_SIGNAL, _raise_memory_error)
+        watchdog = threading.Thread(target=_watch, args=(start_traced + max_bytes, stop), daemon=True)
+        watchdog.start()
+
+    try:
+        try:
+            yield
+        finally:
+            stop.set()
+            if watchdog is not None:
+                watchdog.join()
+                signal.signal(INTERRUPT_SIGNAL, previous_handler)
+        if (peak := tracemalloc.get_traced_memory()[1] - start_traced) > max_bytes:
+            raise MemoryLimitExceeded(
+                f"Peak of {format_bytes(peak)} exceeds the limit of {format_bytes(max_bytes)}, {_top_allocation()}"
+            )
+    except MemoryError as e:
+        raise MemoryLimitExceeded(
+            f"Allocating at {_failing_line(e)} exceeds the limit of {format_bytes(max_bytes)}, {_top_allocation()}"
+        ) from e
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+
+def _watch(limit: int, stop: threading.Event) -> None:
+    """Interrupt the main thread once the traced memory exceeds the limit, until `stop` is set."""
+    while not stop.wait(WATCH_INTERVAL):
+        if tracemalloc.get_traced_memory()[0] > limit:
+            _thread.interrupt_main(INTERRUPT_SIGNAL)
+            return
+
+
+def _raise_memory_error(signum: int, frame: object) -> None:
+    raise MemoryError("Memory limit exceeded")
+
+
+def _status_bytes(field: str) -> int | None:
+    """A memory field of /proc/self/status in bytes."""
+    try:
+        status = STATUS_PATH.read_text()
+    except OSError:
+        return None
+    for line in status.splitlines():
+        if line.startswith(f"{field}:"):
+            return int(line.split()[1]) * 1024  # Reported in kB
+    return None
+
+
+def _top_allocation() -> str:
+    """The line of the repository that allocated most of the traced memory that is still alive."""
+    sizes, blocks = Counter(), Counter()
+    for statistic in tracemalloc.take_snapshot().statistics("traceback"):
+        frames = [(frame.filename, frame.lineno) for frame in statistic.traceback]
+        # Frames are ordered from the oldest call, the innermost line of the repository is the site
+        site = next((frame for frame in reversed(frames) if is_own_file(frame[0])), frames[-1])
+        sizes[site] += statistic.size
+        blocks[site] += statistic.count
+    if not sizes:
+        return "no allocations traced"
+    site, size = sizes.most_common(1)[0]
+    return f"largest allocation site {format_line(*site)} with {format_bytes(size)} in {blocks[site]} blocks"
+
+
+def _failing_line(error: BaseException) -> str:
+    """The innermost line of the repository in the traceback of an error, e.g. the line of a solution."""
+    own = [frame for frame in traceback.extract_tb(error.__traceback__) if is_own_file(frame.filename)]
+    return format_line(own[-1].filename, own[-1].lineno) if own else "unknown line"
@@ -0,0 +1,197 @@
+"""Parallel map-reduce over independent records.
+
+Days that solve a list of independent records (equations, machines, designs) can spread
+the records over worker processes. Read-only context that every record needs, such as the
+available towels, is pickled once into shared memory and loaded once per worker, instead
+of being pickled again for every task.
+"""
+
+import contextlib
+import functools
+import math
+import operator
+import pickle
+import sys
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import batched, chain, islice
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+from aoc import budget, counters
+from aoc.cpu import cpu_budget, set_cpu_budget, worker_share
+from aoc.discovery import load_module
+
+MIN_RECORDS = 256
+CHUNKS_PER_WORKER = 4
+
+# Limit set by limit_workers for calls that do not pass `workers`
+_max_workers: int | None = None
+
+# State of a worker process, set once by _initialize_worker
+_function: Callable | None = None
+_context: Any = None
+_reduce: Callable | None = None
+_counting = False
+
+
+def map_reduce(
+    function: Callable,
+    records: Iterable,
+    context: Any = None,  # noqa: ANN401
+    reduce: Callable[[Any, Any], Any] = operator.add,
+    initial: Any = 0,  # noqa: ANN401
+    workers: int | None = None,
+    min_records: int = MIN_RECORDS,
+) -> Any:  # noqa: ANN401
+    """Apply `function` to every record and combine the results with `reduce`.
+
+    The function is called as `function(record, context)`, or `function(record)` when there is
+    no context. With fewer than `min_records` records or a single worker, the records are
+    processed in this process, as starting workers costs more than it saves on small inputs.
+    Otherwise the records are split into chunks, every worker reduces its chunks and the
+    partial results are reduced again in order. A sequence is split into a few chunks per
+    worker. A stream is split into chunks of `min_records` records, and only a few chunks
+    per worker are read ahead, so a stream of records is processed in constant memory.
+
+    The function and `reduce` need to be defined at the top level of a module (or be a method of
+    a top-level class), so the workers can look them up by name. Without `workers`, the
+    number of workers is given by `default_workers`.
+
+    Processed records are counted with `budget.advance`. When counting, the counts of the
+    workers are added to the counts of the caller. The workers inherit the deadline of
+    the active time budget, so they are cancelled at the same time as the caller, and an
+    equal share of its CPU budget for the solvers they run.
+    """
+    workers = workers or default_workers()
+    if isinstance(records, Sequence):
+        large = len(records) >= min_records
+        chunk_size = math.ceil(len(records) / (workers * CHUNKS_PER_WORKER))
+    else:
+        records = iter(records)
+        head = list(islice(records, min_records))
+        large = len(head) == min_records
+        chunk_size = min_records
+        records = chain(head, records)
+
+    if workers == 1 or not large:
+        results = (_counted(function(record) if context is None else function(record, context)) for record in records)
+        return functools.reduce(reduce, results, initial)
+
+    data = pickle.dumps(context, protocol=pickle.HIGHEST_PROTOCOL)
+    shared = SharedMemory(create=True, size=max(len(data), 1))
+    try:
+        shared.buf[: len(data)] = data
+        initargs = (
+            describe(function),
+            describe(reduce),
+            shared.name,
+            len(data),
+            budget.deadline(),
+            worker_share(workers),
+            counters.enabled(),
+        )
+        with ProcessPoolExecutor(max_workers=workers, initializer=_initialize_worker, initargs=initargs) as executor:
+            partials = _submit_bounded(executor, batched(records, chunk_size), workers * CHUNKS_PER_WORKER)
+            return functools.reduce(reduce, partials, initial)
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+def default_workers() -> int:
+    """Number of workers when a call does not pass `workers`.
+
+    This is the limit of `limit_workers` when it is active, otherwise one worker per core
+    of the CPU budget. A day that runs in the pool of `aoc run` only has its share of the
+    cores, so with as many days as cores its records are processed serially.
+    """
+    if _max_workers is not None:
+        return _max_workers
+    return cpu_budget()
+
+
+@contextlib.contextmanager
+def limit_workers(workers: int) -> Iterator[None]:
+    """Use at most `workers` workers in calls that do not pass `workers`, e.g. 1 while timing a day."""
+    global _max_workers
+    previous, _max_workers = _max_workers, workers
+    try:
+        yield
+    finally:
+        _max_workers = previous
+
+
+def _submit_bounded(executor: ProcessPoolExecutor, chunks: Iterator[tuple], limit: int) -> Iterator[Any]:
+    """Reduce the chunks in the workers, with at most `limit` chunks in flight, yielding the results in order."""
+    pending: deque[tuple[int, Future]] = deque()
+    for chunk in chunks:
+        pending.append((len(chunk), executor.submit(_reduce_chunk, chunk)))
+        if len(pending) >= limit:
+            yield _chunk_result(*pending.popleft())
+    while pending:
+        yield _chunk_result(*pending.popleft())
+
+
+def _chunk_result(records: int, future: Future) -> Any:  # noqa: ANN401
+    result, counts = future.result()
+    budget.advance(records)
+    counters.add(counts)
+    return result
+
+
+def _counted(result: Any) -> Any:  # noqa: ANN401
+    budget.advance()
+    return result
+
+
+def describe(function: Callable) -> tuple[str, str | None, str]:
+    """Module name, module file and qualified name of a function, to look it up in a worker."""
+    module = sys.modules.get(function.__module__)
+    return function.__module__, getattr(module, "__file__", None), function.__qualname__
+
+
+def resolve(module_name: str, module_file: str | None, qualname: str) -> Callable:
+    """Look up a function described by `describe`, importing its module when needed.
+
+    Solutions are imported from their file under a generated module name, so a worker that
+    did not inherit the module imports it again from the same file.
+    """
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = load_module(Path(module_file), module_name)
+    return functools.reduce(getattr, qualname.split("."), module)
+
+
+def _initialize_worker(
+    function: tuple[str, str | None, str],
+    reduce: tuple[str, str | None, str],
+    shared_name: str,
+    size: int,
+    deadline: float | None,
+    cpus: int,
+    counting: bool,
+) -> None:
+    budget.set_deadline(deadline)
+    set_cpu_budget(cpus)
+    shared = SharedMemory(name=shared_name, track=False)
+    try:
+        context = pickle.loads(bytes(shared.buf[:size]))
+    finally:
+        shared.close()
+    global _function, _context, _reduce, _counting
+    _function, _context, _reduce, _counting = resolve(*function), context, resolve(*reduce), counting
+
+
+def _apply(record: Any) -> Any:  # noqa: ANN401
+    return _function(record) if _context is None else _function(record, _context)
+
+
+def _reduce_chunk(chunk: Sequence) -> tuple[Any, Counter[str] | None]:
+    """Reduce a chunk in a worker, returning the result and the counts of the chunk when counting."""
+    # The timer only runs during a task, an idle worker must not be interrupted
+    budget.check()
+    with budget.time_budget(None), counters.counting(_counting) as counts:
+        result = functools.reduce(_reduce, map(_apply, chunk))
+    return result, counts
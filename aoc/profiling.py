@@ -0,0 +1,168 @@
+"""Profiling of a single day, used by the --profile and --memory flags of the day CLIs.
+
+The largest allocation sites of a phase are those at its peak: a watcher thread takes a
+tracemalloc snapshot whenever the traced memory reaches a new high. Every allocation is
+attributed to the innermost line of the repository in its traceback, so memory allocated
+inside NumPy or pathlib shows up at the line of the solution that asked for it.
+"""
+
+import cProfile
+import io
+import linecache
+import pstats
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+import click
+
+from aoc.discovery import ROOT
+
+# Frames per allocation, so an allocation inside a library is attributed to the line of the solution
+TRACE_FRAMES = 16
+WATCH_INTERVAL = 0.01
+# A new snapshot is taken once the traced memory grew by this factor since the last one
+SNAPSHOT_GROWTH = 1.1
+# The modules that measure memory, their own allocations are not attributed to them
+MEASURING_FILES = frozenset({__file__, str(Path(__file__).with_name("memory.py"))})
+
+
+@dataclass
+class AllocationSite:
+    """Memory allocated by a line of the repository during a phase and still alive at its peak."""
+
+    line: str
+    size: int
+    blocks: int
+
+
+@dataclass
+class MemoryReport:
+    """Peak memory and largest allocation sites of a single phase."""
+
+    phase: str
+    peak: int
+    top_allocations: list[AllocationSite] = field(default_factory=list)
+
+
+class Profiler:
+    """Profiles the phases of a day with cProfile and/or tracemalloc.
+
+    Wrap every phase in `phase()` and call `report()` at the end. When neither
+    profiling nor memory tracing is enabled, the phases run without any overhead.
+    """
+
+    def __init__(self, profile: bool = False, memory: bool = False, top: int = 15) -> None:
+        self.profile = cProfile.Profile() if profile else None
+        self.memory = memory
+        self.top = top
+        self.memory_reports: list[MemoryReport] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Profile the code in the with block as the phase with the given name."""
+        watcher = None
+        if self.memory:
+            tracemalloc.start(TRACE_FRAMES)
+            watcher = PeakSnapshots()
+        if self.profile:
+            self.profile.enable()
+        try:
+            yield
+        finally:
+            if self.profile:
+                self.profile.disable()
+            if watcher is not None:
+                _, peak = tracemalloc.get_traced_memory()
+                sites = watcher.stop()
+                tracemalloc.stop()
+                self.memory_reports.append(MemoryReport(name, peak, sites[: self.top]))
+
+    def report(self) -> None:
+        """Print the hot functions over all phases and the memory usage per phase."""
+        if self.profile:
+            stream = io.StringIO()
+            stats = pstats.Stats(self.profile, stream=stream)
+            stats.sort_stats(pstats.SortKey.TIME).print_stats(self.top)
+            click.echo(stream.getvalue())
+
+        for report in self.memory_reports:
+            click.echo(f"{report.phase}: peak {format_bytes(report.peak)}")
+            for site in report.top_allocations:
+                click.echo(f"  {format_bytes(site.size):>10}  {site.blocks:>8} blocks  {site.line}")
+
+
+class PeakSnapshots:
+    """Takes tracemalloc snapshots in a watcher thread, keeping the one at the highest traced memory.
+
+    Started after `tracemalloc.start`. `stop` returns the allocation sites of the repository
+    that grew between the start and the peak, largest first.
+    """
+
+    def __init__(self) -> None:
+        self.start = tracemalloc.take_snapshot()
+        self.peak, self.peak_traced = self.start, tracemalloc.get_traced_memory()[0]
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._watch, daemon=True)
+        self.thread.start()
+
+    def _watch(self) -> None:
+        while not self.stopped.wait(WATCH_INTERVAL):
+            self._snapshot_if_higher()
+
+    def _snapshot_if_higher(self) -> None:
+        if (traced := tracemalloc.get_traced_memory()[0]) > self.peak_traced * SNAPSHOT_GROWTH:
+            self.peak, self.peak_traced = tracemalloc.take_snapshot(), traced
+
+    def stop(self) -> list[AllocationSite]:
+        """Stop watching and return the sites that allocated the memory of the peak."""
+        self.stopped.set()
+        self.thread.join()
+        # A phase that peaks at its end, or is shorter than the interval, has its peak now
+        self._snapshot_if_higher()
+        start_sizes, _ = allocation_sites(self.start)
+        sizes, blocks = allocation_sites(self.peak)
+        sizes.subtract(start_sizes)
+        return [AllocationSite(line, size, blocks[line]) for line, size in sizes.most_common() if size > 0]
+
+
+def allocation_sites(snapshot: tracemalloc.Snapshot) -> tuple[Counter[str], Counter[str]]:
+    """Bytes and blocks per line of the repository, for the allocations with a line of the repository."""
+    # Allocations of the watcher itself, such as its thread, are not part of the phase
+    excluded = [tracemalloc.Filter(False, filename, all_frames=True) for filename in MEASURING_FILES]
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(True, f"{ROOT}/*", all_frames=True), *excluded])
+    sizes, blocks = Counter(), Counter()
+    for statistic in snapshot.statistics("traceback"):
+        # Frames are ordered from the oldest call, the innermost line of the repository is the site
+        frame = next((frame for frame in reversed(statistic.traceback) if is_own_file(frame.filename)), None)
+        if frame is None:
+            continue
+        line = format_line(frame.filename, frame.lineno)
+        sizes[line] += statistic.size
+        blocks[line] += statistic.count
+    return sizes, blocks
+
+
+def is_own_file(filename: str) -> bool:
+    """Whether a file is part of the repository, not counting the modules that measure memory."""
+    return Path(filename).is_relative_to(ROOT) and filename not in MEASURING_FILES
+
+
+def format_line(filename: str, lineno: int) -> str:
+    """A line of a file relative to the repository, with its source."""
+    path = Path(filename)
+    name = path.relative_to(ROOT) if path.is_relative_to(ROOT) else path
+    return f"{name}:{lineno} ({linecache.getline(filename, lineno).strip()})"
+
+
+def format_bytes(size: float) -> str:
+    """Format a number of bytes using a readable unit."""
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
@@ -0,0 +1,104 @@
+"""Streaming readers for record-oriented inputs.
+
+The readers yield one parsed record at a time, so a solution written as a generator
+pipeline processes an input in constant memory, however large the file is. Days with
+such a reader expose it as `stream_input(file_path)`, next to `read_input(file_path)`
+which materializes the records so that both parts can iterate over them.
+
+Inputs that are one large block of characters, such as a grid or a disk map, are
+memory-mapped instead: `map_file` and `map_grid` give NumPy views over the mapping, so
+loading takes constant time and no copy of the file is made until a solution makes one.
+"""
+
+import mmap
+import os
+from pathlib import Path
+from typing import Callable, Iterator, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+WHITESPACE = frozenset(b" \t\r\n")
+LINE_ENDINGS = frozenset(b"\r\n")
+NEWLINE = ord("\n")
+CARRIAGE_RETURN = ord("\r")
+
+
+def read_lines(file_path: Path) -> Iterator[str]:
+    """Yield the lines of a file without the line endings, reading one line at a time."""
+    with open(file_path) as f:
+        for line in f:
+            yield line.rstrip("\r\n")
+
+
+def read_records(file_path: Path, parse: Callable[[str], T], skip_empty: bool = True) -> Iterator[T]:
+    """Yield every line of a file parsed to a record, skipping empty lines unless `skip_empty` is False."""
+    for line in read_lines(file_path):
+        if line or not skip_empty:
+            yield parse(line)
+
+
+def map_file(file_path: Path) -> np.ndarray:
+    """Read-only uint8 view of the bytes of a file, memory-mapped instead of read.
+
+    Mapping takes constant time, pages are only read from disk when they are accessed and
+    the page cache is shared instead of copied. Slices of the view are views as well.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return np.zeros(0, dtype=np.uint8)
+        # The mapping stays open as long as an array refers to it
+        return np.frombuffer(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), dtype=np.uint8)
+
+
+def is_mapped(value: object) -> bool:
+    """Whether a value is an array that views a memory-mapped file, such as the arrays of `map_file`."""
+    # Views, memoryviews and the strided views of map_grid refer to the array they view through `base` or `obj`
+    base = value
+    while base is not None and not isinstance(base, mmap.mmap):
+        base = base.obj if isinstance(base, memoryview) else getattr(base, "base", None)
+    return base is not None
+
+
+def strip_view(data: np.ndarray) -> np.ndarray:
+    """View without the leading and trailing whitespace, the equivalent of `bytes.strip`."""
+    start, end = 0, len(data)
+    while start < end and data[start] in WHITESPACE:
+        start += 1
+    while end > start and data[end - 1] in WHITESPACE:
+        end -= 1
+    return data[start:end]
+
+
+def map_grid(file_path: Path) -> np.ndarray:
+    """Read-only 2D uint8 view of a file of lines of equal length, without copying.
+
+    Every row is a view of a line without its line ending, so the rows are a fixed stride
+    apart in the mapping. Trailing line endings are ignored.
+
+    Raises:
+        ValueError: If the lines are not all of the same length, e.g. due to empty lines.
+
+    """
+    data = map_file(file_path)
+    end = len(data)
+    while end and data[end - 1] in LINE_ENDINGS:
+        end -= 1
+    if end == 0:
+        raise ValueError("Grid needs at least one line")
+
+    newlines = np.flatnonzero(data[:end] == NEWLINE)
+    if newlines.size == 0:
+        return data[:end].reshape(1, end)
+    # Lines of equal length put every line ending at the same offset in rows of `stride` bytes
+    stride = int(newlines[0]) + 1
+    cols = stride - 2 if stride > 1 and data[stride - 2] == CARRIAGE_RETURN else stride - 1
+    rows = newlines.size + 1
+    if (
+        cols == 0
+        or rows * stride - (stride - cols) != end
+        or (np.diff(newlines) != stride).any()
+        or (data[cols:end:stride] != data[cols]).any()
+    ):
+        raise ValueError("All lines of a grid need to have the same length")
+    return np.lib.stride_tricks.as_strided(data, shape=(rows, cols), strides=(stride, 1), writeable=False)
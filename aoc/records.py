@@ -0,0 +1,255 @@
+"""Compact storage of parsed records.
+
+Parsed records are slotted dataclasses, which saves the `__dict__` of every instance. For
+millions of records, `Table` goes further and stores every field of a dataclass as a
+column: numbers in a NumPy array, fixed-length tuples of numbers in a 2D array and
+variable-length lists of numbers as one flat array with offsets. Indexing a table builds
+a copy of the record, so a solution can switch between a list of records and a table.
+`Table.row` gives a view that reads the fields from the columns instead, and solutions that
+work on whole columns, such as 2024 day 14, don't build records at all.
+"""
+
+import copy
+import dataclasses
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Iterator, Sequence, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class Column:
+    """Values of a single field, see `Table` for the layouts."""
+
+    kind: str  # "scalar", "fixed", "ragged" or "object"
+    values: np.ndarray
+    offsets: np.ndarray | None = None
+    container: type = tuple
+
+    @classmethod
+    def from_values(cls, values: list) -> "Column":
+        """Store the values of a field in the most compact layout that fits all of them."""
+        first = values[0]
+        if isinstance(first, (bool, int, float, str)):
+            try:
+                return cls("scalar", _compact(np.array(values)))
+            except OverflowError:
+                return cls("object", _object_array(values))
+
+        if isinstance(first, (list, tuple)) and all(isinstance(v, (bool, int, float)) for v in _flatten(values)):
+            container = type(first)
+            lengths = np.array([len(v) for v in values], dtype=np.int64)
+            try:
+                flat = np.array(_flatten(values))
+            except OverflowError:
+                return cls("object", _object_array(values))
+            if flat.dtype == object:
+                return cls("object", _object_array(values))
+            flat = _compact(flat)
+            if (lengths == lengths[0]).all():
+                return cls("fixed", flat.reshape(len(values), int(lengths[0])), container=container)
+            offsets = np.zeros(len(values) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=offsets[1:])
+            return cls("ragged", flat, offsets, container=container)
+
+        return cls("object", _object_array(values))
+
+    def __getitem__(self, index: int) -> Any:  # noqa: ANN401
+        if self.kind == "scalar":
+            return self.values.item(index)
+        if self.kind == "fixed":
+            return self.container(self.values[index].tolist())
+        if self.kind == "ragged":
+            return self.container(self.values[self.offsets[index] : self.offsets[index + 1]].tolist())
+        return copy.deepcopy(self.values[index])
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes taken by the arrays of the column, not counting the objects of an object column."""
+        return self.values.nbytes + (0 if self.offsets is None else self.offsets.nbytes)
+
+
+class Table(Generic[T]):
+    """Records of a dataclass stored column by column.
+
+    Numbers are stored in NumPy arrays of the smallest common dtype, fixed-length tuples
+    and lists of numbers in 2D arrays and variable-length lists of numbers as a flat array
+    with offsets. Fields that fit none of these, such as nested lists, are kept as objects.
+    """
+
+    def __init__(self, record_type: type[T], columns: dict[str, Column], length: int) -> None:
+        self.record_type = record_type
+        self.columns = columns
+        self.length = length
+
+    @classmethod
+    def from_records(cls, records: Sequence[T]) -> "Table[T]":
+        """Create a table from a non-empty sequence of dataclass instances of the same type."""
+        if not records:
+            raise ValueError("A table needs at least one record")
+        record_type = type(records[0])
+        columns = {
+            f.name: Column.from_values([getattr(record, f.name) for record in records])
+            for f in dataclasses.fields(record_type)
+        }
+        return cls(record_type, columns, len(records))
+
+    @classmethod
+    def from_arrays(cls, record_type: type[T], arrays: dict[str, np.ndarray]) -> "Table[T]":
+        """Create a table from an array per field, without building the records.
+
+        A 1D array is a field of numbers, a 2D array a field of fixed-length tuples. The
+        arrays are stored as given, so they keep their dtype for arithmetic on the columns.
+        """
+        if {f.name for f in dataclasses.fields(record_type)} != arrays.keys():
+            raise ValueError(f"Expected an array for every field of {record_type.__name__}")
+        lengths = {len(array) for array in arrays.values()}
+        if len(lengths) != 1:
+            raise ValueError("The arrays of a table must have the same length")
+        columns = {name: Column("scalar" if array.ndim == 1 else "fixed", array) for name, array in arrays.items()}
+        return cls(record_type, columns, lengths.pop())
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: int) -> T:
+        """Copy of the record at `index`, changing it does not change the table."""
+        index = self._check_index(index)
+        record = object.__new__(self.record_type)
+        # Set the fields directly, as __init__ and __post_init__ could compute fields again
+        for name, column in self.columns.items():
+            object.__setattr__(record, name, column[index])
+        return record
+
+    def __iter__(self) -> Iterator[T]:
+        return (self[i] for i in range(self.length))
+
+    def row(self, index: int) -> "Row":
+        """View of the record at `index`, which reads a field from its column when it is accessed."""
+        return Row(self, self._check_index(index))
+
+    def rows(self) -> Iterator["Row"]:
+        """Views of all records, in order."""
+        return (Row(self, i) for i in range(self.length))
+
+    def _check_index(self, index: int) -> int:
+        if not -self.length <= index < self.length:
+            raise IndexError("Table index out of range")
+        return index % self.length
+
+    def column(self, name: str) -> np.ndarray:
+        """Array with the values of a field, the flat values for a variable-length field."""
+        return self.columns[name].values
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes taken by the arrays of all columns."""
+        return sum(column.nbytes for column in self.columns.values())
+
+
+class Row:
+    """Read-only view of a record of a `Table`.
+
+    Only the table and the index are stored, a field is read from its column on every
+    access. The methods of the record are not available, use indexing for a full record.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: Table, index: int) -> None:
+        self._table = table
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        try:
+            column = self._table.columns[name]
+        except KeyError:
+            raise AttributeError(f"{self._table.record_type.__name__} has no field {name!r}") from None
+        return column[self._index]
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={column[self._index]!r}" for name, column in self._table.columns.items())
+        return f"{self._table.record_type.__name__}({fields})"
+
+
+def _compact(array: np.ndarray) -> np.ndarray:
+    """Array of integers converted to the smallest integer dtype that holds all values."""
+    if array.dtype.kind not in "iu" or array.size == 0:
+        return array
+    dtype = np.promote_types(np.min_scalar_type(array.min()), np.min_scalar_type(array.max()))
+    return array.astype(dtype)
+
+
+def _flatten(values: list) -> list:
+    return [item for value in values for item in value]
+
+
+def _object_array(values: list) -> np.ndarray:
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def find_records(puzzle_input: Any) -> dict[str, list]:  # noqa: ANN401
+    """Lists of dataclass instances in a parsed input, either the input itself or one of its items.
+
+    A table is turned back into a list of records, so its records can be measured as well.
+    """
+    nested = isinstance(puzzle_input, (tuple, list)) and puzzle_input and isinstance(puzzle_input[0], list)
+    candidates = puzzle_input if nested else (puzzle_input,)
+    candidates = [list(candidate) if isinstance(candidate, Table) else candidate for candidate in candidates]
+    return {
+        type(candidate[0]).__name__: candidate
+        for candidate in candidates
+        if isinstance(candidate, list) and candidate and dataclasses.is_dataclass(candidate[0])
+    }
+
+
+def unslotted(record_type: type) -> type:
+    """Regular dataclass with the same fields as a (slotted) dataclass, to compare the memory usage."""
+    return dataclasses.make_dataclass(record_type.__name__, [f.name for f in dataclasses.fields(record_type)])
+
+
+def measure_bytes(factory: Callable[[], Any]) -> int:
+    """Bytes allocated by `factory()` that are still alive while the result is kept."""
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = factory()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    del result
+    return after - before
+
+
+def bytes_per_record(records: list) -> dict[str, float]:
+    """Bytes per record as regular dataclasses, as slotted dataclasses and as a table.
+
+    Every layout is measured on a deep copy of the records, so the fields are counted too.
+    """
+    record_type = type(records[0])
+    regular_type = unslotted(record_type)
+    field_names = [f.name for f in dataclasses.fields(record_type)]
+
+    def copy_records(copy_type: type) -> list:
+        records_copy = []
+        for record in records:
+            copied = object.__new__(copy_type)
+            for name in field_names:
+                object.__setattr__(copied, name, copy.deepcopy(getattr(record, name)))
+            records_copy.append(copied)
+        return records_copy
+
+    layouts = {
+        "dict": lambda: copy_records(regular_type),
+        "slots": lambda: copy_records(record_type),
+        "table": lambda: Table.from_records(copy_records(record_type)),
+    }
+    return {layout: measure_bytes(factory) / len(records) for layout, factory in layouts.items()}
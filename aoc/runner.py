@@ -0,0 +1,347 @@
+import functools
+import glob
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterator
+
+from aoc import budget, counters
+from aoc.cache import cached_read_input
+from aoc.counters import format_counts
+from aoc.cpu import pool_size, set_cpu_budget, worker_share
+from aoc.discovery import Day
+from aoc.memory import MemoryLimitExceeded, measure_memory, memory_limit
+from aoc.profiling import format_bytes
+from aoc.store import load_result, result_key, save_result
+
+PARTS = ("part_1", "part_2")
+
+
+def part_solver(module: ModuleType, part: str, test: bool = False) -> Callable | None:
+    """The function that solves a part of a day module, None when the day does not implement it.
+
+    Parts whose parameters differ between the example and a real input, such as the number of
+    connections in 2025 day 8, default to the example. A day lists the keyword arguments for a
+    real input per part in `PART_ARGUMENTS`, which are passed unless `test` is set.
+    """
+    solve = getattr(module, part, None)
+    arguments = None if test else getattr(module, "PART_ARGUMENTS", {}).get(part)
+    return functools.partial(solve, **arguments) if solve is not None and arguments else solve
+
+
+@dataclass
+class PhaseResult:
+    """Result of a single phase: parsing the input or solving one part."""
+
+    phase: str
+    seconds: float
+    answer: Any = None
+    peak_rss: int | None = None
+    peak_traced: int | None = None
+    cpu_seconds: float | None = None
+    # Operations counted with aoc.counters, None when not counting
+    counts: dict[str, int] | None = None
+    # Whether the phase was served from memory, such as an input the daemon kept parsed
+    cached: bool = False
+
+
+@dataclass
+class DayResult:
+    """Results of all phases of a single day."""
+
+    day: Day
+    phases: list[PhaseResult] = field(default_factory=list)
+    error: str | None = None
+    skipped: str | None = None
+    input_path: Path | None = None
+    stored: bool = False
+    # Why the time budget or memory ceiling stopped the day
+    aborted: str | None = None
+
+    @property
+    def seconds(self) -> float:
+        """Total wall time of the day."""
+        return sum(phase.seconds for phase in self.phases)
+
+
+def run_day(
+    day: Day,
+    input_path: Path | None = None,
+    test: bool = False,
+    cache: bool = False,
+    stream: bool = False,
+    store: bool = False,
+    day_budget: float | None = None,
+    part_budget: float | None = None,
+    memory: bool = False,
+    max_memory: int | None = None,
+    counts: bool = False,
+) -> DayResult:
+    """Parse the input of a day and solve all parts that the day implements.
+
+    Every solution exposes `read_input(file_path)` and `part_1(puzzle_input)`,
+    most of them also a `part_2(puzzle_input)`. With `cache`, the parsed input is
+    loaded from the parse cache when neither the input nor the solution changed.
+
+    With `stream`, days that expose `stream_input(file_path)` are solved from a fresh
+    stream of records per part instead of a parsed input, so the input is never held
+    in memory as a whole. Parsing is then part of the time of each part.
+
+    With `store`, the answers and timings of an earlier run are returned when neither the
+    input nor the source of the day changed, and new results are stored.
+
+    A phase that runs past `day_budget` seconds for the whole day or `part_budget` seconds
+    for a single part is cancelled. The result then reports the phase, its time and the
+    number of records processed, next to the phases that did finish.
+
+    The peak RSS of every phase is measured, with `memory` also the tracemalloc peak. A phase
+    that uses more than `max_memory` bytes is aborted with the line that allocated the most.
+
+    With `counts`, the operations that the solution counts with `aoc.counters` are reported
+    per phase. Stored results are not used when measuring memory or counting operations.
+    """
+    store = store and not memory and not counts
+    input_path = input_path or day.input_path(test)
+    result = DayResult(day=day, input_path=input_path)
+    if not input_path.exists():
+        result.skipped = f"no input found at {input_path}"
+        return result
+
+    try:
+        module = day.load()
+
+        if store:
+            key = result_key(module, input_path, stream)
+            if (phases := load_result(key)) is not None:
+                result.phases, result.stored = phases, True
+                return result
+
+        streaming = stream and hasattr(module, "stream_input")
+        budget.reset_progress()
+
+        run_phase = functools.partial(_run_phase, result, memory=memory, max_memory=max_memory, counts=counts)
+        with budget.time_budget(day_budget):
+            if not streaming:
+                read_input = functools.partial(cached_read_input, module.read_input) if cache else module.read_input
+                puzzle_input = run_phase("parse", read_input, input_path, answer=False)
+
+            for part in PARTS:
+                solve = part_solver(module, part, test)
+                if solve is not None:
+                    part_input = module.stream_input(input_path) if streaming else puzzle_input
+                    run_phase(part, solve, part_input, seconds=part_budget)
+
+        if store:
+            save_result(key, result.phases)
+    except (budget.BudgetExceeded, MemoryLimitExceeded) as e:
+        result.aborted = str(e)
+    except Exception:
+        result.error = traceback.format_exc()
+
+    return result
+
+
+def _run_phase(
+    result: DayResult,
+    phase: str,
+    function: Callable,
+    argument: Any,  # noqa: ANN401
+    seconds: float | None = None,
+    answer: bool = True,
+    memory: bool = False,
+    max_memory: int | None = None,
+    counts: bool = False,
+) -> Any:  # noqa: ANN401
+    """Time `function(argument)` as a phase of the result, within a time budget and a memory ceiling.
+
+    An error caused by the time budget is raised again as BudgetExceeded that tells how far
+    the phase got, and MemoryLimitExceeded is raised again with the name of the phase.
+    """
+    start, cpu_start = time.perf_counter(), cpu_time()
+    try:
+        with (
+            budget.time_budget(seconds),
+            memory_limit(max_memory),
+            measure_memory(trace=memory) as usage,
+            counters.counting(counts) as counted,
+        ):
+            value = function(argument)
+    except MemoryLimitExceeded as e:
+        raise MemoryLimitExceeded(f"{phase}: {e}") from e
+    except Exception as e:
+        if not budget.exceeded(e):
+            raise
+        elapsed = format_seconds(time.perf_counter() - start).strip()
+        raise budget.BudgetExceeded(
+            f"{phase} cancelled after {elapsed}, {budget.reset_progress()} record(s) processed"
+        ) from e
+    seconds, cpu_seconds = time.perf_counter() - start, cpu_time() - cpu_start
+    result.phases.append(
+        PhaseResult(
+            phase,
+            seconds,
+            value if answer else None,
+            usage.peak_rss,
+            usage.peak_traced,
+            cpu_seconds,
+            None if counted is None else dict(counted),
+        )
+    )
+    return value
+
+
+def cpu_time() -> float:
+    """CPU time of this process and its finished child processes, such as the workers of `map_reduce`."""
+    user, system, children_user, children_system, _ = os.times()
+    return user + system + children_user + children_system
+
+
+def run_days(
+    days: list[Day],
+    workers: int | None = None,
+    test: bool = False,
+    cache: bool = False,
+    stream: bool = False,
+    store: bool = False,
+    day_budget: float | None = None,
+    part_budget: float | None = None,
+    memory: bool = False,
+    max_memory: int | None = None,
+    counts: bool = False,
+) -> Iterator[DayResult]:
+    """Run the given days in a process pool, yielding the results in order. See `run_day` for the options.
+
+    Without `workers`, there is a worker per core of the CPU budget. The budget is divided
+    between the workers, so a day's `map_reduce` and solvers only use the cores of its share.
+    """
+    workers = pool_size(workers, len(days))
+    run = functools.partial(
+        run_day,
+        test=test,
+        cache=cache,
+        stream=stream,
+        store=store,
+        day_budget=day_budget,
+        part_budget=part_budget,
+        memory=memory,
+        max_memory=max_memory,
+        counts=counts,
+    )
+    if workers == 1:
+        yield from map(run, days)
+        return
+
+    with _pool(workers) as executor:
+        yield from executor.map(run, days)
+
+
+def resolve_inputs(patterns: tuple[str, ...]) -> list[Path]:
+    """Expand files, directories (all files directly in them) and glob patterns to a sorted list of inputs."""
+    paths = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            paths.update(child for child in path.iterdir() if child.is_file())
+        elif path.is_file():
+            paths.add(path)
+        else:
+            paths.update(Path(match) for match in glob.glob(pattern, recursive=True) if Path(match).is_file())
+    return sorted(paths)
+
+
+def run_batch(
+    day: Day,
+    input_paths: list[Path],
+    workers: int = 1,
+    cache: bool = False,
+    day_budget: float | None = None,
+    part_budget: float | None = None,
+    memory: bool = False,
+    max_memory: int | None = None,
+) -> Iterator[DayResult]:
+    """Solve a single day on many inputs, yielding the results in order.
+
+    The solution is imported once per process, so with a single worker all inputs are
+    solved in this process and only the first input pays for the import.
+    """
+    run = functools.partial(
+        run_day,
+        day,
+        cache=cache,
+        day_budget=day_budget,
+        part_budget=part_budget,
+        memory=memory,
+        max_memory=max_memory,
+    )
+    workers = pool_size(workers, len(input_paths))
+    if workers == 1:
+        yield from map(run, input_paths)
+        return
+
+    with _pool(workers) as executor:
+        yield from executor.map(run, input_paths)
+
+
+def _pool(workers: int) -> ProcessPoolExecutor:
+    """A pool of day workers, each with an equal share of the CPU budget for `map_reduce` and solvers."""
+    return ProcessPoolExecutor(max_workers=workers, initializer=set_cpu_budget, initargs=(worker_share(workers),))
+
+
+def format_seconds(seconds: float) -> str:
+    """Format a duration using a readable unit."""
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:8.1f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:8.1f} ms"
+    return f"{seconds:8.2f} s "
+
+
+def format_result(result: DayResult) -> str:
+    """Format the results of a day as a small table."""
+    status = "(stored)" if result.stored else ""
+    lines = [f"{result.day.name:<12} {status:<24} {format_seconds(result.seconds)}"]
+    for phase in result.phases:
+        answer = "" if phase.answer is None else str(phase.answer)
+        line = f"  {phase.phase:<10} {answer:<24} {format_seconds(phase.seconds)}"
+        if phase.peak_traced is not None:
+            line += f"  rss {format_bytes(phase.peak_rss):>10}  traced {format_bytes(phase.peak_traced):>10}"
+        if phase.counts:
+            line += f"  {format_counts(phase.counts)}"
+        if phase.cached:
+            line += "  (cached)"
+        lines.append(line)
+    if result.skipped:
+        lines.append(f"  skipped: {result.skipped}")
+    if result.aborted:
+        lines.append(f"  aborted: {result.aborted}")
+    if result.error:
+        lines.append(f"  error: {result.error.strip()}")
+    return "\n".join(lines)
+
+
+def format_batch_row(result: DayResult, width: int = 32) -> str:
+    """Format the results of a day on one input as a row of a table, see `format_batch_header`."""
+    name = result.input_path.name if result.input_path else ""
+    row = f"{name[-width:]:<{width}}"
+    if result.skipped or result.error or result.aborted:
+        reason = result.skipped or result.aborted or result.error.strip().splitlines()[-1]
+        return f"{row} {reason}"
+
+    for phase in result.phases:
+        if phase.answer is None:
+            row += f" {format_seconds(phase.seconds)}"
+        else:
+            row += f" {str(phase.answer)[:20]:>20} {format_seconds(phase.seconds)}"
+    return f"{row} {format_seconds(result.seconds)}"
+
+
+def format_batch_header(parts: list[str], width: int = 32) -> str:
+    """Header of the table of `format_batch_row`."""
+    header = f"{'input':<{width}} {'parse':>11}"
+    for part in parts:
+        header += f" {part:>20} {'':>11}"
+    return f"{header} {'total':>11}"
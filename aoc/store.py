@@ -0,0 +1,56 @@
+"""Persisted answers and timings of solved days.
+
+A result is keyed by the hash of the input file, the source of the day module and the
+source of the `aoc` modules it uses, so the runner only solves a day again when one of
+them changed. Unlike the parse cache, results are small and never evicted.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from aoc.cache import source_hash
+from aoc.discovery import ROOT
+
+STORE_DIRECTORY = ROOT / ".cache" / "results"
+
+
+def result_key(module: ModuleType, input_path: Path, stream: bool = False) -> str:
+    """Hash of the input file and the source of the day module and the `aoc` modules it uses.
+
+    Streaming changes the timings but not the answers, so it is part of the key as well.
+    """
+    digest = hashlib.sha256()
+    with open(input_path, "rb") as f:
+        digest.update(hashlib.file_digest(f, "sha256").digest())
+    digest.update(source_hash(module))
+    digest.update(b"stream" if stream else b"parse")
+    return digest.hexdigest()
+
+
+def load_result(key: str, directory: Path = STORE_DIRECTORY) -> Any | None:  # noqa: ANN401
+    """The stored result for a key, None if there is none."""
+    try:
+        with open(directory / f"{key}.pickle", "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+
+def save_result(key: str, result: Any, directory: Path = STORE_DIRECTORY) -> bool:  # noqa: ANN401
+    """Store a result, returning False when it cannot be pickled."""
+    try:
+        data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return False
+
+    directory.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first, other processes of the runner may read the same entry
+    with tempfile.NamedTemporaryFile(dir=directory, suffix=".tmp", delete=False) as f:
+        f.write(data)
+    os.replace(f.name, directory / f"{key}.pickle")
+    return True
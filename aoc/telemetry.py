@@ -0,0 +1,92 @@
+"""Structured telemetry of runs, one JSON line per phase.
+
+Every phase of every day that the runner solves is appended to a JSON Lines file with the
+day, the phase, the answer, the wall time, the CPU time, the peak memory and the counted
+operations, so tooling can read the results instead of scraping the printed tables. A day
+that did not finish gets a line with its status and the reason instead.
+"""
+
+import json
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from types import TracebackType
+from typing import Any, TextIO
+
+from aoc.bench import current_commit
+from aoc.discovery import ROOT
+from aoc.runner import DayResult
+
+TELEMETRY_PATH = ROOT / ".benchmarks" / "telemetry.jsonl"
+
+
+def telemetry_records(result: DayResult) -> list[dict[str, Any]]:
+    """One record per finished phase of a day, plus one for the reason the day did not finish."""
+    day = {
+        "day": result.day.name,
+        "year": result.day.year,
+        "input": None if result.input_path is None else str(result.input_path),
+        "stored": result.stored,
+    }
+    records = [
+        {
+            **day,
+            "phase": phase.phase,
+            "status": "ok",
+            "answer": _json_answer(phase.answer),
+            "wall_seconds": phase.seconds,
+            "cpu_seconds": phase.cpu_seconds,
+            "peak_rss": phase.peak_rss,
+            "peak_traced": phase.peak_traced,
+            "counts": phase.counts,
+        }
+        for phase in result.phases
+    ]
+    for status, reason in (("skipped", result.skipped), ("aborted", result.aborted), ("error", result.error)):
+        if reason:
+            records.append({**day, "phase": None, "status": status, "reason": reason.strip().splitlines()[-1]})
+    return records
+
+
+class TelemetryWriter:
+    """Appends the records of day results to a JSON Lines file, with the same run id on every line.
+
+    Every result is flushed at once, so a run that is interrupted keeps the lines of the
+    days that finished. Without a path, nothing is written.
+    """
+
+    def __init__(self, path: Path | None = TELEMETRY_PATH) -> None:
+        self.path = path
+        self.run = {
+            "run_id": uuid.uuid4().hex[:12],
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": current_commit() if path is not None else None,
+        }
+        self.file: TextIO | None = None
+
+    def __enter__(self) -> "TelemetryWriter":
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.file = open(self.path, "a")
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        if self.file is not None:
+            self.file.close()
+
+    def write(self, result: DayResult) -> None:
+        """Append the records of a day result."""
+        if self.file is None:
+            return
+        for record in telemetry_records(result):
+            self.file.write(json.dumps({**self.run, **record}) + "\n")
+        self.file.flush()
+
+
+def _json_answer(answer: Any) -> Any:  # noqa: ANN401
+    """The answer itself when JSON has a type for it, otherwise its text."""
+    if answer is None or isinstance(answer, (bool, int, float, str)):
+        return answer
+    return str(answer)
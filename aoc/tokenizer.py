@@ -0,0 +1,57 @@
+"""Vectorized extraction of the integers in an input.
+
+Many inputs are integers with some decoration around them, such as `Button A: X+94, Y+34`
+or `p=2,4 v=2,-3`. Instead of stripping the decoration with `split`, `lstrip` and
+`replace` per line, `parse_integers` finds every run of digits in the raw bytes at once
+with NumPy and returns the integers as a flat array, which a day reshapes to one row
+per record.
+"""
+
+import re
+from pathlib import Path
+
+import numpy as np
+
+MINUS = ord("-")
+# Integers with more digits could overflow an int64
+MAX_DIGITS = 18
+SIGNED_INTEGER = re.compile(rb"-?\d+")
+UNSIGNED_INTEGER = re.compile(rb"\d+")
+POWERS_OF_TEN = 10 ** np.arange(MAX_DIGITS, dtype=np.int64)
+
+
+def parse_integers(data: bytes | bytearray | memoryview, signed: bool = True) -> np.ndarray:
+    """All integers in a buffer, in order, as an int64 array.
+
+    With `signed`, a `-` directly in front of the digits makes the integer negative. Set it
+    to False for inputs where `-` is a separator, such as the ranges `3-5`. When an integer
+    has more than MAX_DIGITS digits, the integers are returned as an array of Python ints.
+    """
+    chars = np.frombuffer(data, dtype=np.uint8)
+    is_digit = (chars >= ord("0")) & (chars <= ord("9"))
+    edges = np.diff(is_digit.astype(np.int8), prepend=0, append=0)
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    if starts.size == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    lengths = ends - starts
+    if lengths.max() > MAX_DIGITS:
+        pattern = SIGNED_INTEGER if signed else UNSIGNED_INTEGER
+        return np.array([int(token) for token in pattern.findall(data)], dtype=object)
+
+    # Every digit is multiplied by its place value, after which the digits of a run are summed
+    positions = np.flatnonzero(is_digit)
+    place_values = POWERS_OF_TEN[np.repeat(ends, lengths) - positions - 1]
+    digits = (chars[positions] - ord("0")).astype(np.int64)
+    values = np.add.reduceat(digits * place_values, np.cumsum(lengths) - lengths)
+
+    if signed:
+        negative = (starts > 0) & (chars[np.maximum(starts - 1, 0)] == MINUS)
+        values[negative] *= -1
+    return values
+
+
+def read_integers(file_path: Path, signed: bool = True) -> np.ndarray:
+    """All integers in a file, see `parse_integers`."""
+    with open(file_path, "rb") as f:
+        return parse_integers(f.read(), signed=signed)